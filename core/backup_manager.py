@@ -1,61 +1,208 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
+import os
 import shutil
 import json
+import tarfile
+import tempfile
 from datetime import datetime
 
+try:
+    import snappy  # python-snappy: fast framed compression when installed
+except ImportError:
+    snappy = None
+
+# Compressed backups are a single tar stream; snappy when available, else gzip
+ARCHIVE_SUFFIX = ".tar.snappy" if snappy is not None else ".tar.gz"
+_ARCHIVE_SUFFIXES = (".tar.snappy", ".tar.gz")
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """`copytree` copy function that hard-links files, copying on failure.
+
+    Hard links make a backup cost one directory entry per file, but the backup
+    then shares its inodes with the live config: any in-place write (append,
+    truncate) on either side changes both. Only used when a caller passes
+    `hard_link=True` and knows every writer replaces files via `os.replace`.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device targets, FAT volumes, or no link permission
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _copy_tree(src: Path, dst: Path, copy_function=shutil.copy2) -> None:
+    """`shutil.copytree` replacement that copies files in inode order.
+
+    Directories are created during an `os.scandir` walk; files are copied
+    afterwards sorted by inode number, which approximates on-disk order and
+    keeps reads sequential for trees of many small match files. File data is
+    still moved by `copy_function` (`copy2` by default), so this only
+    changes the ordering. Like `copytree(ignore_dangling_symlinks=True)`,
+    broken symlinks are skipped and directory metadata is copied last.
+    """
+    files = []
+    dirs = []
+    stack = [(Path(src), Path(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        dst_dir.mkdir(parents=True)
+        dirs.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append((Path(entry.path), dst_dir / entry.name))
+                elif entry.is_symlink() and not os.path.exists(entry.path):
+                    # Dangling link; don't abort the whole backup over it
+                    continue
+                else:
+                    files.append((entry.inode(), entry.path, str(dst_dir / entry.name)))
+    files.sort()
+    for _, file_src, file_dst in files:
+        copy_function(file_src, file_dst)
+    # Deepest first, so copying files into a directory can't bump its mtime again
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _write_archive(source_dir: Path, dest: Path, meta: Dict[str, Any]) -> None:
+    """Tar `source_dir` (plus backup metadata) into a compressed `dest`."""
+    meta_bytes = json.dumps(meta).encode("utf-8")
+
+    def _fill(tar: tarfile.TarFile) -> None:
+        tar.add(source_dir, arcname=".")
+        info = tarfile.TarInfo("_backup_meta.json")
+        info.size = len(meta_bytes)
+        tar.addfile(info, io.BytesIO(meta_bytes))
+
+    if dest.name.endswith(".tar.snappy"):
+        with tempfile.TemporaryFile() as raw, open(dest, "wb") as out:
+            with tarfile.open(fileobj=raw, mode="w|") as tar:
+                _fill(tar)
+            raw.seek(0)
+            snappy.stream_compress(raw, out)
+    else:
+        # Level 1: backups favour speed over the last few percent of size
+        with tarfile.open(dest, mode="w:gz", compresslevel=1) as tar:
+            _fill(tar)
+
+
+def _extract_archive(archive: Path, target_dir: Path) -> None:
+    """Unpack a backup written by `_write_archive` into `target_dir`."""
+    # The "data" filter rejects absolute paths and links escaping the target
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    if archive.name.endswith(".tar.snappy"):
+        if snappy is None:
+            raise RuntimeError("python-snappy is required to restore .tar.snappy backups")
+        with tempfile.TemporaryFile() as raw, open(archive, "rb") as src:
+            snappy.stream_decompress(src, raw)
+            raw.seek(0)
+            with tarfile.open(fileobj=raw, mode="r|") as tar:
+                tar.extractall(target_dir, **extract_kwargs)
+    else:
+        with tarfile.open(archive, mode="r:gz") as tar:
+            tar.extractall(target_dir, **extract_kwargs)
+
 
 class BackupManager:
     """Simple backup manager for config directories.
 
     Provides manual backup creation, listing and basic restore helpers.
+    Backups are plain directory copies by default (hard links only when
+    `hard_link=True` is passed); `compress=True` writes a single
+    `<name>.tar.snappy` (or `.tar.gz` without python-snappy).
     """
 
     def __init__(self, backup_root: Path) -> None:
         self.backup_root = Path(backup_root)
         self.backup_root.mkdir(parents=True, exist_ok=True)
 
-    def create_manual_backup(self, source_dir: Path, name: str | None = None) -> Dict[str, str]:
+    def create_manual_backup(
+        self,
+        source_dir: Path,
+        name: str | None = None,
+        compress: bool = False,
+        *,
+        hard_link: bool = False,
+    ) -> Dict[str, str]:
         if not source_dir.exists():
             return {"status": "error", "detail": "Source does not exist"}
         timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         backup_name = name or f"config_backup_{timestamp}"
         target = self.backup_root / backup_name
         try:
-            shutil.copytree(source_dir, target)
-            meta = {"version": "1.0", "timestamp": timestamp, "source": str(source_dir)}
+            if compress:
+                target = self.backup_root / f"{backup_name}{ARCHIVE_SUFFIX}"
+                meta = {"version": "1.0", "timestamp": timestamp, "source": str(source_dir), "format": ARCHIVE_SUFFIX}
+                _write_archive(source_dir, target, meta)
+                return {"status": "success", "detail": f"Backup created: {backup_name}", "path": str(target)}
+            _copy_tree(source_dir, target, copy_function=_link_or_copy if hard_link else shutil.copy2)
+            meta = {"version": "1.0", "timestamp": timestamp, "source": str(source_dir), "hard_link": hard_link}
             (target / "_backup_meta.json").write_text(json.dumps(meta), encoding="utf-8")
             return {"status": "success", "detail": f"Backup created: {backup_name}", "path": str(target)}
         except Exception as exc:
             return {"status": "error", "detail": str(exc)}
 
-    def list_backups(self) -> List[Dict[str, str]]:
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """List backup directories and archives newest-name first.
+
+        Uses `os.scandir` so the directory check and mtime come from the
+        readdir batch instead of separate stat calls per backup.
+        """
         items = []
-        for child in sorted(self.backup_root.iterdir(), reverse=True):
-            if not child.is_dir():
+        with os.scandir(self.backup_root) as entries:
+            backups = sorted(
+                (entry for entry in entries if entry.is_dir() or entry.name.endswith(_ARCHIVE_SUFFIXES)),
+                key=lambda entry: entry.name,
+                reverse=True,
+            )
+        for entry in backups:
+            try:
+                created = entry.stat().st_mtime
+            except OSError:
+                created = 0
+            suffix = next((s for s in _ARCHIVE_SUFFIXES if entry.name.endswith(s)), None)
+            if suffix and not entry.is_dir():
+                # Metadata lives inside the archive; don't decompress just to list
+                name = entry.name[: -len(suffix)]
+                items.append({"name": name, "path": entry.path, "meta": {"format": suffix}, "created": created})
                 continue
-            meta_file = child / "_backup_meta.json"
-            meta = {}
             try:
-                if meta_file.exists():
-                    meta = json.loads(meta_file.read_text(encoding="utf-8"))
+                meta = json.loads(Path(entry.path, "_backup_meta.json").read_text(encoding="utf-8"))
             except Exception:
+                # Missing or unreadable metadata (no separate exists() probe)
                 meta = {}
-            items.append({"name": child.name, "path": str(child), "meta": meta})
+            items.append({"name": entry.name, "path": entry.path, "meta": meta, "created": created})
         return items
 
-    def restore_backup(self, backup_name: str, target_dir: Path, overwrite: bool = False) -> Dict[str, str]:
+    def restore_backup(
+        self, backup_name: str, target_dir: Path, overwrite: bool = False, *, hard_link: bool = False
+    ) -> Dict[str, str]:
         src = self.backup_root / backup_name
-        if not src.exists() or not src.is_dir():
-            return {"status": "error", "detail": "Backup not found"}
+        archive = None
+        if not src.is_dir():
+            # Compressed backups are named `<backup_name><suffix>`
+            archive = next(
+                (p for p in (self.backup_root / f"{backup_name}{s}" for s in _ARCHIVE_SUFFIXES) if p.is_file()),
+                None,
+            )
+            if archive is None:
+                return {"status": "error", "detail": "Backup not found"}
         try:
             if target_dir.exists() and overwrite:
                 shutil.rmtree(target_dir)
             if target_dir.exists() and not overwrite:
                 return {"status": "error", "detail": "Target exists; set overwrite=True to replace"}
-            shutil.copytree(src, target_dir)
+            if archive is not None:
+                target_dir.mkdir(parents=True)
+                _extract_archive(archive, target_dir)
+                return {"status": "success", "detail": f"Restored to {target_dir}"}
+            _copy_tree(src, target_dir, copy_function=_link_or_copy if hard_link else shutil.copy2)
             return {"status": "success", "detail": f"Restored to {target_dir}"}
         except Exception as exc:
             return {"status": "error", "detail": str(exc)}
@@ -2,26 +2,63 @@ from __future__ import annotations
 
 from typing import Sequence, Optional, Any, Dict, List, Tuple
 import os
-import shutil
+import signal
 import subprocess
 import sys
 import shlex
+import time
 
 try:
     from espanso_companion.cli_integration import EspansoCLI
 except Exception:  # pragma: no cover - in tests we inject a fake
     EspansoCLI = None  # type: ignore
+
+from core.path_resolver import RESOLVER, PathResolver
+
+# After this many consecutive wrapper failures, go straight to the subprocess fallback...
+CLI_FAILURE_THRESHOLD = 3
+# ...for this many seconds before giving the wrapper another try
+CLI_RETRY_AFTER = 30.0
+
+
+def kill_tree(pid: int) -> None:
+    """Kill `pid` and everything it spawned (a shell wrapper and its children)."""
+    try:
+        if os.name == "nt":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=10,
+            )
+        else:
+            os.killpg(os.getpgid(pid), signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        pass
 
 
+def _needs_shell(executable: str) -> bool:
+    """Windows `.cmd`/`.bat` wrappers only run through the shell."""
+    return executable.lower().endswith((".cmd", ".bat"))
+
+
 class CLIAdapter:
     """Thin adapter around EspansoCLI to create an injectable test seam.
 
     Methods mirror the small subset of CLI functionality the GUI needs.
     """
 
-    def __init__(self, cli: Optional[Any] = None) -> None:
+    def __init__(self, cli: Optional[Any] = None, resolver: Optional[PathResolver] = None) -> None:
         # Allow injection of a fake CLI for tests; otherwise construct the real one lazily
         self._cli = cli
+        # PATH lookups go through the shared, environment-keyed cache unless injected
+        self._resolver = resolver or RESOLVER
+        # (path, needs_shell) for the last ESPANSO_CLI value seen; PATH hits are cached
+        # by the resolver, keyed on PATH/PATHEXT so environment changes are honored
+        self._env_exec: Optional[Tuple[str, bool]] = None
+        # Circuit breaker around the wrapper: consecutive failures and when to retry it
+        self._cli_failures = 0
+        self._cli_disabled_until: Optional[float] = None
 
     @property
     def cli(self) -> Any:
@@ -38,43 +75,83 @@ class CLIAdapter:
         `returncode`, `stdout`, and `stderr`.
         """
         # Prefer the injected/underlying CLI wrapper when available
+        if self._cli_enabled():
+            try:
+                proc = self.cli.run(args)
+                # Some wrappers may return None or a custom object; normalize
+                if proc is None:
+                    raise RuntimeError("Underlying CLI returned no result")
+                self._cli_failures = 0
+                return proc
+            except Exception:
+                self._record_cli_failure()
+        cmd = list(args)
         try:
-            proc = self.cli.run(list(args))
-            # Some wrappers may return None or a custom object; normalize
-            if proc is None:
-                raise RuntimeError("Underlying CLI returned no result")
-            return proc
-        except Exception:
-            cmd = list(args)
+            resolved_cmd, use_shell = self._normalize_command(cmd)
+            if use_shell:
+                resolved_cmd = " ".join(shlex.quote(p) for p in resolved_cmd)
+            return self._run_with_timeout(resolved_cmd, use_shell, cwd, capture_output, timeout)
+        except Exception as exc:
+            class _CP:
+                def __init__(self, rc=1, out="", err=""):
+                    self.returncode = rc
+                    self.stdout = out
+                    self.stderr = err
+
+            return _CP(rc=1, out="", err=str(exc))
+
+    def _cli_enabled(self) -> bool:
+        """False while the breaker is open; reopens the wrapper for a trial call after the timeout."""
+        if self._cli_disabled_until is None:
+            return True
+        if time.monotonic() < self._cli_disabled_until:
+            return False
+        # Half-open: the failure count is kept, so one more failure trips it again
+        self._cli_disabled_until = None
+        return True
+
+    def _record_cli_failure(self) -> None:
+        self._cli_failures += 1
+        if self._cli_failures >= CLI_FAILURE_THRESHOLD:
+            self._cli_disabled_until = time.monotonic() + CLI_RETRY_AFTER
+
+    def reset(self) -> None:
+        """Re-enable the CLI wrapper immediately (e.g. after reinstalling Espanso)."""
+        self._cli_failures = 0
+        self._cli_disabled_until = None
+
+    @staticmethod
+    def _run_with_timeout(
+        cmd: Any, use_shell: bool, cwd: Optional[str], capture_output: bool, timeout: int
+    ) -> subprocess.CompletedProcess:
+        """Run `cmd` in its own process group and kill the whole group on timeout.
+
+        `subprocess.run(timeout=...)` only kills the direct child; with a shell
+        wrapper the grandchild keeps the pipes open and the run never returns.
+        """
+        pipe = subprocess.PIPE if capture_output else None
+        proc = subprocess.Popen(
+            cmd,
+            shell=use_shell,
+            stdout=pipe,
+            stderr=pipe,
+            text=True,
+            cwd=cwd,
+            start_new_session=(os.name != "nt"),
+            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+        )
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            kill_tree(proc.pid)
             try:
-                resolved_cmd, use_shell = self._normalize_command(cmd)
-                if use_shell:
-                    cmd_str = " ".join(shlex.quote(p) for p in resolved_cmd)
-                    completed = subprocess.run(
-                        cmd_str,
-                        shell=True,
-                        capture_output=capture_output,
-                        text=True,
-                        timeout=timeout,
-                        cwd=cwd,
-                    )
-                else:
-                    completed = subprocess.run(
-                        resolved_cmd,
-                        cwd=cwd,
-                        capture_output=capture_output,
-                        text=True,
-                        timeout=timeout,
-                    )
-                return completed
-            except Exception as exc:
-                class _CP:
-                    def __init__(self, rc=1, out="", err=""):
-                        self.returncode = rc
-                        self.stdout = out
-                        self.stderr = err
-
-                return _CP(rc=1, out="", err=str(exc))
+                proc.communicate(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            return subprocess.CompletedProcess(
+                cmd, 124, stdout="", stderr=f"Command timed out after {timeout} seconds"
+            )
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout=stdout, stderr=stderr)
 
     def start_background(self, args: Sequence[str], cwd: Optional[str] = None) -> subprocess.Popen:
         """Start a CLI command without waiting for completion."""
@@ -127,7 +204,7 @@ class CLIAdapter:
 
     def _normalize_command(self, cmd: List[str]) -> Tuple[List[str], bool]:
         """Ensure fallback command includes a resolved executable and platform-specific shell flag."""
-        exe = self._resolve_executable()
+        exe, use_shell = self._resolve_executable_info()
         if not cmd:
             cmd_list = [exe]
         else:
@@ -136,17 +213,31 @@ class CLIAdapter:
                 cmd_list = [exe] + cmd[1:]
             else:
                 cmd_list = cmd[:]
-        use_shell = exe.endswith(".cmd") or exe.endswith(".bat")
         return cmd_list, use_shell
 
     def _resolve_executable(self) -> str:
         """Determine which `espanso` binary to invoke when the wrapper is unavailable."""
+        return self._resolve_executable_info()[0]
+
+    def _resolve_executable_info(self) -> Tuple[str, bool]:
+        """Resolved executable plus whether it is a batch wrapper needing `shell=True`.
+
+        PATH lookups are answered by the resolver's cache, which is keyed on the
+        current PATH and expires misses, so no result is pinned here.
+        """
         env_override = os.environ.get("ESPANSO_CLI")
         if env_override:
-            return env_override
+            if self._env_exec is None or self._env_exec[0] != env_override:
+                self._env_exec = (env_override, _needs_shell(env_override))
+            return self._env_exec
         candidates = ("espanso.exe", "espanso.cmd", "espanso")
         for name in candidates:
-            path = shutil.which(name)
+            path = self._resolver.resolve(name)
             if path:
-                return path
-        return "espanso"
+                return path, _needs_shell(path)
+        # Misses expire in the resolver, so an install made while the GUI runs is picked up
+        return "espanso", False
+
+    def invalidate_executable_cache(self) -> None:
+        """Forget the PATH lookup so the next fallback call searches again."""
+        self._resolver.clear()
@@ -1,9 +1,30 @@
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used otherwise
+    orjson = None
+
+# Managers with a deferred write pending; weak so the exit hook doesn't keep them alive
+_PENDING_FLUSH: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+def _flush_pending() -> None:
+    # Daemon timers die with the interpreter; don't lose the last change
+    for manager in list(_PENDING_FLUSH):
+        manager.flush()
+
+
+atexit.register(_flush_pending)
+
 
 class ConfigManager:
     """Manage user preferences and storage directories for Espanso Companion.
@@ -12,33 +33,75 @@ class ConfigManager:
     `EspansoAPI`.
     """
 
-    def __init__(self, base_dir: Optional[Path] = None) -> None:
+    def __init__(self, base_dir: Optional[Path] = None, flush_delay: float = 0.1) -> None:
         # Allow tests to override where preferences are stored.
         self._base = Path(base_dir) if base_dir is not None else Path.home() / ".espanso_companion"
         self._base.mkdir(parents=True, exist_ok=True)
         self._preferences_path = self._base / "preferences.json"
         self._preferences: Dict[str, Any] = self._load_preferences()
+        # Setter bursts collapse into one write `flush_delay` seconds after the last change
+        self._flush_delay = max(0.0, flush_delay)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
 
     def _load_preferences(self) -> Dict[str, Any]:
         if not self._preferences_path.exists():
             return {}
         try:
+            if orjson is not None:
+                return orjson.loads(self._preferences_path.read_bytes())
             return json.loads(self._preferences_path.read_text(encoding="utf-8"))
         except Exception:
             return {}
 
     def _save_preferences(self) -> None:
-        try:
-            self._preferences_path.write_text(json.dumps(self._preferences, indent=2), encoding="utf-8")
-        except Exception:
-            # Best-effort persist; callers can surface errors if required.
-            pass
+        """Schedule a write of the current preferences (immediate when `flush_delay` is 0)."""
+        if not self._flush_delay:
+            self.flush()
+            return
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self._flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending preference changes now."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            tmp = self._preferences_path.with_suffix(".tmp")
+            try:
+                if orjson is not None:
+                    data = orjson.dumps(self._preferences, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self._preferences, indent=2).encode("utf-8")
+                tmp.write_bytes(data)
+                os.replace(tmp, self._preferences_path)
+            except Exception as exc:
+                # Stay dirty so the next flush (or the exit hook) retries
+                print(f"[ERROR] Failed to save preferences: {exc}", flush=True)
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+                return
+            self._dirty = False
+            _PENDING_FLUSH.discard(self)
 
     def get_preferences(self) -> Dict[str, Any]:
         return dict(self._preferences)
 
     def set_preference(self, key: str, value: Any) -> None:
-        self._preferences[key] = value
+        with self._lock:
+            self._preferences[key] = value
+            self._dirty = True
+            _PENDING_FLUSH.add(self)
         self._save_preferences()
 
     def get_data_root(self) -> Path:
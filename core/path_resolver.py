@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Tuple
+import os
+import shutil
+import threading
+import time
+
+
+def _is_executable(path: str) -> bool:
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+class PathResolver:
+    """`shutil.which` with results cached per (name, PATH, PATHEXT).
+
+    Every lookup walks each PATH entry (times each PATHEXT suffix on Windows),
+    so repeated probes for the same binary are answered from the cache until
+    the environment changes. Misses are cached too, but only for `miss_ttl`
+    seconds so a binary installed into an existing PATH directory is found.
+    A cached hit is re-checked with `validate` (one stat) before it is
+    returned, so an uninstalled or moved binary triggers a fresh lookup.
+    Pass `which` to substitute the lookup in tests; an injected `which` skips
+    the check unless `validate` is given as well.
+    """
+
+    def __init__(
+        self,
+        which: Optional[Callable[[str], Optional[str]]] = None,
+        maxsize: int = 64,
+        miss_ttl: float = 30.0,
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        self._which = which
+        self._validate = validate or (_is_executable if which is None else None)
+        self._maxsize = maxsize
+        self._miss_ttl = miss_ttl
+        self._lock = threading.Lock()
+        # key -> (result, monotonic expiry); hits never expire
+        self._cache: Dict[Tuple[str, str, str], Tuple[Optional[str], float]] = {}
+
+    def resolve(self, name: str) -> Optional[str]:
+        key = (name, os.environ.get("PATH", ""), os.environ.get("PATHEXT", ""))
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and now < cached[1]:
+            if cached[0] is None or self._validate is None or self._validate(cached[0]):
+                return cached[0]
+        which = self._which or shutil.which
+        result = which(name)
+        expires = float("inf") if result else now + self._miss_ttl
+        with self._lock:
+            self._cache.pop(key, None)
+            if len(self._cache) >= self._maxsize:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (result, expires)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# Process-wide resolver shared by adapters that don't inject their own
+RESOLVER = PathResolver()
+
+
+def resolve(name: str) -> Optional[str]:
+    """Resolve `name` on PATH through the shared resolver."""
+    return RESOLVER.resolve(name)
@@ -31,6 +31,7 @@ class ServiceManager:
         status_attempts: int = 3,
         status_delay: float = 2.0,
         status_retry_window: float = 60.0,
+        status_ttl: float = 5.0,
     ) -> None:
         self._cli = cli
         self._status_attempts = max(1, status_attempts)
@@ -42,6 +43,11 @@ class ServiceManager:
         self._service_start_fail_time = 0.0
         self._handshake_steps: List[Tuple[str, Tuple[str, str]]] = []
         self._last_status_info: Optional[Dict[str, str]] = None
+        # Last `espanso status` result and its monotonic timestamp; passive
+        # status reports within `status_ttl` seconds reuse it.
+        self._status_ttl = max(0.0, status_ttl)
+        self._status_result: Optional[subprocess.CompletedProcess] = None
+        self._status_checked_at = 0.0
 
     def ensure_service_ready(self) -> List[Tuple[str, Tuple[str, str]]]:
         """Run the startup handshake once."""
@@ -104,14 +110,14 @@ class ServiceManager:
 
     def report_service_status(self, start_if_missing: bool = False) -> Tuple[str, str]:
         try:
-            status_result = self._cli.run(["status"])
-            self._cache_status(status_result)
+            status_result = self._cached_status()
+            # A cached "down" must not trigger a start; confirm it with a fresh probe
+            if status_result is None or (start_if_missing and not self._parse_status(status_result)[0]):
+                status_result = self._query_status(use_cache=False)
+            running, status_output = self._parse_status(status_result)
         except Exception as exc:
             return "error", str(exc)
 
-        status_output = (status_result.stdout or status_result.stderr or "").strip()
-        running = status_result.returncode == 0 and "running" in status_output.lower()
-
         if running:
             self._service_ready = True
             self._service_start_failed = False
@@ -156,16 +162,44 @@ class ServiceManager:
                 time.sleep(self._status_delay)
 
             try:
-                status_result = self._cli.run(["status"])
-                self._cache_status(status_result)
+                status_result = self._query_status(use_cache=False)
             except Exception:
                 continue
 
-            status_output = (status_result.stdout or status_result.stderr or "").strip()
-            if status_result.returncode == 0 and "running" in status_output.lower():
+            # A running result stays cached, so reports right after a start skip the CLI
+            if self._parse_status(status_result)[0]:
                 return True
         return False
 
+    def _cached_status(self) -> Optional[subprocess.CompletedProcess]:
+        """The last `espanso status` result if it is younger than `status_ttl`."""
+        if self._status_result is not None and (time.monotonic() - self._status_checked_at) < self._status_ttl:
+            return self._status_result
+        return None
+
+    def _query_status(self, use_cache: bool = True) -> subprocess.CompletedProcess:
+        """Run `espanso status`, reusing a result younger than `status_ttl`."""
+        if use_cache:
+            cached = self._cached_status()
+            if cached is not None:
+                return cached
+        status_result = self._cli.run(["status"])
+        self._cache_status(status_result)
+        self._status_result = status_result
+        self._status_checked_at = time.monotonic()
+        return status_result
+
+    @staticmethod
+    def _parse_status(result: subprocess.CompletedProcess) -> Tuple[bool, str]:
+        """Return (running, trimmed output) for an `espanso status` result."""
+        output = (result.stdout or result.stderr or "").strip()
+        return result.returncode == 0 and "running" in output.lower(), output
+
+    def refresh(self) -> None:
+        """Drop the cached status so the next report re-queries the CLI."""
+        self._status_result = None
+        self._status_checked_at = 0.0
+
     def _cache_status(self, result: subprocess.CompletedProcess) -> None:
         self._last_status_info = {
             "returncode": result.returncode,
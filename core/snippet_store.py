@@ -1,9 +1,55 @@
 from __future__ import annotations
 
+import copy
+import os
+from bisect import bisect_left
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 import yaml
-from pathlib import Path
+
+try:
+    import mmap
+except ImportError:  # pragma: no cover - platforms without mmap read into memory
+    mmap = None
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used for snippet packs otherwise
+    orjson = None
+
+# Prefer the libyaml-backed loader/dumper; pure-Python safe ones when it is not compiled in.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# Shared by every match-file write so the options are not rebuilt per call
+_DUMP_KW = {"Dumper": _SafeDumper, "sort_keys": False, "allow_unicode": True, "default_flow_style": False}
+# Below this size mapping the file costs more than reading it
+_MMAP_MIN_SIZE = 32 * 1024
+
+
+def _load_yaml_file(path: Path, size: int) -> Any:
+    """Parse a match file, letting libyaml read large files straight from a read-only mapping."""
+    if mmap is not None and size >= _MMAP_MIN_SIZE:
+        with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return yaml.load(mapped, Loader=_SafeLoader)
+    # Bytes, not text: the loader detects the encoding and skips a str decode
+    return yaml.load(path.read_bytes(), Loader=_SafeLoader)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist renames inside `directory`; best-effort where directories can't be opened (Windows)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 class SnippetStore:
@@ -16,6 +62,17 @@ class SnippetStore:
         self.match_dir = Path(match_dir) if match_dir is not None else None
         self._match_cache: List[Dict[str, Any]] = []
         self._yaml_errors: List[Dict[str, Any]] = []
+        # (cache list, trigger -> first snippet, sorted triggers); rebuilt when the cache is replaced
+        self._trigger_index: Optional[Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]], List[str]]] = None
+        # (cache list, lowercased search text per snippet, trigram -> snippet positions)
+        self._text_index: Optional[Tuple[List[Dict[str, Any]], List[str], Dict[str, Set[int]]]] = None
+        # File contents written inside `batch()`, flushed to disk when the batch exits
+        self._pending_writes: Optional[Dict[Path, Dict[str, Any]]] = None
+        # path -> ((mtime_ns, size), parsed document); reparsed only when the file changes
+        self._parsed_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # path -> (parsed document, snippet entries built from it); reused while
+        # `_read_yaml` keeps returning the same document, i.e. the file is unchanged
+        self._entries_cache: Dict[Path, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
 
     def set_match_dir(self, path: Path) -> None:
         self.match_dir = path
@@ -25,6 +82,12 @@ class SnippetStore:
             self._populate_matches()
         return list(self._match_cache)
 
+    def count(self) -> int:
+        """Number of snippets, without copying the cache like `list_snippets()`."""
+        if not self._match_cache:
+            self._populate_matches()
+        return len(self._match_cache)
+
     def _populate_matches(self) -> None:
         matches: List[Dict[str, Any]] = []
         yaml_errors: List[Dict[str, Any]] = []
@@ -34,88 +97,250 @@ class SnippetStore:
             self._yaml_errors = yaml_errors
             return
 
-        yaml_files = list(self.match_dir.glob("*.yml"))
-        for file in yaml_files:
+        yaml_files = self._yaml_files()
+        entries_cache: Dict[Path, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+        for file, stat in yaml_files:
             try:
-                content = file.read_text(encoding="utf-8")
-                data = yaml.safe_load(content) or {}
+                data = self._read_yaml(file, mutable=False, stat=stat)
             except Exception as exc:
                 yaml_errors.append({"file": str(file), "error": str(exc)})
                 continue
 
-            try:
-                # Espanso defines top-level `matches` as a list
-                for raw in (data.get("matches") or []):
-                    trigger = None
-                    replace = None
-                    label = raw.get("label") if isinstance(raw, dict) else None
-                    if isinstance(raw, dict):
-                        trigger = raw.get("trigger")
-                        replace = raw.get("replace")
-                    # Some match entries may be nested or different shapes; skip if no trigger
-                    if not trigger:
-                        continue
-                    matches.append(
-                        {
-                            "trigger": trigger,
-                            "replace": replace,
-                            "file": file.name,
-                            "label": label or "",
-                            "raw": raw,
-                        }
-                    )
-            except Exception as exc:
-                yaml_errors.append({"file": str(file), "error": str(exc)})
+            cached = self._entries_cache.get(file)
+            # Batch-pending documents are edited in place, so their entries are never reused
+            pending = self._pending_writes is not None and file in self._pending_writes
+            if cached is not None and cached[0] is data and not pending:
+                entries = cached[1]
+            else:
+                try:
+                    entries = self._build_file_entries(file, data)
+                except Exception as exc:
+                    yaml_errors.append({"file": str(file), "error": str(exc)})
+                    continue
+            if not pending:
+                entries_cache[file] = (data, entries)
+            matches.extend(entries)
 
         self._match_cache = matches
         self._yaml_errors = yaml_errors
+        # Only files seen in this pass are kept, so deleted files drop out
+        self._entries_cache = entries_cache
+
+    @staticmethod
+    def _build_file_entries(file: Path, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        entries: List[Dict[str, Any]] = []
+        # Espanso defines top-level `matches` as a list
+        for raw in (data.get("matches") or []):
+            trigger = None
+            replace = None
+            label = raw.get("label") if isinstance(raw, dict) else None
+            if isinstance(raw, dict):
+                trigger = raw.get("trigger")
+                replace = raw.get("replace")
+            # Some match entries may be nested or different shapes; skip if no trigger
+            if not trigger:
+                continue
+            entries.append(
+                {
+                    "trigger": trigger,
+                    "replace": replace,
+                    "file": file.name,
+                    "label": label or "",
+                    "raw": raw,
+                }
+            )
+        return entries
+
+    def _index(self) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        if not self._match_cache:
+            self._populate_matches()
+        if self._trigger_index is None or self._trigger_index[0] is not self._match_cache:
+            by_trigger: Dict[str, Dict[str, Any]] = {}
+            for s in self._match_cache:
+                by_trigger.setdefault(s["trigger"], s)
+            triggers = sorted(t for t in by_trigger if isinstance(t, str))
+            self._trigger_index = (self._match_cache, by_trigger, triggers)
+        return self._trigger_index[1], self._trigger_index[2]
 
     def get_snippet(self, trigger: str) -> Optional[Dict[str, Any]]:
+        by_trigger, _ = self._index()
+        return by_trigger.get(trigger)
+
+    def search(self, query: str, mode: str = "contains") -> List[Dict[str, Any]]:
+        """Search snippets by trigger.
+
+        `exact` and `prefix` match the trigger case-sensitively through a
+        trigger index (dict lookup / bisect over sorted triggers); `contains`
+        is the case-insensitive trigger/replace/label search of `search_snippets`.
+        """
+        if mode == "exact":
+            by_trigger, _ = self._index()
+            hit = by_trigger.get(query)
+            return [hit] if hit is not None else []
+        if mode == "prefix":
+            by_trigger, triggers = self._index()
+            results: List[Dict[str, Any]] = []
+            for trigger in triggers[bisect_left(triggers, query):]:
+                if not trigger.startswith(query):
+                    break
+                results.append(by_trigger[trigger])
+            return results
+        if mode == "contains":
+            return self.search_snippets(query)["results"]
+        raise ValueError(f"Unknown search mode: {mode}")
+
+    def _search_index(self) -> Tuple[List[str], Dict[str, Set[int]]]:
+        """Lowercased trigger/replace/label text per snippet plus a trigram posting index."""
         if not self._match_cache:
             self._populate_matches()
-        for s in self._match_cache:
-            if s.get("trigger") == trigger:
-                return s
-        return None
+        if self._text_index is None or self._text_index[0] is not self._match_cache:
+            texts: List[str] = []
+            trigrams: Dict[str, Set[int]] = {}
+            for position, s in enumerate(self._match_cache):
+                # NUL-separated so neither trigrams nor substring checks span two fields
+                text = "\0".join(
+                    ((s.get("trigger") or "").lower(), (s.get("replace") or "").lower(), (s.get("label") or "").lower())
+                )
+                texts.append(text)
+                for i in range(len(text) - 2):
+                    trigrams.setdefault(text[i:i + 3], set()).add(position)
+            self._text_index = (self._match_cache, texts, trigrams)
+        return self._text_index[1], self._text_index[2]
 
     def search_snippets(self, query: str = "", filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         filters = filters or {}
-        results: List[Dict[str, Any]] = []
         if not self._match_cache:
             self._populate_matches()
         q = (query or "").strip().lower()
 
-        for s in self._match_cache:
-            trigger = (s.get("trigger") or "").lower()
-            replace = (s.get("replace") or "")
-            file = (s.get("file") or "")
-            label = (s.get("label") or "")
-
-            if q:
-                if q in trigger or q in replace.lower() or q in label.lower():
-                    results.append(s)
-                else:
-                    continue
+        if not q:
+            results = list(self._match_cache)
+        else:
+            texts, trigrams = self._search_index()
+            if len(q) >= 3:
+                # Intersect the smallest posting lists first, then confirm with a substring check
+                postings = sorted((trigrams.get(q[i:i + 3], set()) for i in range(len(q) - 2)), key=len)
+                candidates = set(postings[0]).intersection(*postings[1:])
+                positions = sorted(p for p in candidates if q in texts[p])
             else:
-                results.append(s)
+                positions = [p for p, text in enumerate(texts) if q in text]
+            results = [self._match_cache[p] for p in positions]
 
         return {"status": "success", "count": len(results), "results": results}
 
     # -------------------------
     # Write operations (CRUD)
     # -------------------------
-    def _write_matches_file(self, path: Path, data: Dict[str, Any]) -> None:
+    @contextmanager
+    def batch(self) -> Iterator["SnippetStore"]:
+        """Defer file writes from CRUD calls until the block exits.
+
+        Each touched file is written once on exit, even if the block raises, so
+        completed operations are never lost. Reads inside the block see the
+        pending contents; `flush()` writes them early. Nested batches join the
+        outer one.
+        """
+        if self._pending_writes is not None:
+            yield self
+            return
+        self._pending_writes = {}
+        try:
+            yield self
+        finally:
+            self.flush()
+            self._pending_writes = None
+
+    def flush(self) -> None:
+        """Write every file changed inside the current `batch()` now.
+
+        The batch stays open; later changes are held again until the next
+        flush or the end of the block. A no-op outside a batch.
+        """
+        if not self._pending_writes:
+            return
+        pending, self._pending_writes = self._pending_writes, None
+        try:
+            for path, data in pending.items():
+                self._write_matches_file(path, data, sync_dir=False)
+            # One directory fsync covers every rename in the batch
+            for parent in {path.parent for path in pending}:
+                _fsync_dir(parent)
+        finally:
+            self._pending_writes = {}
+
+    def _yaml_files(self) -> List[Tuple[Path, Optional[os.stat_result]]]:
+        """`*.yml` files in the match dir with their stat from the directory scan.
+
+        `DirEntry.stat()` is served from the directory listing on Windows and
+        costs one call elsewhere; `_read_yaml` reuses it for the fingerprint.
+        """
+        files: List[Tuple[Path, Optional[os.stat_result]]] = []
+        try:
+            with os.scandir(self.match_dir) as entries:
+                for entry in entries:
+                    # normcase: glob matched `.YML` case-insensitively on Windows
+                    if os.path.normcase(entry.name).endswith(".yml") and entry.is_file():
+                        files.append((Path(entry.path), entry.stat()))
+        except FileNotFoundError:
+            pass
+        if self._pending_writes:
+            # Files first created inside a batch are not on disk yet
+            on_disk = {path for path, _ in files}
+            files.extend((path, None) for path in self._pending_writes if path not in on_disk)
+        return files
+
+    def _exists(self, path: Path) -> bool:
+        return (self._pending_writes is not None and path in self._pending_writes) or path.exists()
+
+    def _read_yaml(
+        self, path: Path, mutable: bool = True, stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Parse `path`, preferring contents still pending in a batch.
+
+        Unchanged files (same mtime and size) come from `_parsed_cache`; callers
+        that mutate the document get a deep copy, read-only callers share it.
+        """
+        if self._pending_writes is not None and path in self._pending_writes:
+            return self._pending_writes[path]
+        stat = stat or path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed_cache.get(path)
+        if cached is not None and cached[0] == key:
+            data = cached[1]
+        else:
+            data = _load_yaml_file(path, stat.st_size) or {}
+            self._parsed_cache[path] = (key, data)
+        return copy.deepcopy(data) if mutable else data
+
+    def _write_matches_file(self, path: Path, data: Dict[str, Any], sync_dir: bool = True) -> None:
+        if self._pending_writes is not None:
+            self._pending_writes[path] = data
+            return
+        # Write a sibling temp file and rename it over `path` so readers never see a torn file;
+        # fsync before the rename so a crash cannot leave an empty file behind the new name
+        tmp = path.with_suffix(path.suffix + ".tmp")
         try:
-            path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+            with open(tmp, "w", encoding="utf-8") as handle:
+                yaml.dump(data, handle, **_DUMP_KW)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, path)
         except Exception:
             # bubble up on failure in higher-level methods
+            tmp.unlink(missing_ok=True)
+            self._parsed_cache.pop(path, None)
             raise
+        # What we just wrote is the parse of the new file; skip reparsing it on the next read
+        stat = path.stat()
+        self._parsed_cache[path] = ((stat.st_mtime_ns, stat.st_size), data)
+        if sync_dir:
+            _fsync_dir(path.parent)
 
     def _load_snippet_file(self, file_path: Path) -> List[Dict[str, Any]]:
         if not file_path.exists():
             return []
         try:
-            data = yaml.safe_load(file_path.read_text(encoding="utf-8")) or {}
+            data = _load_yaml_file(file_path, file_path.stat().st_size) or {}
         except Exception:
             return []
         return data.get("matches") or []
@@ -130,19 +355,9 @@ class SnippetStore:
             return {"status": "error", "detail": "Match directory not configured"}
         base_file = self.match_dir / "base.yml"
         try:
-            if base_file.exists():
-                content = yaml.safe_load(base_file.read_text(encoding="utf-8")) or {}
-            else:
-                content = {}
+            content = self._read_yaml(base_file) if self._exists(base_file) else {}
             matches = content.get("matches") or []
-            # Build the entry we will append
-            entry = {}
-            if "trigger" in snippet_data:
-                entry["trigger"] = snippet_data["trigger"]
-            if "replace" in snippet_data:
-                entry["replace"] = snippet_data["replace"]
-            if "label" in snippet_data:
-                entry["label"] = snippet_data["label"]
+            entry = self._build_entry(snippet_data)
             matches.append(entry)
             content["matches"] = matches
             self._write_matches_file(base_file, content)
@@ -152,6 +367,54 @@ class SnippetStore:
         except Exception as exc:
             return {"status": "error", "detail": str(exc)}
 
+    def create_snippets_bulk(self, snippets: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """Append many snippets to `base.yml` with a single load and a single write.
+
+        Returns one result dict per input, in order, shaped like `create_snippet`'s.
+        """
+        if not self.match_dir:
+            return [{"status": "error", "detail": "Match directory not configured"} for _ in snippets]
+        base_file = self.match_dir / "base.yml"
+        try:
+            content = self._read_yaml(base_file) if self._exists(base_file) else {}
+            matches = content.get("matches") or []
+            results: List[Dict[str, str]] = []
+            for snippet_data in snippets:
+                entry = self._build_entry(snippet_data)
+                matches.append(entry)
+                results.append({"status": "success", "detail": f"Created snippet {entry.get('trigger') or ''}"})
+            content["matches"] = matches
+            self._write_matches_file(base_file, content)
+            self._match_cache = []
+            return results
+        except Exception as exc:
+            return [{"status": "error", "detail": str(exc)} for _ in snippets]
+
+    @staticmethod
+    def _build_entry(snippet_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the match entry that gets written for a new snippet."""
+        entry = {}
+        if "trigger" in snippet_data:
+            entry["trigger"] = snippet_data["trigger"]
+        if "replace" in snippet_data:
+            entry["replace"] = snippet_data["replace"]
+        if "label" in snippet_data:
+            entry["label"] = snippet_data["label"]
+        return entry
+
+    def _files_for_trigger(self, trigger: str) -> List[Tuple[Path, Optional[os.stat_result]]]:
+        """`_yaml_files()` with the file the trigger index points at moved to the front.
+
+        The index holds the first file containing each trigger, so a hit is
+        found after reading (and copying) one document; other files keep
+        their order as the fallback when the index is stale.
+        """
+        files = self._yaml_files()
+        hit = self._index()[0].get(trigger)
+        if hit is not None:
+            files.sort(key=lambda item: item[0].name != hit["file"])
+        return files
+
     def update_snippet(self, original_trigger: str, snippet_data: Dict[str, Any]) -> Dict[str, str]:
         """Locate the first snippet with `original_trigger` and update its fields.
 
@@ -160,10 +423,10 @@ class SnippetStore:
         if not self.match_dir:
             return {"status": "error", "detail": "Match directory not configured"}
         try:
-            # Search all YAML files for the snippet
-            for file in self.match_dir.glob("*.yml"):
+            # Search all YAML files for the snippet, the indexed one first
+            for file, stat in self._files_for_trigger(original_trigger):
                 try:
-                    data = yaml.safe_load(file.read_text(encoding="utf-8")) or {}
+                    data = self._read_yaml(file, stat=stat)
                 except Exception:
                     continue
                 changed = False
@@ -192,15 +455,19 @@ class SnippetStore:
         if not self.match_dir:
             return {"status": "error", "detail": "Match directory not configured"}
         try:
-            for file in self.match_dir.glob("*.yml"):
+            for file, stat in self._files_for_trigger(trigger):
                 try:
-                    data = yaml.safe_load(file.read_text(encoding="utf-8")) or {}
+                    data = self._read_yaml(file, stat=stat)
                 except Exception:
                     continue
                 matches = data.get("matches") or []
-                new_matches = [m for m in matches if not (isinstance(m, dict) and m.get("trigger") == trigger)]
-                if len(new_matches) != len(matches):
-                    data["matches"] = new_matches
+                positions = [
+                    i for i, m in enumerate(matches) if isinstance(m, dict) and m.get("trigger") == trigger
+                ]
+                if positions:
+                    # Delete in place (back to front) instead of rebuilding the list
+                    for i in reversed(positions):
+                        del matches[i]
                     self._write_matches_file(file, data)
                     self._match_cache = []
                     return {"status": "success", "detail": f"Deleted {trigger}"}
@@ -215,11 +482,14 @@ class SnippetStore:
             if not path.exists():
                 return {"status": "error", "detail": "File not found"}
             if path.suffix.lower() == ".json":
-                import json
+                if orjson is not None:
+                    packs = orjson.loads(path.read_bytes())
+                else:
+                    import json
 
-                packs = json.loads(path.read_text(encoding="utf-8"))
+                    packs = json.loads(path.read_text(encoding="utf-8"))
             else:
-                packs = yaml.safe_load(path.read_text(encoding="utf-8"))
+                packs = yaml.load(path.read_text(encoding="utf-8"), Loader=_SafeLoader)
 
             if isinstance(packs, dict):
                 packs = packs.get("matches", [])
@@ -244,9 +514,14 @@ class SnippetStore:
             if snippet:
                 snippets.append(snippet.get("raw") or snippet)
         try:
-            import json
+            if orjson is not None:
+                # NON_STR_KEYS: YAML maps may have int/bool keys, which json.dumps stringifies too
+                data = orjson.dumps(snippets, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                import json
 
-            Path(file_path).write_text(json.dumps(snippets, indent=2, ensure_ascii=False), encoding="utf-8")
+                data = json.dumps(snippets, indent=2, ensure_ascii=False).encode("utf-8")
+            Path(file_path).write_bytes(data)
             return {"status": "success", "detail": f"Exported {len(snippets)} snippets", "path": file_path}
         except Exception as exc:
             return {"status": "error", "detail": str(exc)}
@@ -1,10 +1,28 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
 import threading
 import time
 
 
+@dataclass(slots=True)
+class PendingSuggestion:
+    """A suggestion awaiting a decision; fixed fields, no per-entry dict.
+
+    The engine's phrase hash doubles as the suggestion id.
+    """
+
+    hash: str
+    phrase: str
+    count: int
+    created: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"id": self.hash, "hash": self.hash, "phrase": self.phrase, "count": self.count, "created": self.created}
+
+
 class SnippetSenseAdapter:
     """Adapter that manages an optional SnippetSense engine and a pending suggestions queue.
 
@@ -13,6 +31,10 @@ class SnippetSenseAdapter:
     (the real `SnippetSenseEngine` in the project), but for tests a fake engine may be
     injected. The adapter stores pending suggestions in-memory and exposes methods to
     list and decide on them. On `accept` it will call `snippet_creator` if provided.
+
+    At most `max_pending` suggestions stay pending; the oldest undecided ones
+    are moved to an archive (itself capped at `max_archived`, oldest dropped)
+    and can be brought back with `restore`.
     """
 
     def __init__(
@@ -20,11 +42,19 @@ class SnippetSenseAdapter:
         engine: Optional[Any] = None,
         settings: Optional[Dict[str, Any]] = None,
         snippet_creator: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        max_pending: int = 256,
+        max_archived: int = 1024,
     ) -> None:
         self._engine = engine
         self._settings = settings or {}
-        self._pending: List[Dict[str, Any]] = []
+        # hash (= suggestion id) -> suggestion, in arrival order
+        self._pending: "OrderedDict[str, PendingSuggestion]" = OrderedDict()
+        self._archived: "OrderedDict[str, PendingSuggestion]" = OrderedDict()
+        self._max_pending = max(1, max_pending)
+        self._max_archived = max(0, max_archived)
         self._pending_lock = threading.Lock()
+        # What list_pending() returns until the next insert or decision; None when stale
+        self._snapshot: Optional[Tuple[Dict[str, Any], ...]] = ()
         self._blocked: set = set(self._settings.get("blocked") or [])
         self._handled: set = set(self._settings.get("handled") or [])
         self._snippet_creator = snippet_creator
@@ -82,40 +112,80 @@ class SnippetSenseAdapter:
         if suggestion_hash in self._blocked or suggestion_hash in self._handled:
             return
         with self._pending_lock:
-            hashes = {item.get("hash") for item in self._pending}
-            if suggestion_hash in hashes:
+            if suggestion_hash in self._pending:
                 return
-            item = {
-                "id": f"ss_{int(time.time()*1000)}",
-                "hash": suggestion_hash,
-                "phrase": payload.get("phrase") or "",
-                "count": payload.get("count") or 0,
-                "created": payload.get("timestamp") or time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            }
-            self._pending.append(item)
-
-    def list_pending(self) -> List[Dict[str, Any]]:
+            # A suggestion that resurfaces is active again; drop its archived copy
+            self._archived.pop(suggestion_hash, None)
+            item = PendingSuggestion(
+                hash=suggestion_hash,
+                phrase=payload.get("phrase") or "",
+                count=payload.get("count") or 0,
+                created=payload.get("timestamp") or time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            )
+            self._activate_locked(item)
+
+    def _activate_locked(self, item: PendingSuggestion) -> None:
+        """Append `item` to the pending list, archiving the oldest past the cap; caller holds the lock."""
+        self._pending[item.hash] = item
+        while len(self._pending) > self._max_pending:
+            self._archive_locked(self._pending.popitem(last=False)[1])
+        self._snapshot = None
+
+    def _archive_locked(self, item: PendingSuggestion) -> None:
+        """Move `item` into the archive; caller holds `_pending_lock`."""
+        if not self._max_archived:
+            return
+        self._archived[item.hash] = item
+        while len(self._archived) > self._max_archived:
+            self._archived.popitem(last=False)
+
+    def archive(self, suggestion_id: str) -> Dict[str, Any]:
+        """Move a pending suggestion out of the active list without deciding on it."""
+        with self._pending_lock:
+            item = self._pending.pop(suggestion_id, None)
+            if item is None:
+                return {"status": "error", "detail": "Suggestion not found"}
+            self._archive_locked(item)
+            self._snapshot = None
+        return {"status": "success", "detail": "Suggestion archived"}
+
+    def restore(self, suggestion_id: str) -> Dict[str, Any]:
+        """Bring an archived suggestion back to the end of the pending list."""
+        with self._pending_lock:
+            item = self._archived.pop(suggestion_id, None)
+            if item is None:
+                return {"status": "error", "detail": "Archived suggestion not found"}
+            self._activate_locked(item)
+        return {"status": "success", "detail": "Suggestion restored"}
+
+    def list_archived(self) -> Tuple[Dict[str, Any], ...]:
+        with self._pending_lock:
+            return tuple(item.as_dict() for item in self._archived.values())
+
+    def list_pending(self) -> Tuple[Dict[str, Any], ...]:
+        """Pending suggestions in arrival order.
+
+        The same tuple is returned until the pending set changes; treat it and
+        its dicts as read-only.
+        """
         with self._pending_lock:
-            return list(self._pending)
+            if self._snapshot is None:
+                self._snapshot = tuple(item.as_dict() for item in self._pending.values())
+            return self._snapshot
 
     def handle_decision(self, suggestion_id: str, decision: str) -> Dict[str, Any]:
         decision = (decision or "").lower()
         if decision not in {"accept", "reject", "never"}:
             return {"status": "error", "detail": f"Unsupported decision: {decision}"}
 
-        suggestion = None
         with self._pending_lock:
-            for item in self._pending:
-                if item.get("id") == suggestion_id:
-                    suggestion = item
-                    break
+            suggestion = self._pending.pop(suggestion_id, None)
             if not suggestion:
                 return {"status": "error", "detail": "Suggestion not found"}
-            # remove from pending
-            self._pending = [i for i in self._pending if i.get("id") != suggestion_id]
+            self._snapshot = None
 
-        phrase_hash = suggestion.get("hash")
-        phrase = suggestion.get("phrase") or ""
+        phrase_hash = suggestion.hash
+        phrase = suggestion.phrase
 
         if decision == "accept":
             # Create snippet via provided creator function if available
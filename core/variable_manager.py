@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, Dict, List
+import os
 import yaml
 
 
@@ -63,8 +64,11 @@ class VariableManager:
 
             data["global_vars"] = sanitized
 
-            with open(self.base_file, "w", encoding="utf-8") as f:
+            # Replace rather than rewrite in place so hard-linked backups keep their content
+            tmp = self.base_file.with_suffix(self.base_file.suffix + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
                 yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            os.replace(tmp, self.base_file)
 
             return {"status": "success", "detail": "Global variables updated"}
         except Exception as e:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 import threading
 import time
 
-from espanso_companion.file_watcher import FileWatcher, WatchEvent
+from espanso_companion.file_watcher import FileWatcher, PollingWatcher, WatchEvent
 
 
 class WatcherManager:
@@ -13,12 +14,50 @@ class WatcherManager:
 
     Accepts an optional `watcher` for testing injection. When not provided the
     real `FileWatcher` is used.
+
+    Callbacks are debounced per path: the first event fires immediately, and
+    further events for that path within `debounce` seconds of the previous one
+    collapse into a single trailing call with the latest event. `poll_events`
+    still returns every raw event.
+
+    If the native watcher fails to start, a `PollingWatcher` with an adaptive
+    scan interval takes over (unless `poll_fallback` is False).
+
+    Batch callbacks (`register_batch_callback`) instead receive every raw
+    event as one list per flush: `debounce` seconds after the first event of
+    a batch, on `_tick()`, or when `flush()` is called.
+
+    Debounce windows are measured on `clock`. With `threaded=False` no timer
+    or polling threads are started; the caller advances the clock and calls
+    `_tick()` to close expired windows and run one polling scan.
     """
 
-    def __init__(self, paths: List[Path], watcher: Optional[FileWatcher] = None) -> None:
+    def __init__(
+        self,
+        paths: List[Path],
+        watcher: Optional[FileWatcher] = None,
+        debounce: float = 0.1,
+        poll_fallback: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        threaded: bool = True,
+    ) -> None:
         self._paths = list(paths)
         self._watcher = watcher or FileWatcher(self._paths)
+        self._poll_fallback = poll_fallback
+        self._clock = clock
+        self._threaded = threaded
+        self._polling = False
         self._started = False
+        self._debounce = max(0.0, debounce)
+        # Copy-on-write: registration swaps in a new tuple, dispatch reads it without locking
+        self._callbacks: Tuple[Callable[[WatchEvent], None], ...] = ()
+        self._batch_callbacks: Tuple[Callable[[List[WatchEvent]], None], ...] = ()
+        self._lock = threading.Lock()
+        # Events waiting for the next batch flush, and the timer that will flush them
+        self._batch: Deque[WatchEvent] = deque()
+        self._batch_timer: Optional[threading.Timer] = None
+        # path -> [deadline, latest event seen while the window was open, timer or None]
+        self._pending: Dict[Path, List] = {}
 
     def start(self) -> None:
         if self._started:
@@ -29,6 +68,21 @@ class WatcherManager:
         except Exception:
             # Fail silently; caller can check poll_events to see activity
             self._started = False
+            if self._poll_fallback:
+                self._start_polling()
+
+    def _start_polling(self) -> None:
+        print("[INFO] File watcher unavailable; polling for changes instead", flush=True)
+        watcher = PollingWatcher(self._paths, threaded=self._threaded)
+        if self._callbacks or self._batch_callbacks:
+            watcher.register_callback(self._dispatch)
+        try:
+            watcher.start()
+        except Exception:
+            return
+        self._watcher = watcher
+        self._polling = True
+        self._started = True
 
     def stop(self) -> None:
         if not self._started:
@@ -39,13 +93,129 @@ class WatcherManager:
             pass
         finally:
             self._started = False
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            for _, _, timer in pending.values():
+                if timer is not None:
+                    timer.cancel()
+            # Deliver what was already observed rather than dropping it
+            self.flush()
 
     def register_callback(self, callback: Callable[[WatchEvent], None]) -> None:
+        with self._lock:
+            if not self._hook_watcher():
+                return
+            self._callbacks = self._callbacks + (callback,)
+
+    def register_batch_callback(self, callback: Callable[[List[WatchEvent]], None]) -> None:
+        """Receive events as one list per flush instead of one call per event."""
+        with self._lock:
+            if not self._hook_watcher():
+                return
+            self._batch_callbacks = self._batch_callbacks + (callback,)
+
+    def _hook_watcher(self) -> bool:
+        """Attach `_dispatch` to the watcher on first registration; caller holds the lock."""
+        if self._callbacks or self._batch_callbacks:
+            return True
         try:
-            self._watcher.register_callback(callback)
+            self._watcher.register_callback(self._dispatch)
         except Exception:
             # if watcher implementation doesn't support callbacks, ignore
-            pass
+            return False
+        return True
+
+    def _dispatch(self, event: WatchEvent) -> None:
+        if self._batch_callbacks:
+            self._queue_batch(event)
+        if not self._callbacks:
+            return
+        if not self._debounce:
+            self._fire(event)
+            return
+        with self._lock:
+            deadline = self._clock() + self._debounce
+            window = self._pending.get(event.src_path)
+            leading = window is None
+            if not leading:
+                # Burst in progress: remember the latest event and extend the window
+                window[0] = deadline
+                window[1] = event
+                if window[2] is not None:
+                    window[2].cancel()
+            else:
+                window = [deadline, None, None]
+                self._pending[event.src_path] = window
+            if self._threaded:
+                window[2] = self._schedule(self._debounce, event.src_path)
+        if leading:
+            self._fire(event)
+
+    def _schedule(self, delay: float, path: Path) -> threading.Timer:
+        timer = threading.Timer(delay, self._close_window, args=(path,))
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _close_window(self, path: Path) -> None:
+        with self._lock:
+            window = self._pending.get(path)
+            if window is None:
+                return
+            remaining = window[0] - self._clock()
+            if remaining > 0:
+                # Extended since this timer was set (or it fired early): wait out the rest
+                window[2] = self._schedule(remaining, path)
+                return
+            del self._pending[path]
+        if window[1] is not None:
+            self._fire(window[1])
+
+    def _queue_batch(self, event: WatchEvent) -> None:
+        with self._lock:
+            self._batch.append(event)
+            if self._threaded and self._batch_timer is None:
+                self._batch_timer = threading.Timer(self._debounce, self.flush)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+
+    def flush(self) -> None:
+        """Hand every queued event to the batch callbacks now."""
+        with self._lock:
+            if not self._batch:
+                return
+            events, self._batch = self._batch, deque()
+            timer, self._batch_timer = self._batch_timer, None
+        if timer is not None:
+            timer.cancel()
+        batch = list(events)
+        for callback in self._batch_callbacks:
+            try:
+                callback(batch)
+            except Exception:
+                pass
+
+    def _tick(self) -> None:
+        """Run one step of the background work: a polling scan, then close expired windows."""
+        if self._polling and not self._threaded:
+            self._watcher.tick()
+        now = self._clock()
+        with self._lock:
+            expired = [path for path, window in self._pending.items() if window[0] <= now]
+            windows = [self._pending.pop(path) for path in expired]
+        for window in windows:
+            if window[2] is not None:
+                window[2].cancel()
+            if window[1] is not None:
+                self._fire(window[1])
+        self.flush()
+
+    def _fire(self, event: WatchEvent) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                pass
 
     def poll_events(self) -> List[WatchEvent]:
         try:
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import json
+import locale
 import os
 import platform
+import selectors
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+# `os.posix_spawn` skips the fork() copy of the GUI's address space; it does not
+# exist on Windows, where we keep using subprocess.run.
+_POSIX_SPAWN = getattr(os, "posix_spawn", None)
+
 
 class EspansoCLI:
     """Encapsulates espanso CLI commands for reuse in Streamlit."""
@@ -21,6 +28,9 @@ class EspansoCLI:
         self._espanso_exe: Optional[str] = None  # Cache for espanso executable path
         self._config_dir: Optional[Path] = None
         self._command_prefix: List[str] = []
+        # Resolved argv for constant (tuple) commands such as ("status",)
+        # Stored as tuples so a caller mutating its argv (or CompletedProcess.args) can't poison it
+        self._argv_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
     def _find_espanso_executable(self) -> str:
         """
@@ -74,14 +84,16 @@ class EspansoCLI:
         """Run a command and return the CompletedProcess for inspection."""
         try:
             # Get the actual executable path (handles Windows .cmd -> .exe resolution)
-            espanso_exe = self._find_espanso_executable()
-            cmd = [*self._command_prefix, espanso_exe, *args]
+            cmd = self._build_argv(args)
 
             env = None
             if self._config_dir:
                 env = os.environ.copy()
                 env["ESPANSO_CONFIG_DIR"] = str(self._config_dir)
 
+            if self._can_spawn(cwd, capture_output):
+                return self._spawn(cmd, env if env is not None else os.environ)
+
             # Run directly without shell - works cross-platform
             result = self._runner(
                 cmd,
@@ -110,9 +122,89 @@ class EspansoCLI:
                 stderr=f"Command timed out after {self.timeout} seconds: {exc}"
             )
 
+    def _build_argv(self, args: Sequence[str]) -> List[str]:
+        """Prefix `args` with the resolved executable, caching constant tuples."""
+        if isinstance(args, tuple):
+            cached = self._argv_cache.get(args)
+            if cached is None:
+                cached = (*self._command_prefix, self._find_espanso_executable(), *args)
+                self._argv_cache[args] = cached
+            return list(cached)
+        espanso_exe = self._find_espanso_executable()
+        return [*self._command_prefix, espanso_exe, *args]
+
+    def _can_spawn(self, cwd: Optional[Path], capture_output: bool) -> bool:
+        """Use the posix_spawn fast path only when it is equivalent to the runner."""
+        return (
+            _POSIX_SPAWN is not None
+            and self._runner is subprocess.run
+            and cwd is None
+            and capture_output
+        )
+
+    def _spawn(self, argv: Sequence[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+        """Launch `argv` via posix_spawn and collect its output like subprocess.run."""
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        file_actions = [
+            (os.POSIX_SPAWN_DUP2, out_w, 1),
+            (os.POSIX_SPAWN_DUP2, err_w, 2),
+        ]
+        try:
+            # Own session, so a timeout can kill grandchildren still holding the pipes
+            pid = _POSIX_SPAWN(argv[0], list(argv), env, file_actions=file_actions, setsid=True)
+        except OSError:
+            for fd in (out_r, out_w, err_r, err_w):
+                os.close(fd)
+            raise
+        os.close(out_w)
+        os.close(err_w)
+
+        chunks: Dict[int, List[bytes]] = {out_r: [], err_r: []}
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        wait_status = None
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(out_r, selectors.EVENT_READ)
+                selector.register(err_r, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise subprocess.TimeoutExpired(list(argv), self.timeout)
+                    for key, _ in selector.select(remaining):
+                        data = os.read(key.fd, 65536)
+                        if data:
+                            chunks[key.fd].append(data)
+                        else:
+                            selector.unregister(key.fd)
+            _, wait_status = os.waitpid(pid, 0)
+        finally:
+            # Like subprocess.run: on timeout or any error (even KeyboardInterrupt),
+            # kill the process group and reap the child so neither fds nor a zombie leak
+            if wait_status is None:
+                from core.cli_adapter import kill_tree  # lazy: core.cli_adapter imports this module
+
+                kill_tree(pid)
+                os.waitpid(pid, 0)
+            for fd in (out_r, err_r):
+                os.close(fd)
+
+        return CompletedProcess(
+            list(argv),
+            returncode=os.waitstatus_to_exitcode(wait_status),
+            stdout=self._decode(b"".join(chunks[out_r])),
+            stderr=self._decode(b"".join(chunks[err_r])),
+        )
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        """Mirror subprocess text mode: locale encoding plus universal newlines."""
+        text = data.decode(locale.getpreferredencoding(False), errors="replace")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
     def status(self) -> Dict[str, Any]:
         """Return parsed output for `espanso status` to show install/daemon info."""
-        result = self.run(["status"])
+        result = self.run(("status",))
         return {
             "returncode": result.returncode,
             "stdout": result.stdout.strip(),
@@ -121,7 +213,7 @@ class EspansoCLI:
 
     def packages(self) -> List[Dict[str, Any]]:
         """List packages via the CLI; return parsed JSON if available."""
-        result = self.run(["package", "list"])
+        result = self.run(("package", "list"))
         try:
             return json.loads(result.stdout)
         except json.JSONDecodeError:
@@ -134,7 +226,7 @@ class EspansoCLI:
         return self.run(["package", "uninstall", name])
 
     def reload(self) -> subprocess.CompletedProcess:
-        return self.run(["restart"])
+        return self.run(("restart",))
 
     def path(self) -> Dict[str, Path]:
         """Get Espanso paths with proper validation and error handling."""
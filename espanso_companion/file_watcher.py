@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+import os
+import sys
+import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from queue import Empty, Queue
-from typing import Callable, List
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import (
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_DELETED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_MOVED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
+# Events kept for poll(); callers that only use callbacks never drain, so the oldest are dropped
+MAX_PENDING_EVENTS = 1024
+
+# watchdog event type -> type forwarded to callers, built once. Types missing here are
+# dropped with a single lookup: inotify also reports opened/closed/closed_no_write, so
+# merely reading a match file would otherwise look like a change.
+_FORWARDED_EVENT_TYPES: Dict[str, str] = {
+    event_type: event_type
+    for event_type in (EVENT_TYPE_CREATED, EVENT_TYPE_MODIFIED, EVENT_TYPE_DELETED, EVENT_TYPE_MOVED)
+}
+
 
 @dataclass
 class WatchEvent:
@@ -17,24 +38,41 @@ class WatchEvent:
     event_type: str
     is_directory: bool
 
+    def __post_init__(self) -> None:
+        # A handful of distinct values; interned so comparisons and dict lookups hit the identity fast path
+        self.event_type = sys.intern(self.event_type)
+
+
+def _drain(events: Deque[WatchEvent]) -> List[WatchEvent]:
+    """Pop everything queued so far; safe against concurrent appends from the watcher thread."""
+    drained: List[WatchEvent] = []
+    while True:
+        try:
+            drained.append(events.popleft())
+        except IndexError:
+            return drained
+
 
 class _EventHandler(FileSystemEventHandler):
-    def __init__(self, queue: Queue):
+    def __init__(self, queue: Deque[WatchEvent], callbacks: List[Callable[[WatchEvent], None]]):
         super().__init__()
         self._queue = queue
+        self._callbacks = callbacks
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle filesystem events with error protection."""
         try:
-            if not event.src_path:
+            event_type = _FORWARDED_EVENT_TYPES.get(event.event_type)
+            if event_type is None or not event.src_path:
                 return
-            self._queue.put(
-                WatchEvent(
-                    src_path=Path(event.src_path),
-                    event_type=event.event_type,
-                    is_directory=event.is_directory,
-                )
+            watch_event = WatchEvent(
+                src_path=Path(event.src_path),
+                event_type=event_type,
+                is_directory=event.is_directory,
             )
+            self._queue.append(watch_event)
+            for callback in self._callbacks:
+                callback(watch_event)
         except Exception:
             # Silently ignore errors in event handler to prevent watcher thread crash
             # This can happen with invalid paths, permissions issues, etc.
@@ -45,11 +83,11 @@ class FileWatcher:
     """Observes directories and exposes pending events for polling."""
 
     def __init__(self, paths: List[Path]) -> None:
-        self._queue: Queue = Queue()
+        self._queue: Deque[WatchEvent] = deque(maxlen=MAX_PENDING_EVENTS)
         self._observer = Observer()
-        self._handler = _EventHandler(self._queue)
-        self._paths = paths
         self._callbacks: List[Callable[[WatchEvent], None]] = []
+        self._handler = _EventHandler(self._queue, self._callbacks)
+        self._paths = paths
 
     def start(self) -> None:
         for path in self._paths:
@@ -60,15 +98,121 @@ class FileWatcher:
         self._observer.stop()
         self._observer.join(timeout=1)
 
+    def is_alive(self) -> bool:
+        """True while the observer thread is delivering events."""
+        return self._observer.is_alive()
+
     def register_callback(self, callback: Callable[[WatchEvent], None]) -> None:
         self._callbacks.append(callback)
 
     def poll(self) -> List[WatchEvent]:
         """Drain pending events for the UI layer to consume."""
-        events: List[WatchEvent] = []
-        while True:
+        return _drain(self._queue)
+
+
+class PollingWatcher:
+    """Stat-polling stand-in for `FileWatcher` where native watches are unavailable.
+
+    Used when the watchdog observer cannot start (inotify watch limit, network
+    shares). The scan interval adapts: `min_interval` right after a change,
+    growing by `backoff` per idle scan up to `max_interval`, so active editing
+    is picked up quickly while an idle tree costs roughly one scan per second.
+    With `threaded=False`, `start()` only takes the baseline snapshot and the
+    caller drives scans with `tick()`.
+    """
+
+    def __init__(
+        self,
+        paths: List[Path],
+        min_interval: float = 0.05,
+        max_interval: float = 1.0,
+        backoff: float = 1.5,
+        threaded: bool = True,
+    ) -> None:
+        self._paths = list(paths)
+        self._threaded = threaded
+        self._queue: Deque[WatchEvent] = deque(maxlen=MAX_PENDING_EVENTS)
+        self._callbacks: List[Callable[[WatchEvent], None]] = []
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+
+    def start(self) -> None:
+        self._snapshot = self._scan()
+        self._stop.clear()
+        if not self._threaded:
+            return
+        self._thread = threading.Thread(target=self._run, name="espanso-poll-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+
+    def is_alive(self) -> bool:
+        if not self._threaded:
+            return not self._stop.is_set()
+        return bool(self._thread and self._thread.is_alive())
+
+    def register_callback(self, callback: Callable[[WatchEvent], None]) -> None:
+        self._callbacks.append(callback)
+
+    def poll(self) -> List[WatchEvent]:
+        """Drain pending events for the UI layer to consume."""
+        return _drain(self._queue)
+
+    def tick(self) -> bool:
+        """Scan once and dispatch any changes; True when something changed."""
+        try:
+            return self._check()
+        except Exception:
+            return False
+
+    def _run(self) -> None:
+        interval = self._min_interval
+        while not self._stop.wait(interval):
+            changed = self.tick()
+            interval = self._min_interval if changed else min(interval * self._backoff, self._max_interval)
+
+    def _check(self) -> bool:
+        current = self._scan()
+        previous, self._snapshot = self._snapshot, current
+        events = [WatchEvent(path, "deleted", False) for path in previous.keys() - current.keys()]
+        for path, fingerprint in current.items():
+            before = previous.get(path)
+            if before is None:
+                events.append(WatchEvent(path, "created", False))
+            elif before != fingerprint:
+                events.append(WatchEvent(path, "modified", False))
+        for event in events:
+            self._queue.append(event)
+            for callback in self._callbacks:
+                try:
+                    callback(event)
+                except Exception:
+                    pass
+        return bool(events)
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime_ns, size) for every file under the watched paths."""
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        stack = [str(path) for path in self._paths]
+        while stack:
             try:
-                events.append(self._queue.get_nowait())
-            except Empty:
-                break
-        return events
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            else:
+                                stat = entry.stat()
+                                snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return snapshot
@@ -7,6 +7,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+# Prefer the libyaml-backed loader/dumper; pure-Python safe ones when it is not compiled in.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class YamlProcessor:
     """Wraps safe loading/dumping plus lightweight validation."""
@@ -14,12 +18,12 @@ class YamlProcessor:
     def load(self, source: Path) -> Dict[str, Any]:
         """Load YAML from disk and return a dict."""
         with source.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle) or {}
+            data = yaml.load(handle, Loader=_SafeLoader) or {}
         return self._normalize(data)
 
     def load_str(self, text: str) -> Dict[str, Any]:
         """Load YAML content from a string."""
-        data = yaml.safe_load(text) or {}
+        data = yaml.load(text, Loader=_SafeLoader) or {}
         return self._normalize(data)
 
     def dump(self, data: Dict[str, Any], target: Path, *, schema_version: Optional[str] = None) -> None:
@@ -27,7 +31,7 @@ class YamlProcessor:
         if schema_version:
             data.setdefault("schema_version", schema_version)
         with target.open("w", encoding="utf-8") as handle:
-            yaml.safe_dump(data, handle, sort_keys=False)
+            yaml.dump(data, handle, Dumper=_SafeDumper, sort_keys=False)
 
     def validate(self, data: Dict[str, Any], required_keys: Sequence[str]) -> Tuple[bool, List[str]]:
         """Check for required keys, return (ok, missing)."""
@@ -4,17 +4,21 @@ from __future__ import annotations
 
 import atexit
 import base64
+import copy
 import json
+import os
 import re
 import threading
 import uuid
 import yaml
-from collections import deque
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone, timedelta
+from functools import cached_property, lru_cache
+from itertools import islice
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import webview
-
 import platform
 import shlex
 import shutil
@@ -28,6 +32,11 @@ except Exception:  # pragma: no cover - optional dependency
     SnippetSenseEngine = None  # type: ignore
     SnippetSenseUnavailable = RuntimeError
 
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 from core.backup_manager import BackupManager
 from core.cli_adapter import CLIAdapter
 from core.config_manager import ConfigManager
@@ -45,6 +54,264 @@ from espanso_companion.yaml_processor import YamlProcessor
 from espanso_companion.platform_support import PLATFORM, PlatformInfo
 
 
+# Fixed argv for frequently issued CLI commands; the CLI wrapper caches the
+# resolved command line for tuples so these are only materialized once.
+_CMD_VERSION = ("--version",)
+_CMD_SERVICE_CHECK = ("service", "check")
+_CMD_START = ("start",)
+_CMD_RESTART = ("restart",)
+_CMD_LOG = ("log",)
+_CMD_PACKAGE_LIST = ("package", "list")
+_CMD_MATCH_EXEC = ("match", "exec")
+_CMD_DOCTOR = ("doctor",)
+
+# Async backup jobs remembered for polling; finished ones beyond this are evicted
+_BACKUP_JOB_HISTORY = 16
+
+
+# Preset app-specific config templates served to the UI as-is; treat as read-only.
+_APP_CONFIG_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "vscode": {
+        "filter_exec": "code.exe",
+        "filter_title": "",
+        "snippets": [
+            {"trigger": ":log", "replace": "console.log($|$);"},
+            {"trigger": ":func", "replace": "function $|$() {\n  \n}"},
+        ]
+    },
+    "chrome": {
+        "filter_exec": "chrome.exe",
+        "filter_title": "",
+        "snippets": [
+            {"trigger": ":email", "replace": "your.email@example.com"},
+        ]
+    },
+    "slack": {
+        "filter_exec": "slack.exe",
+        "filter_title": "",
+        "snippets": [
+            {"trigger": ":shrug", "replace": "¯\\_(ツ)_/¯"},
+            {"trigger": ":thanks", "replace": "Thanks for letting me know!"},
+        ]
+    },
+    "terminal": {
+        "filter_exec": "WindowsTerminal.exe",
+        "filter_title": "",
+        "snippets": [
+            {"trigger": ":gst", "replace": "git status"},
+            {"trigger": ":gco", "replace": "git checkout $|$"},
+        ]
+    },
+    "outlook": {
+        "filter_exec": "outlook.exe",
+        "filter_title": "",
+        "snippets": [
+            {"trigger": ":sig", "replace": "Best regards,\nYour Name\nYour Title"},
+        ]
+    }
+}
+
+# Variable type cards for the snippet editor; static, so served as-is on every call
+_VARIABLE_TYPE_OPTIONS: List[Dict[str, Any]] = [
+    {
+        "type": "date",
+        "label": "Date/Time",
+        "icon": "📅",
+        "params": ["format", "offset"],
+        "description": "Insert formatted timestamp with optional offsets.",
+    },
+    {
+        "type": "clipboard",
+        "label": "Clipboard",
+        "icon": "📋",
+        "params": ["fallback"],
+        "description": "Expand to the current clipboard contents.",
+    },
+    {
+        "type": "random",
+        "label": "Random Choice",
+        "icon": "🎲",
+        "params": ["choices"],
+        "description": "Pick a random option from a provided list.",
+    },
+    {
+        "type": "shell",
+        "label": "Shell Command",
+        "icon": "💻",
+        "params": ["cmd", "shell"],
+        "description": "Execute a shell command and inject the output.",
+    },
+    {
+        "type": "script",
+        "label": "Script",
+        "icon": "📜",
+        "params": ["args"],
+        "description": "Call an external script/binary with arguments.",
+    },
+    {
+        "type": "echo",
+        "label": "Echo Prompt",
+        "icon": "💬",
+        "params": ["prompt"],
+        "description": "Prompt the user for free-form text when expanding.",
+    },
+    {
+        "type": "choice",
+        "label": "User Choice",
+        "icon": "🎯",
+        "params": ["values"],
+        "description": "Present a list of options for the user to select.",
+    },
+    {
+        "type": "form",
+        "label": "Form Input",
+        "icon": "📝",
+        "params": ["fields"],
+        "description": "Build multi-field forms for advanced snippets.",
+    },
+    {
+        "type": "match",
+        "label": "Match Reference",
+        "icon": "🔗",
+        "params": ["trigger"],
+        "description": "Reference another match's output inline.",
+    },
+]
+
+
+# libyaml-backed loader/dumper when PyYAML was built with it; pure-Python otherwise.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _utc_stamp() -> str:
+    """UTC timestamp for backup file names, e.g. 20250101T120000."""
+    return time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+
+
+def _read_utf8(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def _match_append_fragment(text: str, new_match: Dict[str, Any]) -> Optional[str]:
+    """Return the text that appends `new_match` to `text`'s trailing `matches:` list.
+
+    Only applies when `matches:` is the last top-level key and already holds
+    block-style items; returns None otherwise so callers fall back to a full dump.
+    """
+    lines = text.splitlines()
+    matches_line = None
+    for position in range(len(lines) - 1, -1, -1):
+        line = lines[position]
+        if not line or line[0].isspace() or line.startswith("#"):
+            continue
+        if line.startswith("- ") or line == "-":
+            continue
+        if line.rstrip() == "matches:":
+            matches_line = position
+        break
+    if matches_line is None:
+        return None
+
+    indent = None
+    for line in lines[matches_line + 1:]:
+        stripped = line.lstrip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if stripped.startswith("- ") or stripped == "-":
+            indent = line[: len(line) - len(stripped)]
+        break
+    if indent is None or "\t" in indent:
+        return None
+
+    fragment = yaml.dump([new_match], Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
+    if indent:
+        fragment = "".join(indent + line if line.strip() else line for line in fragment.splitlines(True))
+    return ("" if text.endswith("\n") else "\n") + fragment
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write `content` to a sibling temp file, then swap it in with `os.replace`.
+
+    A crash mid-write leaves the previous file intact instead of a truncated YAML.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=128)
+def _compile_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile regex patterns once; the builder re-validates on every keystroke."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=32)
+def _token_automaton(tokens: Tuple[str, ...]) -> Any:
+    """Build (once per distinct query) an Aho-Corasick automaton over the query tokens."""
+    automaton = ahocorasick.Automaton()
+    for position, token in enumerate(tokens):
+        automaton.add_word(token, position)
+    automaton.make_automaton()
+    return automaton
+
+
+def _snippet_has_tokens(fields: Tuple[str, ...], tokens: Tuple[str, ...]) -> bool:
+    """Return True when every token occurs in one of a snippet's lowercased `fields`.
+
+    A single token is an `or`-chain of substring tests that usually stops at the
+    trigger. Multi-token queries use one pyahocorasick pass per field when it is
+    installed; otherwise each token is tested with `in`.
+    """
+    if len(tokens) == 1:
+        token = tokens[0]
+        return any(token in field for field in fields)
+    if ahocorasick is None:
+        return all(any(token in field for field in fields) for token in tokens)
+    automaton = _token_automaton(tokens)
+    seen = set()
+    for field in fields:
+        for _, position in automaton.iter(field):
+            seen.add(position)
+            if len(seen) == len(tokens):
+                return True
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class SnippetFilter:
+    """Search filters normalized once per `search_snippets` call."""
+
+    file: str = ""
+    enabled: Optional[bool] = None  # None = either state
+    has_vars: bool = False
+    has_form: bool = False
+    label: str = ""
+
+    @classmethod
+    def from_dict(cls, filters: Dict[str, Any]) -> "SnippetFilter":
+        enabled = (filters.get("enabled") or "").strip().lower()
+        return cls(
+            file=(filters.get("file") or "").strip().lower(),
+            enabled={"enabled": True, "disabled": False}.get(enabled),
+            has_vars=EspansoAPI._interpret_filter_bool(filters.get("hasVars")),
+            has_form=EspansoAPI._interpret_filter_bool(filters.get("hasForm")),
+            label=(filters.get("label") or "").strip().lower(),
+        )
+
+    @property
+    def active(self) -> bool:
+        """False when no filter is set, so searches can skip the predicate."""
+        return bool(self.file or self.enabled is not None or self.has_vars or self.has_form or self.label)
+
 
 def _section_to_dict(section: CatalogSection) -> Dict[str, Any]:
     return {
@@ -68,25 +335,60 @@ class EspansoAPI:
         self._events: deque[Dict[str, Any]] = deque(maxlen=60)
         self._event_lock = threading.Lock()
         self._match_cache: List[Dict[str, Any]] = []
+        # (snippet list, char -> ascending snippet positions, lowercased search fields per
+        # position) built lazily for search; kept off the snippet dicts returned to JS
+        self._search_index: Optional[
+            Tuple[List[Dict[str, Any]], Dict[str, List[int]], List[Tuple[str, str, str, str]]]
+        ] = None
+        # (snippet list, variable library) so list_snippet_variables skips unchanged caches
+        self._variables_cache: Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = None
+        # (mtime_ns, size) per match file from the last populate; None forces a reparse
+        self._match_snapshot: Optional[Dict[str, Tuple[int, int]]] = None
+        # Set by watcher events; while the watcher runs and this is clear, even the scan is skipped
+        self._match_dirty = True
+        # Serializes reparses between bridge calls and the debounced watcher reload
+        self._populate_lock = threading.RLock()
         self._yaml_errors: List[Dict[str, Any]] = []
+        # path -> ((mtime_ns, size), parsed document, raw text) so unchanged YAML files are
+        # neither reparsed nor re-read for editor backups
+        self._yaml_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any], str]] = {}
+        # path -> ((mtime_ns, size), trigger -> positions in `matches`) paired with _yaml_cache
+        self._trigger_index_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, List[int]]]] = {}
+        # path -> ((mtime_ns, size), parsed entry) for app-specific config files
+        self._app_config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+        self._feature_catalog_cache: Optional[Dict[str, Any]] = None
         self._connection_steps: List[Dict[str, Any]] = []
         self._watcher: Optional[FileWatcher] = None
         self._ready = False  # Track initialization completion
+        # Suggestion-queue writes are coalesced onto a background writer; preferences are
+        # persisted by config_manager, the only writer of preferences.json
+        self._persist_delay = 0.5  # seconds
+        self._persist_lock = threading.Lock()
+        self._pending_dirty = threading.Event()
+        self._persist_wakeup = threading.Event()
+        self._persist_stop = threading.Event()
+        # Guards top-level writes to the local view in self._preferences
+        self._preferences_lock = threading.Lock()
+        self._persist_thread = threading.Thread(target=self._persist_loop, name="espanso-persist", daemon=True)
+        self._persist_thread.start()
+        self._snippetsense_lock = threading.Lock()
         self._preferences = self._load_preferences()
         self._snippetsense_settings = self._preferences.get("snippetsense", self._default_snippetsense_settings())
         self._snippetsense_settings.setdefault("blocked", [])
         self._snippetsense_settings.setdefault("handled", [])
         if "snippetsense" not in self._preferences:
-            self._preferences["snippetsense"] = self._snippetsense_settings
-            self._save_preferences()
-        self._snippetsense_pending = self._load_snippetsense_pending()
+            self._set_preference("snippetsense", self._snippetsense_settings)
+        self._snippetsense_pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._snippetsense_pending_keys: set = set()
+        self._snippetsense_pending_phrases: set = set()
+        for item in self._load_snippetsense_pending():
+            self._add_pending(item)
         self._snippetsense_engine: Optional[SnippetSenseEngine] = None
         self._snippetsense_engine_error: Optional[str] = None
         self._snippetsense_available = SnippetSenseEngine is not None
         self._snippetsense_app_filters_supported = (
             getattr(SnippetSenseEngine, "APP_DETECTION_SUPPORTED", False) if SnippetSenseEngine else False
         )
-        self._snippetsense_lock = threading.Lock()
         self._config_override = self._coerce_override(self._preferences.get("configOverride"))
 
         # Caching infrastructure for performance
@@ -97,6 +399,17 @@ class EspansoAPI:
         self._cli_status_cache_time = 0.0
         self._cli_status_cache_ttl = 10  # seconds
         self._reload_debounce_timer: Optional[threading.Timer] = None
+        # Slow CLI calls (restart/reload) run here so the JS bridge returns immediately
+        self._bg = ThreadPoolExecutor(max_workers=2, thread_name_prefix="espanso-bg")
+        self._restart_future: Optional[Future] = None
+        # Archive backups run one at a time off the JS bridge thread
+        self._backup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="espanso-backup-job")
+        self._backup_jobs: "OrderedDict[str, Future]" = OrderedDict()
+        self._backup_jobs_lock = threading.Lock()
+        # Trailing-edge timer so a burst of snippet edits triggers a single restart
+        self._restart_delay = 0.5  # seconds
+        self._restart_lock = threading.Lock()
+        self._pending_restart: Optional[threading.Timer] = None
         self.path_service = PathService(
             loader=self.path_manager,
             config=self.config_manager,
@@ -104,10 +417,8 @@ class EspansoAPI:
             yaml_processor=self.yaml_processor,
         )
         self._initialize_paths(self._config_override)
-        self.snippet_store = SnippetStore(match_dir=self._paths.match)
-        self.snippet_service = SnippetService(self.snippet_store, self.cli)
-        self.backup_manager = BackupManager(self._manual_backup_dir())
-        self.variable_manager = VariableManager(self._paths.match)
+        # snippet_store / snippet_service / backup_manager / variable_manager are
+        # built on first use (cached properties below) from the paths resolved here
         if self._snippetsense_settings.get("enabled"):
             self._start_snippetsense_engine()
         self._perform_service_handshake()
@@ -115,6 +426,22 @@ class EspansoAPI:
         print(f"[INFO] EspansoGUI ready with {len(self._match_cache)} snippets", flush=True)
         atexit.register(self.shutdown)
 
+    @cached_property
+    def snippet_store(self) -> SnippetStore:
+        return SnippetStore(match_dir=self._paths.match)
+
+    @cached_property
+    def snippet_service(self) -> SnippetService:
+        return SnippetService(self.snippet_store, self.cli)
+
+    @cached_property
+    def backup_manager(self) -> BackupManager:
+        return BackupManager(self._manual_backup_dir())
+
+    @cached_property
+    def variable_manager(self) -> VariableManager:
+        return VariableManager(self._paths.match)
+
     def shutdown(self) -> None:
         """Shutdown GUI resources WITHOUT stopping Espanso service.
 
@@ -124,6 +451,14 @@ class EspansoAPI:
         print("[INFO] Shutting down EspansoGUI (Espanso service will remain running)", flush=True)
 
         self._stop_snippetsense_engine()
+        self._persist_stop.set()
+        self._persist_wakeup.set()
+        self._persist_thread.join(timeout=2.0)
+        self._flush_persisted_state()
+        self.config_manager.flush()
+        self.flush_restart()
+        self._bg.shutdown(wait=False)
+        self._backup_executor.shutdown(wait=False)
         watcher = getattr(self, "_watcher", None)
         if not watcher:
             return
@@ -146,29 +481,40 @@ class EspansoAPI:
             }
             with self._event_lock:
                 self._events.appendleft(entry)
+            self._match_dirty = True
 
             # Debounce reload to avoid mid-typing config changes
             if self._reload_debounce_timer:
                 self._reload_debounce_timer.cancel()
-            self._reload_debounce_timer = threading.Timer(2.0, self._delayed_refresh)
+            self._reload_debounce_timer = threading.Timer(2.0, self._schedule_delayed_refresh)
+            self._reload_debounce_timer.daemon = True
             self._reload_debounce_timer.start()
         except Exception:
             # Silently ignore errors to prevent watcher thread crash
             # This protects against invalid paths, race conditions, etc.
             pass
 
+    def _schedule_delayed_refresh(self) -> None:
+        """Hand the debounced reload to the background executor."""
+        try:
+            self._bg.submit(self._delayed_refresh)
+        except RuntimeError:
+            # Executor already shut down
+            pass
+
     def _delayed_refresh(self) -> None:
         """Execute debounced refresh after file changes settle."""
         try:
             self._populate_matches()
-        except Exception:
-            pass
+        except Exception as exc:
+            print(f"[WARNING] Debounced match reload failed: {exc}", flush=True)
 
     def _initialize_paths(self, override: Optional[Path]) -> None:
         self.path_service.initialize(override)
         self._paths = self.path_service.paths
         print(f"[INFO] Config: {self._paths.config}, Match: {self._paths.match}", flush=True)
         self._restart_watcher()
+        self._invalidate_matches()
         self.refresh_files()
 
     def _start_snippetsense_engine(self) -> None:
@@ -207,7 +553,8 @@ class EspansoAPI:
         phrase = payload.get("phrase", "")
         normalized_phrase = self._normalize_snippetsense_phrase(phrase)
         suggestion = {
-            "id": uuid.uuid4().hex,
+            # The phrase hash is already unique among pending items; no uuid needed
+            "id": suggestion_hash or uuid.uuid4().hex,
             "hash": suggestion_hash,
             "phrase": phrase,
             "normalized": normalized_phrase,
@@ -215,15 +562,34 @@ class EspansoAPI:
             "created": payload.get("timestamp") or datetime.utcnow().isoformat(),
         }
         with self._snippetsense_lock:
-            seen_keys = {(item.get("hash"), item.get("normalized")) for item in self._snippetsense_pending}
-            normalized_set = {item.get("normalized") for item in self._snippetsense_pending if item.get("normalized")}
-            key = (suggestion_hash, normalized_phrase)
-            if key in seen_keys or (normalized_phrase and normalized_phrase in normalized_set):
-                return
-            self._snippetsense_pending.append(suggestion)
-            if len(self._snippetsense_pending) > 50:
-                self._snippetsense_pending = self._snippetsense_pending[-50:]
-            self._save_snippetsense_pending()
+            if self._add_pending(suggestion):
+                self._save_snippetsense_pending()
+
+    def _add_pending(self, item: Dict[str, Any]) -> bool:
+        """Queue a suggestion unless an equivalent one is already pending.
+
+        Callers must hold `_snippetsense_lock` once the engine is running.
+        """
+        normalized = item.get("normalized")
+        key = (item.get("hash"), normalized)
+        if key in self._snippetsense_pending_keys:
+            return False
+        if normalized and normalized in self._snippetsense_pending_phrases:
+            return False
+        self._snippetsense_pending[item["id"]] = item
+        self._snippetsense_pending_keys.add(key)
+        if normalized:
+            self._snippetsense_pending_phrases.add(normalized)
+        while len(self._snippetsense_pending) > 50:
+            _, dropped = self._snippetsense_pending.popitem(last=False)
+            self._forget_pending(dropped)
+        return True
+
+    def _forget_pending(self, item: Dict[str, Any]) -> None:
+        normalized = item.get("normalized")
+        self._snippetsense_pending_keys.discard((item.get("hash"), normalized))
+        if normalized:
+            self._snippetsense_pending_phrases.discard(normalized)
 
     def _generate_snippetsense_trigger(self, phrase: str) -> str:
         cleaned = "".join(ch for ch in phrase.lower() if ch.isalnum() or ch.isspace()).strip()
@@ -338,11 +704,6 @@ class EspansoAPI:
             raise ValueError(f"Unsupported unit '{unit}'")
         return sign * value * seconds_per_unit
 
-    def _preferences_path(self) -> Path:
-        base = Path.home() / ".espanso_companion"
-        base.mkdir(parents=True, exist_ok=True)
-        return base / "preferences.json"
-
     def _data_root(self) -> Path:
         override = self._preferences.get("storageRoot") if hasattr(self, "_preferences") else None
         if override:
@@ -371,17 +732,29 @@ class EspansoAPI:
         return path
 
     def _load_preferences(self) -> Dict[str, Any]:
-        path = self._preferences_path()
-        if not path.exists():
-            return {}
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-
-    def _save_preferences(self) -> None:
-        path = self._preferences_path()
-        path.write_text(json.dumps(self._preferences, indent=2), encoding="utf-8")
+        return self.config_manager.get_preferences()
+
+    def _set_preference(self, key: str, value: Any) -> None:
+        """Update a preference; config_manager debounces and writes the shared file."""
+        with self._preferences_lock:
+            self._preferences[key] = value
+        self.config_manager.set_preference(key, value)
+
+    def _persist_loop(self) -> None:
+        """Background writer that flushes dirty state at most once per interval."""
+        while not self._persist_stop.is_set():
+            self._persist_wakeup.wait()
+            # Returns early on shutdown; shutdown() does the final flush itself
+            if self._persist_stop.wait(self._persist_delay):
+                break
+            self._persist_wakeup.clear()
+            self._flush_persisted_state()
+
+    def _flush_persisted_state(self) -> None:
+        with self._persist_lock:
+            if self._pending_dirty.is_set():
+                self._pending_dirty.clear()
+                self._write_snippetsense_pending()
 
     def _default_snippetsense_settings(self) -> Dict[str, Any]:
         return {
@@ -405,17 +778,24 @@ class EspansoAPI:
         try:
             data = json.loads(path.read_text(encoding="utf-8"))
             if isinstance(data, list):
-                return data
+                return [item for item in data if isinstance(item, dict) and item.get("id")]
         except Exception:
             pass
         return []
 
     def _save_snippetsense_pending(self) -> None:
+        """Schedule a write of the pending suggestion queue."""
+        self._pending_dirty.set()
+        self._persist_wakeup.set()
+
+    def _write_snippetsense_pending(self) -> None:
+        with self._snippetsense_lock:
+            pending = list(self._snippetsense_pending.values())
         path = self._snippetsense_state_path()
         try:
-            path.write_text(json.dumps(self._snippetsense_pending, indent=2), encoding="utf-8")
-        except Exception:
-            pass
+            _atomic_write_text(path, json.dumps(pending, indent=2))
+        except Exception as exc:
+            print(f"[ERROR] Failed to save SnippetSense suggestions: {exc}", flush=True)
 
     def _mark_snippetsense_handled(self, phrase_hash: Optional[str]) -> None:
         if not phrase_hash:
@@ -425,8 +805,7 @@ class EspansoAPI:
             return
         handled.add(phrase_hash)
         self._snippetsense_settings["handled"] = list(handled)
-        self._preferences["snippetsense"] = self._snippetsense_settings
-        self._save_preferences()
+        self._set_preference("snippetsense", self._snippetsense_settings)
         if self._snippetsense_engine:
             self._snippetsense_engine.update_settings(self._snippetsense_settings)
 
@@ -451,22 +830,175 @@ class EspansoAPI:
             else:
                 shutil.copy2(item, target)
 
+    @staticmethod
+    def _search_fields(snippet: Dict[str, Any]) -> Tuple[str, str, str, str]:
+        """Lowercased (trigger, replace, label, file) so queries skip per-call `.lower()`."""
+        return (
+            (snippet.get("trigger") or "").lower(),
+            (snippet.get("replace") or "").lower(),
+            (snippet.get("label") or "").lower(),
+            (snippet.get("file") or "").lower(),
+        )
+
+    def _search_candidates(
+        self, snippets: List[Dict[str, Any]], query: str
+    ) -> List[Tuple[Dict[str, Any], Tuple[str, str, str, str]]]:
+        """Narrow `snippets` to those whose search fields contain every character of `query`.
+
+        Each character maps to the ascending positions of snippets containing it;
+        only the smallest bucket among the query's characters is scanned. Returns
+        (snippet, lowercased fields) pairs.
+        """
+        if self._search_index is None or self._search_index[0] is not snippets:
+            index: Dict[str, List[int]] = defaultdict(list)
+            fields = [self._search_fields(snippet) for snippet in snippets]
+            for position, snippet_fields in enumerate(fields):
+                for char in set("".join(snippet_fields)):
+                    index[char].append(position)
+            self._search_index = (snippets, dict(index), fields)
+        fields = self._search_index[2]
+        if not query:
+            return list(zip(snippets, fields))
+        index = self._search_index[1]
+        bucket = min((index.get(char, ()) for char in set(query)), key=len)
+        return [(snippets[position], fields[position]) for position in bucket]
+
+    def _load_yaml_cached(self, path: Path, *, mutable: bool = True) -> Dict[str, Any]:
+        """Return the parsed YAML for `path`, reparsing only when its mtime or size changed.
+
+        Callers that mutate the result get a deep copy; read-only callers pass
+        `mutable=False` and share the cached document.
+        """
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == key:
+            data = cached[1]
+        else:
+            text = path.read_text(encoding="utf-8")
+            data = self.yaml_processor.load_str(text)
+            self._yaml_cache[path] = (key, data, text)
+        return copy.deepcopy(data) if mutable else data
+
+    def _remember_yaml(
+        self,
+        path: Path,
+        data: Dict[str, Any],
+        text: str,
+        trigger_index: Optional[Dict[str, List[int]]] = None,
+    ) -> None:
+        """Record `data`/`text` (and a still-valid trigger index) as the parse of `path` after a write."""
+        self._trigger_index_cache.pop(path, None)
+        try:
+            stat = path.stat()
+        except OSError:
+            self._yaml_cache.pop(path, None)
+            return
+        key = (stat.st_mtime_ns, stat.st_size)
+        self._yaml_cache[path] = (key, data, text)
+        if trigger_index is not None:
+            self._trigger_index_cache[path] = (key, trigger_index)
+
+    def _trigger_index(self, path: Path, matches: List[Any]) -> Dict[str, List[int]]:
+        """Map each trigger in `matches` to its positions, reusing the index for an unchanged file."""
+        cached_yaml = self._yaml_cache.get(path)
+        key = cached_yaml[0] if cached_yaml is not None else None
+        cached = self._trigger_index_cache.get(path)
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+        index: Dict[str, List[int]] = {}
+        for position, match in enumerate(matches):
+            if isinstance(match, dict):
+                index.setdefault(match.get("trigger"), []).append(position)
+        if key is not None:
+            self._trigger_index_cache[path] = (key, index)
+        return index
+
+    def _write_base_backup(self, base_file: Path) -> None:
+        """Copy the current `base_file` text into the editor backups.
+
+        Reuses the text cached at parse time when the file is unchanged, so a
+        CRUD write does not read base.yml a second time.
+        """
+        text = None
+        cached = self._yaml_cache.get(base_file)
+        if cached is not None:
+            stat = base_file.stat()
+            if cached[0] == (stat.st_mtime_ns, stat.st_size):
+                text = cached[2]
+        if text is None:
+            text = base_file.read_text(encoding="utf-8")
+        backup_dir = self._editor_backup_dir()
+        backup_file = backup_dir / f"base.yml.{_utc_stamp()}.bak"
+        backup_file.write_text(text, encoding="utf-8")
+
+    def _invalidate_yaml_cache(self, path: Optional[Path] = None) -> None:
+        """Drop the cached parse for `path`, or every cached parse when omitted."""
+        if path is None:
+            self._yaml_cache.clear()
+            self._trigger_index_cache.clear()
+        else:
+            self._yaml_cache.pop(path, None)
+            self._trigger_index_cache.pop(path, None)
+
+    def _invalidate_matches(self) -> None:
+        """Force the next `_populate_matches` to reparse even if mtimes look unchanged."""
+        self._match_dirty = True
+        self._match_snapshot = None
+
+    def _watcher_alive(self) -> bool:
+        watcher = self._watcher
+        try:
+            return watcher is not None and watcher.is_alive()
+        except Exception:
+            return False
+
+    @staticmethod
+    def _snapshot_match_files(match_dir: Path) -> Dict[str, Tuple[int, int]]:
+        """Map each top-level `*.yml` file to (mtime_ns, size) in a single directory scan."""
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        with os.scandir(match_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.name.endswith(".yml") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
     def _populate_matches(self) -> None:
-        """Load and parse all match files with error tracking."""
+        """Load and parse all match files with error tracking.
+
+        Skips the reparse entirely when no match file changed since the last run:
+        with a live watcher that has seen no events the directory is not even
+        scanned, otherwise a (mtime_ns, size) snapshot decides.
+        """
+        with self._populate_lock:
+            self._populate_matches_locked()
+
+    def _populate_matches_locked(self) -> None:
+        if not self._match_dirty and self._match_snapshot is not None and self._watcher_alive():
+            return
+        # Cleared before scanning so events arriving mid-parse mark the cache dirty again
+        self._match_dirty = False
         matches: List[Dict[str, Any]] = []
         match_dir = self._paths.match
 
         if not match_dir.exists():
             print(f"[WARNING] Match directory does not exist: {match_dir}", flush=True)
             self._match_cache = matches
+            self._match_snapshot = None
             return
 
-        yaml_files = list(match_dir.glob("*.yml"))
+        snapshot = self._snapshot_match_files(match_dir)
+        if snapshot == self._match_snapshot:
+            return
+
+        yaml_files = [match_dir / name for name in snapshot]
 
         yaml_errors = []
         for file in yaml_files:
             try:
-                data = self.yaml_processor.load(file)
+                data = self._load_yaml_cached(file, mutable=False)
             except Exception as exc:
                 # Track YAML errors for diagnostics but continue processing
                 print(f"[ERROR] Failed to load {file.name}: {exc}", flush=True)
@@ -479,34 +1011,34 @@ class EspansoAPI:
                     delay_value = self._sanitize_delay_value(match.delay)
                     has_form = bool(match.form)
                     has_vars = bool(match.variables)
-                    matches.append(
-                        {
-                            "name": match.name,
-                            "trigger": match.trigger,
-                            "replace": match.replace,
-                            "variables": match.variables,
-                            "enabled": match.enabled,
-                            "file": file.name,
-                            "label": match.label or "",
-                            "backend": match.backend or "",
-                            "delay": delay_value,
-                            "left_word": match.left_word,
-                            "right_word": match.right_word,
-                            "uppercase_style": match.uppercase_style or "",
-                            "image_path": match.image_path or "",
-                            "word": match.word,
-                            "propagate_case": match.propagate_case,
-                            "form": match.form,
-                            "hasForm": has_form,
-                            "hasVars": has_vars,
-                        }
-                    )
+                    snippet = {
+                        "name": match.name,
+                        "trigger": match.trigger,
+                        "replace": match.replace,
+                        "variables": match.variables,
+                        "enabled": match.enabled,
+                        "file": file.name,
+                        "label": match.label or "",
+                        "backend": match.backend or "",
+                        "delay": delay_value,
+                        "left_word": match.left_word,
+                        "right_word": match.right_word,
+                        "uppercase_style": match.uppercase_style or "",
+                        "image_path": match.image_path or "",
+                        "word": match.word,
+                        "propagate_case": match.propagate_case,
+                        "form": match.form,
+                        "hasForm": has_form,
+                        "hasVars": has_vars,
+                    }
+                    matches.append(snippet)
             except Exception as exc:
                 # Track processing errors
                 print(f"[ERROR] Failed to process matches in {file.name}: {exc}", flush=True)
                 yaml_errors.append({"file": file.name, "error": f"Processing error: {exc}"})
 
         self._match_cache = matches
+        self._match_snapshot = snapshot
         print(f"[INFO] Loaded {len(matches)} snippets from {len(yaml_files)} files", flush=True)
         # Store errors for diagnostics (could be exposed to UI later)
         self._yaml_errors = yaml_errors
@@ -579,7 +1111,7 @@ class EspansoAPI:
         )
 
     def _check_cli_available(self) -> Tuple[str, str]:
-        result = self.cli.run(["--version"])
+        result = self.cli.run(_CMD_VERSION)
         if result.returncode == 0:
             message = result.stdout.strip() or "Espanso CLI ready"
             return "success", message
@@ -611,7 +1143,7 @@ class EspansoAPI:
     def _autostart_status(self) -> Dict[str, str]:
         """Check if espanso is registered as a system service (autostart)."""
         # In Espanso 2.x, the command is 'service check' not 'autostart status'
-        result = self.cli.run(["service", "check"])
+        result = self.cli.run(_CMD_SERVICE_CHECK)
         detail = result.stdout.strip() or result.stderr.strip()
 
         # Exit code 2 means "not registered" which is a valid state
@@ -717,6 +1249,8 @@ class EspansoAPI:
 
     def pick_path_dialog(self, prompt: str = "Select a file", directory: bool = False) -> Dict[str, Any]:
         """Expose a pywebview file/folder picker to the frontend."""
+        import webview
+
         try:
             window = webview.windows[0]
         except IndexError:
@@ -773,17 +1307,90 @@ class EspansoAPI:
         return self._run_package_command(["package", "install", name])
 
     def start_service(self) -> Dict[str, str]:
-        result = self.cli.run(["start"])
+        result = self._run_service_command(self.cli.run, _CMD_START)
         detail = result.stdout.strip() or result.stderr.strip()
         status = "success" if result.returncode == 0 else "warning"
         return {"status": status, "detail": detail or "Espanso start requested"}
 
     def restart_service(self) -> Dict[str, str]:
-        result = self.cli.reload()
+        """Queue an Espanso restart; poll `wait_for_restart` for the outcome."""
+        self._queue_restart(self.cli.reload)
+        return {"status": "success", "detail": "Espanso restart queued", "queued": True}
+
+    def wait_for_restart(self, timeout: float = 0.0) -> Dict[str, Any]:
+        """Report the outcome of the most recently queued restart."""
+        if self._pending_restart is not None:
+            return {"status": "pending", "detail": "Espanso restart scheduled"}
+        future = self._restart_future
+        if future is None:
+            return {"status": "idle", "detail": "No restart queued"}
+        try:
+            result = future.result(timeout=max(0.0, float(timeout or 0)))
+        except FutureTimeoutError:
+            return {"status": "pending", "detail": "Espanso restart in progress"}
+        except Exception as exc:
+            return {"status": "error", "detail": f"Restart failed: {exc}"}
         detail = result.stdout.strip() or result.stderr.strip()
         status = "success" if result.returncode == 0 else "warning"
         return {"status": status, "detail": detail or "Espanso restart issued"}
 
+    def _run_service_command(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a start/restart and drop the cached `espanso status` so reports re-query."""
+        try:
+            return fn(*args)
+        finally:
+            self.service_manager.refresh()
+
+    def _queue_restart(self, fn: Callable[..., Any], *args: Any) -> Future:
+        self._restart_future = self._bg.submit(self._run_service_command, fn, *args)
+        return self._restart_future
+
+    def _schedule_restart(self) -> None:
+        """Restart Espanso once edits stop arriving for `_restart_delay` seconds."""
+        with self._restart_lock:
+            if self._pending_restart:
+                self._pending_restart.cancel()
+            timer = threading.Timer(self._restart_delay, self._fire_scheduled_restart)
+            # The callback needs its own timer to tell whether it was superseded
+            timer.args = (timer,)
+            timer.daemon = True
+            self._pending_restart = timer
+            timer.start()
+
+    def _fire_scheduled_restart(self, timer: threading.Timer) -> None:
+        with self._restart_lock:
+            if self._pending_restart is not timer:
+                # Replaced by a newer schedule or already run by flush_restart
+                return
+            self._pending_restart = None
+        try:
+            self._queue_restart(self.cli.run, _CMD_RESTART)
+        except RuntimeError:
+            # Executor already shut down; flush_restart handled the final restart
+            pass
+
+    def _request_restart(self, restart_now: bool) -> None:
+        """Restart immediately when the caller must block, otherwise coalesce."""
+        if restart_now:
+            self.flush_restart(force=True)
+        else:
+            self._schedule_restart()
+
+    def flush_restart(self, force: bool = False) -> bool:
+        """Run a scheduled restart now instead of waiting for its timer.
+
+        Returns True when a restart was issued; `force` restarts even if none
+        was scheduled.
+        """
+        with self._restart_lock:
+            timer, self._pending_restart = self._pending_restart, None
+        if timer is not None:
+            timer.cancel()
+        if timer is None and not force:
+            return False
+        self._run_service_command(self.cli.run, _CMD_RESTART)
+        return True
+
     def test_shell_command(self, command: str, timeout: int = 5, use_shell: bool = True) -> Dict[str, Any]:
         """Execute a shell command for the shell variable helper."""
         if not command:
@@ -809,7 +1416,7 @@ class EspansoAPI:
     def get_logs(self, lines: int = 100) -> Dict[str, Any]:
         """Get recent Espanso logs."""
         try:
-            result = self.cli.run(["log"])
+            result = self.cli.run(_CMD_LOG)
             logs = result.stdout.strip().split('\n')[-lines:]
             return {"status": "success", "logs": logs}
         except Exception as e:
@@ -818,7 +1425,7 @@ class EspansoAPI:
     def list_packages(self) -> Dict[str, Any]:
         """List installed packages."""
         try:
-            result = self.cli.run(["package", "list"])
+            result = self.cli.run(_CMD_PACKAGE_LIST)
             if result.returncode == 0:
                 lines = [l.strip() for l in result.stdout.strip().split('\n') if l.strip()]
                 return {"status": "success", "packages": lines}
@@ -868,26 +1475,30 @@ class EspansoAPI:
                 return {"status": "success", "configs": []}
 
             configs = []
-            for yml_file in config_dir.glob("*.yml"):
-                if yml_file.name == "default.yml":
-                    continue
-                try:
-                    content = yml_file.read_text(encoding="utf-8")
-                    filter_exec = ""
-                    filter_title = ""
-                    for line in content.split('\n'):
-                        if line.strip().startswith('filter_exec:'):
-                            filter_exec = line.split(':', 1)[1].strip().strip('"')
-                        elif line.strip().startswith('filter_title:'):
-                            filter_title = line.split(':', 1)[1].strip().strip('"')
-                    configs.append({
-                        "name": yml_file.stem,
-                        "filter_exec": filter_exec,
-                        "filter_title": filter_title,
-                        "path": str(yml_file)
-                    })
-                except Exception:
-                    continue
+            cache: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+            with os.scandir(config_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".yml") or entry.name == "default.yml":
+                        continue
+                    try:
+                        stat = entry.stat()
+                        signature = (stat.st_mtime_ns, stat.st_size)
+                        cached = self._app_config_cache.get(entry.path)
+                        if cached and cached[0] == signature:
+                            config = cached[1]
+                        else:
+                            data = self.yaml_processor.load_str(Path(entry.path).read_text(encoding="utf-8"))
+                            config = {
+                                "name": entry.name[: -len(".yml")],
+                                "filter_exec": str(data.get("filter_exec") or ""),
+                                "filter_title": str(data.get("filter_title") or ""),
+                                "path": entry.path,
+                            }
+                        cache[entry.path] = (signature, config)
+                        configs.append(dict(config))
+                    except Exception:
+                        continue
+            self._app_config_cache = cache
             return {"status": "success", "configs": configs}
         except Exception as e:
             return {"status": "error", "configs": [], "detail": str(e)}
@@ -895,7 +1506,7 @@ class EspansoAPI:
     def test_match(self, text: str) -> Dict[str, Any]:
         """Test if text would trigger a match."""
         try:
-            result = self.cli.run(["match", "exec", text])
+            result = self.cli.run([*_CMD_MATCH_EXEC, text])
             stdout = result.stdout.strip()
             stderr = result.stderr.strip()
             matched = result.returncode == 0 and bool(stdout)
@@ -931,6 +1542,8 @@ class EspansoAPI:
         if result.get("status") == "success":
             # Refresh cache after restore
             self._match_cache = []
+            self._invalidate_matches()
+            self._invalidate_yaml_cache()
             self._populate_matches()
         return result
 
@@ -941,11 +1554,10 @@ class EspansoAPI:
             # Transform to expected format with created timestamp
             result = []
             for b in backups:
-                backup_path = Path(b["path"])
                 result.append({
                     "name": b["name"],
                     "path": b["path"],
-                    "created": backup_path.stat().st_mtime if backup_path.exists() else 0
+                    "created": b.get("created", 0),
                 })
             return {"status": "success", "backups": result}
         except Exception as e:
@@ -963,7 +1575,7 @@ class EspansoAPI:
         return {
             "status": status,
             "settings": self._snippetsense_settings,
-            "pending": self._snippetsense_pending,
+            "pending": list(self._snippetsense_pending.values()),
         }
 
     def save_snippetsense_settings(self, settings: Dict[str, Any]) -> Dict[str, Any]:
@@ -980,8 +1592,7 @@ class EspansoAPI:
                 "handled": self._snippetsense_settings.get("handled") or [],
             })
             self._snippetsense_settings = sanitized
-            self._preferences["snippetsense"] = sanitized
-            self._save_preferences()
+            self._set_preference("snippetsense", sanitized)
             if sanitized["enabled"]:
                 self._start_snippetsense_engine()
             else:
@@ -992,32 +1603,18 @@ class EspansoAPI:
 
     def list_snippetsense_suggestions(self) -> Dict[str, Any]:
         with self._snippetsense_lock:
-            unique = []
-            seen_keys = set()
-            for item in self._snippetsense_pending:
-                key = (item.get("hash"), item.get("normalized"))
-                if key in seen_keys:
-                    continue
-                seen_keys.add(key)
-                unique.append(item)
-            if len(unique) != len(self._snippetsense_pending):
-                self._snippetsense_pending = unique
-                self._save_snippetsense_pending()
-        return {"status": "success", "pending": unique}
+            pending = list(self._snippetsense_pending.values())
+        return {"status": "success", "pending": pending}
 
     def handle_snippetsense_decision(self, suggestion_id: str, decision: str) -> Dict[str, Any]:
         decision = (decision or "").lower()
         if decision not in {"accept", "reject", "never"}:
             return {"status": "error", "detail": f"Unsupported decision: {decision}"}
-        suggestion = None
         with self._snippetsense_lock:
-            for item in self._snippetsense_pending:
-                if item.get("id") == suggestion_id:
-                    suggestion = item
-                    break
+            suggestion = self._snippetsense_pending.pop(suggestion_id, None)
             if not suggestion:
                 return {"status": "error", "detail": "Suggestion not found"}
-            self._snippetsense_pending = [item for item in self._snippetsense_pending if item.get("id") != suggestion_id]
+            self._forget_pending(suggestion)
             self._save_snippetsense_pending()
 
         phrase_hash = suggestion.get("hash")
@@ -1040,8 +1637,7 @@ class EspansoAPI:
             if phrase_hash:
                 blocked.add(phrase_hash)
                 self._snippetsense_settings["blocked"] = list(blocked)
-                self._preferences["snippetsense"] = self._snippetsense_settings
-                self._save_preferences()
+                self._set_preference("snippetsense", self._snippetsense_settings)
             return {
                 "status": result.get("status", "success"),
                 "detail": result.get("detail", "Snippet created"),
@@ -1055,8 +1651,7 @@ class EspansoAPI:
             if phrase_hash:
                 blocked.add(phrase_hash)
             self._snippetsense_settings["blocked"] = list(blocked)
-            self._preferences["snippetsense"] = self._snippetsense_settings
-            self._save_preferences()
+            self._set_preference("snippetsense", self._snippetsense_settings)
             if self._snippetsense_engine:
                 self._snippetsense_engine.update_settings(self._snippetsense_settings)
             self._mark_snippetsense_handled(phrase_hash)
@@ -1068,7 +1663,7 @@ class EspansoAPI:
     def doctor_diagnostics(self) -> Dict[str, Any]:
         """Run espanso doctor to get diagnostics."""
         try:
-            result = self.cli.run(["doctor"])
+            result = self.cli.run(_CMD_DOCTOR)
             output = result.stdout.strip() if result.stdout else result.stderr.strip()
             return {"status": "success", "output": output, "exit_code": result.returncode}
         except Exception as e:
@@ -1086,47 +1681,7 @@ class EspansoAPI:
 
     def get_app_config_templates(self) -> Dict[str, Any]:
         """Get preset app-specific config templates."""
-        templates = {
-            "vscode": {
-                "filter_exec": "code.exe",
-                "filter_title": "",
-                "snippets": [
-                    {"trigger": ":log", "replace": "console.log($|$);"},
-                    {"trigger": ":func", "replace": "function $|$() {\n  \n}"},
-                ]
-            },
-            "chrome": {
-                "filter_exec": "chrome.exe",
-                "filter_title": "",
-                "snippets": [
-                    {"trigger": ":email", "replace": "your.email@example.com"},
-                ]
-            },
-            "slack": {
-                "filter_exec": "slack.exe",
-                "filter_title": "",
-                "snippets": [
-                    {"trigger": ":shrug", "replace": "¯\\_(ツ)_/¯"},
-                    {"trigger": ":thanks", "replace": "Thanks for letting me know!"},
-                ]
-            },
-            "terminal": {
-                "filter_exec": "WindowsTerminal.exe",
-                "filter_title": "",
-                "snippets": [
-                    {"trigger": ":gst", "replace": "git status"},
-                    {"trigger": ":gco", "replace": "git checkout $|$"},
-                ]
-            },
-            "outlook": {
-                "filter_exec": "outlook.exe",
-                "filter_title": "",
-                "snippets": [
-                    {"trigger": ":sig", "replace": "Best regards,\nYour Name\nYour Title"},
-                ]
-            }
-        }
-        return {"status": "success", "templates": templates}
+        return {"status": "success", "templates": _APP_CONFIG_TEMPLATES}
 
     def import_snippet_pack(self, file_path: str) -> Dict[str, Any]:
         """Delegate snippet pack import to the snippet store."""
@@ -1147,8 +1702,7 @@ class EspansoAPI:
     def validate_regex(self, pattern: str) -> Dict[str, Any]:
         """Validate a regex pattern."""
         try:
-            import re
-            re.compile(pattern)
+            _compile_regex(pattern)
             return {"status": "success", "valid": True, "detail": "Valid regex pattern"}
         except re.error as e:
             return {"status": "success", "valid": False, "detail": str(e)}
@@ -1158,8 +1712,7 @@ class EspansoAPI:
     def test_regex(self, pattern: str, test_text: str) -> Dict[str, Any]:
         """Test regex pattern against text."""
         try:
-            import re
-            compiled = re.compile(pattern)
+            compiled = _compile_regex(pattern)
             match = compiled.search(test_text)
             if match:
                 return {
@@ -1238,58 +1791,75 @@ class EspansoAPI:
             self._populate_matches()
         return self._match_cache if self._match_cache else []
 
-    def _snippet_matches_filters(self, snippet: Dict[str, Any], query: str, filters: Dict[str, Any]) -> bool:
-        file_filter = (filters.get("file") or "").strip().lower()
-        if file_filter and (snippet.get("file") or "").lower() != file_filter:
+    def _snippet_matches_filters(
+        self,
+        snippet: Dict[str, Any],
+        fields: Tuple[str, str, str, str],
+        tokens: Tuple[str, ...],
+        spec: SnippetFilter,
+    ) -> bool:
+        if spec.file and fields[3] != spec.file:
             return False
 
-        enabled_filter = (filters.get("enabled") or "").strip().lower()
-        enabled_value = snippet.get("enabled", True)
-        if enabled_filter == "enabled" and enabled_value is False:
-            return False
-        if enabled_filter == "disabled" and not (enabled_value is False):
+        if spec.enabled is not None and (snippet.get("enabled", True) is not False) != spec.enabled:
             return False
 
-        if self._interpret_filter_bool(filters.get("hasVars")) and not snippet.get("hasVars"):
+        if spec.has_vars and not snippet.get("hasVars"):
             return False
-        if self._interpret_filter_bool(filters.get("hasForm")) and not snippet.get("hasForm"):
+        if spec.has_form and not snippet.get("hasForm"):
             return False
 
-        label_filter = (filters.get("label") or "").strip().lower()
-        if label_filter and label_filter not in (snippet.get("label") or "").lower():
+        if spec.label and spec.label not in fields[2]:
             return False
 
-        if query:
-            haystack_parts = [
-                snippet.get("trigger") or "",
-                snippet.get("replace") or "",
-                snippet.get("label") or "",
-                snippet.get("file") or "",
-            ]
-            haystack = " ".join(haystack_parts).lower()
-            if query not in haystack:
-                return False
+        if tokens and not _snippet_has_tokens(fields, tokens):
+            return False
 
         return True
 
-    def search_snippets(self, query: str = "", filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Search snippets with optional filters."""
+    def search_snippets(
+        self,
+        query: str = "",
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Search snippets with optional filters; each whitespace-separated term must match.
+
+        With `limit`, filtering stops once the page (plus one look-ahead hit for
+        `has_more`) is found, and `count` is the size of the returned page.
+        """
         try:
             if not self._match_cache:
                 self._populate_matches()
             snippets = self._match_cache if self._match_cache else []
             normalized_query = (query or "").strip().lower()
-            filters = filters or {}
-            results = [
-                snippet
-                for snippet in snippets
-                if self._snippet_matches_filters(snippet, normalized_query, filters)
-            ]
+            tokens = tuple(dict.fromkeys(normalized_query.split()))
+            spec = SnippetFilter.from_dict(filters or {})
+            if not tokens and not spec.active:
+                hits = iter(snippets)
+            else:
+                hits = (
+                    snippet
+                    for snippet, fields in self._search_candidates(snippets, "".join(tokens))
+                    if self._snippet_matches_filters(snippet, fields, tokens, spec)
+                )
+            start = max(0, int(offset or 0))
+            if limit is None:
+                results = list(islice(hits, start, None))
+                return {
+                    "status": "success",
+                    "results": results,
+                    "count": len(results),
+                    "total": len(snippets),
+                }
+            results = list(islice(hits, start, start + max(0, int(limit))))
             return {
                 "status": "success",
                 "results": results,
                 "count": len(results),
                 "total": len(snippets),
+                "has_more": next(hits, None) is not None,
             }
         except Exception as exc:
             return {"status": "error", "detail": f"Failed to search snippets: {exc}"}
@@ -1315,24 +1885,24 @@ class EspansoAPI:
         base_file = self._paths.match / "base.yml"
         try:
             # Validate YAML syntax before saving
-            self.yaml_processor.load_str(content)
+            parsed = self.yaml_processor.load_str(content)
 
             # Create backup before saving
             if base_file.exists():
-                backup_dir = self._editor_backup_dir()
-                backup_file = backup_dir / f"base.yml.{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.bak"
-                backup_file.write_text(base_file.read_text(encoding="utf-8"), encoding="utf-8")
+                self._write_base_backup(base_file)
 
             # Save new content
-            base_file.write_text(content, encoding="utf-8")
+            _atomic_write_text(base_file, content)
+            self._remember_yaml(base_file, parsed, content)
 
             # Refresh snippets cache
+            self._invalidate_matches()
             self.refresh_files()
 
-            # Reload espanso to apply changes
-            self.cli.run(["restart"])
+            # Reload espanso in the background once edits settle so the editor is not blocked
+            self._schedule_restart()
 
-            return {"status": "success", "detail": f"Saved and reloaded Espanso"}
+            return {"status": "success", "detail": "Saved; Espanso reload queued"}
         except Exception as exc:
             return {"status": "error", "detail": f"Failed to save: {exc}"}
 
@@ -1454,58 +2024,75 @@ class EspansoAPI:
             self._populate_matches()
         return self._match_cache if self._match_cache else []
 
-    def _snippet_matches_filters(self, snippet: Dict[str, Any], query: str, filters: Dict[str, Any]) -> bool:
-        file_filter = (filters.get("file") or "").strip().lower()
-        if file_filter and (snippet.get("file") or "").lower() != file_filter:
+    def _snippet_matches_filters(
+        self,
+        snippet: Dict[str, Any],
+        fields: Tuple[str, str, str, str],
+        tokens: Tuple[str, ...],
+        spec: SnippetFilter,
+    ) -> bool:
+        if spec.file and fields[3] != spec.file:
             return False
 
-        enabled_filter = (filters.get("enabled") or "").strip().lower()
-        enabled_value = snippet.get("enabled", True)
-        if enabled_filter == "enabled" and enabled_value is False:
-            return False
-        if enabled_filter == "disabled" and not (enabled_value is False):
+        if spec.enabled is not None and (snippet.get("enabled", True) is not False) != spec.enabled:
             return False
 
-        if self._interpret_filter_bool(filters.get("hasVars")) and not snippet.get("hasVars"):
+        if spec.has_vars and not snippet.get("hasVars"):
             return False
-        if self._interpret_filter_bool(filters.get("hasForm")) and not snippet.get("hasForm"):
+        if spec.has_form and not snippet.get("hasForm"):
             return False
 
-        label_filter = (filters.get("label") or "").strip().lower()
-        if label_filter and label_filter not in (snippet.get("label") or "").lower():
+        if spec.label and spec.label not in fields[2]:
             return False
 
-        if query:
-            haystack_parts = [
-                snippet.get("trigger") or "",
-                snippet.get("replace") or "",
-                snippet.get("label") or "",
-                snippet.get("file") or "",
-            ]
-            haystack = " ".join(haystack_parts).lower()
-            if query not in haystack:
-                return False
+        if tokens and not _snippet_has_tokens(fields, tokens):
+            return False
 
         return True
 
-    def search_snippets(self, query: str = "", filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Search snippets with optional filters."""
+    def search_snippets(
+        self,
+        query: str = "",
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Search snippets with optional filters; each whitespace-separated term must match.
+
+        With `limit`, filtering stops once the page (plus one look-ahead hit for
+        `has_more`) is found, and `count` is the size of the returned page.
+        """
         try:
             if not self._match_cache:
                 self._populate_matches()
             snippets = self._match_cache if self._match_cache else []
             normalized_query = (query or "").strip().lower()
-            filters = filters or {}
-            results = [
-                snippet
-                for snippet in snippets
-                if self._snippet_matches_filters(snippet, normalized_query, filters)
-            ]
+            tokens = tuple(dict.fromkeys(normalized_query.split()))
+            spec = SnippetFilter.from_dict(filters or {})
+            if not tokens and not spec.active:
+                hits = iter(snippets)
+            else:
+                hits = (
+                    snippet
+                    for snippet, fields in self._search_candidates(snippets, "".join(tokens))
+                    if self._snippet_matches_filters(snippet, fields, tokens, spec)
+                )
+            start = max(0, int(offset or 0))
+            if limit is None:
+                results = list(islice(hits, start, None))
+                return {
+                    "status": "success",
+                    "results": results,
+                    "count": len(results),
+                    "total": len(snippets),
+                }
+            results = list(islice(hits, start, start + max(0, int(limit))))
             return {
                 "status": "success",
                 "results": results,
                 "count": len(results),
                 "total": len(snippets),
+                "has_more": next(hits, None) is not None,
             }
         except Exception as exc:
             return {"status": "error", "detail": f"Failed to search snippets: {exc}"}
@@ -1531,24 +2118,24 @@ class EspansoAPI:
         base_file = self._paths.match / "base.yml"
         try:
             # Validate YAML syntax before saving
-            self.yaml_processor.load_str(content)
+            parsed = self.yaml_processor.load_str(content)
 
             # Create backup before saving
             if base_file.exists():
-                backup_dir = self._editor_backup_dir()
-                backup_file = backup_dir / f"base.yml.{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.bak"
-                backup_file.write_text(base_file.read_text(encoding="utf-8"), encoding="utf-8")
+                self._write_base_backup(base_file)
 
             # Save new content
-            base_file.write_text(content, encoding="utf-8")
+            _atomic_write_text(base_file, content)
+            self._remember_yaml(base_file, parsed, content)
 
             # Refresh snippets cache
+            self._invalidate_matches()
             self.refresh_files()
 
-            # Reload espanso to apply changes
-            self.cli.run(["restart"])
+            # Reload espanso in the background once edits settle so the editor is not blocked
+            self._schedule_restart()
 
-            return {"status": "success", "detail": f"Saved and reloaded Espanso"}
+            return {"status": "success", "detail": "Saved; Espanso reload queued"}
         except Exception as exc:
             return {"status": "error", "detail": f"Failed to save: {exc}"}
 
@@ -1611,7 +2198,7 @@ class EspansoAPI:
         else:
             match.pop("enabled", None)
 
-    def create_snippet(self, snippet_data: Dict[str, Any]) -> Dict[str, str]:
+    def create_snippet(self, snippet_data: Dict[str, Any], restart_now: bool = False) -> Dict[str, str]:
         """Create a new snippet in base.yml."""
         try:
             trigger = (snippet_data.get("trigger") or "").strip()
@@ -1626,13 +2213,14 @@ class EspansoAPI:
 
             # Load existing content
             if base_file.exists():
-                data = self.yaml_processor.load(base_file)
+                data = self._load_yaml_cached(base_file)
             else:
                 data = {"matches": []}
 
             # Ensure match list exists
             matches = data.setdefault("matches", [])
-            if any(match.get("trigger") == trigger for match in matches):
+            trigger_index = self._trigger_index(base_file, matches)
+            if trigger in trigger_index:
                 return {"status": "error", "detail": f"Snippet '{trigger}' already exists"}
 
             # Build new match object
@@ -1642,27 +2230,34 @@ class EspansoAPI:
             matches.append(new_match)
 
             # Save back to file
-            backup_dir = self._editor_backup_dir()
-            backup_file = backup_dir / f"base.yml.{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.bak"
+            cached = None
             if base_file.exists():
-                backup_file.write_text(base_file.read_text(encoding="utf-8"), encoding="utf-8")
-
-            import yaml
-
-            base_file.write_text(
-                yaml.safe_dump(data, sort_keys=False, allow_unicode=True),
-                encoding="utf-8",
-            )
+                cached = self._yaml_cache.get(base_file)
+                self._write_base_backup(base_file)
+
+            # Append just the new entry when the file layout allows it (keeps comments/formatting);
+            # the appended text still goes through the atomic writer, never an in-place "a" open
+            fragment = _match_append_fragment(cached[2], new_match) if cached is not None else None
+            if fragment is not None:
+                text = cached[2] + fragment
+            else:
+                text = yaml.dump(data, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
+            _atomic_write_text(base_file, text)
+            trigger_index[trigger] = [len(matches) - 1]
+            self._remember_yaml(base_file, data, text, trigger_index)
 
             # Refresh and reload
+            self._invalidate_matches()
             self.refresh_files()
-            self.cli.run(["restart"])
+            self._request_restart(restart_now)
 
             return {"status": "success", "detail": f"Created snippet '{trigger}'"}
         except Exception as exc:
             return {"status": "error", "detail": f"Failed to create snippet: {exc}"}
 
-    def update_snippet(self, original_trigger: str, snippet_data: Dict[str, Any]) -> Dict[str, str]:
+    def update_snippet(
+        self, original_trigger: str, snippet_data: Dict[str, Any], restart_now: bool = False
+    ) -> Dict[str, Any]:
         """Update an existing snippet in base.yml."""
         try:
             base_file = self._paths.match / "base.yml"
@@ -1670,7 +2265,7 @@ class EspansoAPI:
             if not base_file.exists():
                 return {"status": "error", "detail": "base.yml not found"}
 
-            data = self.yaml_processor.load(base_file)
+            data = self._load_yaml_cached(base_file)
 
             trigger = (snippet_data.get("trigger") or "").strip()
             replace = self._normalize_replace_text(
@@ -1681,43 +2276,42 @@ class EspansoAPI:
                 return {"status": "error", "detail": "Trigger and replacement are required"}
 
             # Find the match to update
-            found = False
-            for match in data.get("matches", []):
-                if match.get("trigger") == original_trigger:
-                    # Update fields
-                    match["trigger"] = trigger
-                    match["replace"] = replace
+            matches = data.get("matches", [])
+            trigger_index = self._trigger_index(base_file, matches)
+            positions = trigger_index.get(original_trigger)
+            if not positions:
+                return {"status": "error", "detail": f"Snippet '{original_trigger}' not found"}
 
-                    # Update optional properties
-                    self._assign_snippet_optional_fields(match, snippet_data)
+            match = dict(matches[positions[0]])
+            match["trigger"] = trigger
+            match["replace"] = replace
 
-                    found = True
-                    break
+            # Update optional properties
+            self._assign_snippet_optional_fields(match, snippet_data)
 
-            if not found:
-                return {"status": "error", "detail": f"Snippet '{original_trigger}' not found"}
+            # Idempotent saves skip the backup, write, refresh and restart
+            if match == matches[positions[0]]:
+                return {"status": "success", "detail": f"No changes to snippet '{trigger}'", "unchanged": True}
+            matches[positions[0]] = match
 
             # Save back to file
-            backup_dir = self._editor_backup_dir()
-            backup_file = backup_dir / f"base.yml.{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.bak"
-            backup_file.write_text(base_file.read_text(encoding="utf-8"), encoding="utf-8")
-
-            import yaml
+            self._write_base_backup(base_file)
 
-            base_file.write_text(
-                yaml.safe_dump(data, sort_keys=False, allow_unicode=True),
-                encoding="utf-8",
-            )
+            text = yaml.dump(data, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
+            _atomic_write_text(base_file, text)
+            # Positions are unchanged unless the trigger itself was renamed
+            self._remember_yaml(base_file, data, text, trigger_index if trigger == original_trigger else None)
 
             # Refresh and reload
+            self._invalidate_matches()
             self.refresh_files()
-            self.cli.run(["restart"])
+            self._request_restart(restart_now)
 
             return {"status": "success", "detail": f"Updated snippet '{trigger}'"}
         except Exception as exc:
             return {"status": "error", "detail": f"Failed to update snippet: {exc}"}
 
-    def delete_snippet(self, trigger: str) -> Dict[str, str]:
+    def delete_snippet(self, trigger: str, restart_now: bool = False) -> Dict[str, str]:
         """Delete a snippet from base.yml."""
         try:
             base_file = self._paths.match / "base.yml"
@@ -1725,26 +2319,27 @@ class EspansoAPI:
             if not base_file.exists():
                 return {"status": "error", "detail": "base.yml not found"}
 
-            data = self.yaml_processor.load(base_file)
+            data = self._load_yaml_cached(base_file)
 
-            # Filter out the match
-            original_count = len(data.get("matches", []))
-            data["matches"] = [m for m in data.get("matches", []) if m.get("trigger") != trigger]
-
-            if len(data["matches"]) == original_count:
+            # Remove every match with this trigger
+            matches = data.get("matches", [])
+            positions = self._trigger_index(base_file, matches).get(trigger)
+            if not positions:
                 return {"status": "error", "detail": f"Snippet '{trigger}' not found"}
+            for position in reversed(positions):
+                del matches[position]
 
             # Save back to file
-            import yaml
-            backup_dir = self._editor_backup_dir()
-            backup_file = backup_dir / f"base.yml.{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.bak"
-            backup_file.write_text(base_file.read_text(encoding="utf-8"), encoding="utf-8")
+            self._write_base_backup(base_file)
 
-            base_file.write_text(yaml.dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+            text = yaml.dump(data, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
+            _atomic_write_text(base_file, text)
+            self._remember_yaml(base_file, data, text)
 
             # Refresh and reload
+            self._invalidate_matches()
             self.refresh_files()
-            self.cli.run(["restart"])
+            self._request_restart(restart_now)
 
             return {"status": "success", "detail": f"Deleted snippet '{trigger}'"}
         except Exception as exc:
@@ -1758,7 +2353,7 @@ class EspansoAPI:
             if not base_file.exists():
                 return {"status": "error", "detail": "base.yml not found"}
 
-            data = self.yaml_processor.load(base_file)
+            data = self._load_yaml_cached(base_file, mutable=False)
 
             for match in data.get("matches", []):
                 if match.get("trigger") == trigger:
@@ -1788,86 +2383,26 @@ class EspansoAPI:
 
     def get_variable_types(self) -> List[Dict[str, Any]]:
         """Get all supported variable types with their metadata."""
-        return [
-            {
-                "type": "date",
-                "label": "Date/Time",
-                "icon": "📅",
-                "params": ["format", "offset"],
-                "description": "Insert formatted timestamp with optional offsets.",
-            },
-            {
-                "type": "clipboard",
-                "label": "Clipboard",
-                "icon": "📋",
-                "params": ["fallback"],
-                "description": "Expand to the current clipboard contents.",
-            },
-            {
-                "type": "random",
-                "label": "Random Choice",
-                "icon": "🎲",
-                "params": ["choices"],
-                "description": "Pick a random option from a provided list.",
-            },
-            {
-                "type": "shell",
-                "label": "Shell Command",
-                "icon": "💻",
-                "params": ["cmd", "shell"],
-                "description": "Execute a shell command and inject the output.",
-            },
-            {
-                "type": "script",
-                "label": "Script",
-                "icon": "📜",
-                "params": ["args"],
-                "description": "Call an external script/binary with arguments.",
-            },
-            {
-                "type": "echo",
-                "label": "Echo Prompt",
-                "icon": "💬",
-                "params": ["prompt"],
-                "description": "Prompt the user for free-form text when expanding.",
-            },
-            {
-                "type": "choice",
-                "label": "User Choice",
-                "icon": "🎯",
-                "params": ["values"],
-                "description": "Present a list of options for the user to select.",
-            },
-            {
-                "type": "form",
-                "label": "Form Input",
-                "icon": "📝",
-                "params": ["fields"],
-                "description": "Build multi-field forms for advanced snippets.",
-            },
-            {
-                "type": "match",
-                "label": "Match Reference",
-                "icon": "🔗",
-                "params": ["trigger"],
-                "description": "Reference another match's output inline.",
-            },
-        ]
+        return _VARIABLE_TYPE_OPTIONS
 
     def list_snippet_variables(self) -> List[Dict[str, Any]]:
         """Get all variables from all snippets for the variable library."""
         self._populate_matches()
+        # Reuse the last result while the match cache is the same list object
+        cached = self._variables_cache
+        if cached is not None and cached[0] is self._match_cache:
+            return cached[1]
+
         global_vars = []
-        seen = set()
+        seen: set[Tuple[str, str]] = set()
 
         for match in self._match_cache:
-            var_list = match.get("vars") or match.get("variables") or []
-            for var in var_list:
+            for var in match.get("vars") or match.get("variables") or ():
                 name = var.get("name")
                 var_type = var.get("type")
                 if not name or not var_type:
                     continue
-                var_key = f"{name}:{var_type}"
+                var_key = (name, var_type)
                 if var_key in seen:
                     continue
                 seen.add(var_key)
@@ -1878,9 +2413,49 @@ class EspansoAPI:
                     "source_snippet": match.get("trigger", "unknown")
                 })
 
+        self._variables_cache = (self._match_cache, global_vars)
         return global_vars
 
-    def create_backup(self) -> Dict[str, Any]:
+    def create_backup(self, human_readable: bool = False) -> Dict[str, Any]:
+        """Archive every match/config YAML into one JSON file.
+
+        Compact JSON by default; `human_readable=True` pretty-prints with indent=2.
+        """
+        return self._do_create_backup(human_readable)
+
+    def create_backup_async(self, human_readable: bool = False) -> Dict[str, Any]:
+        """Start `create_backup` on a worker; poll `get_backup_status(job_id)` for the result."""
+        job_id = uuid.uuid4().hex
+        try:
+            future = self._backup_executor.submit(self._do_create_backup, human_readable)
+        except RuntimeError as exc:
+            # Executor already shut down
+            return {"status": "error", "detail": f"Backup unavailable: {exc}"}
+        with self._backup_jobs_lock:
+            # Pollers can go away (window reload); don't pin their results forever
+            finished = [key for key, job in self._backup_jobs.items() if job.done()]
+            for key in finished[: max(0, len(self._backup_jobs) - _BACKUP_JOB_HISTORY + 1)]:
+                del self._backup_jobs[key]
+            self._backup_jobs[job_id] = future
+        return {"status": "queued", "job_id": job_id}
+
+    def get_backup_status(self, job_id: str) -> Dict[str, Any]:
+        """Report a backup job started by `create_backup_async`; finished jobs are forgotten."""
+        with self._backup_jobs_lock:
+            future = self._backup_jobs.get(job_id)
+        if future is None:
+            return {"status": "error", "detail": "Unknown backup job"}
+        if not future.done():
+            return {"status": "pending", "job_id": job_id}
+        with self._backup_jobs_lock:
+            self._backup_jobs.pop(job_id, None)
+        try:
+            result = future.result()
+        except Exception as exc:
+            return {"status": "error", "job_id": job_id, "detail": f"Backup failed: {exc}"}
+        return {"status": "success", "job_id": job_id, **result}
+
+    def _do_create_backup(self, human_readable: bool = False) -> Dict[str, Any]:
         backup_dir = self._archive_backup_dir()
         payload = {
             "version": "1.0",
@@ -1888,20 +2463,35 @@ class EspansoAPI:
             "matchFiles": [],
             "configFiles": [],
         }
-        for file in self._paths.match.glob("*.yml"):
-            payload["matchFiles"].append({"name": file.name, "content": file.read_text(encoding="utf-8")})
-        if self._paths.config.exists():
-            for child in self._paths.config.rglob("*.yml"):
-                payload["configFiles"].append({"name": str(child.relative_to(self._paths.config)), "content": child.read_text(encoding="utf-8")})
-        backup_file = backup_dir / f"espanso-backup-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}.json"
-        backup_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        match_files = list(self._paths.match.glob("*.yml"))
+        config_files = list(self._paths.config.rglob("*.yml")) if self._paths.config.exists() else []
+        # Independent file reads overlap in the kernel instead of running back to back
+        workers = min(32, (os.cpu_count() or 1) * 4, max(1, len(match_files) + len(config_files)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="espanso-backup") as pool:
+            contents = list(pool.map(_read_utf8, match_files + config_files))
+        for file, content in zip(match_files, contents):
+            payload["matchFiles"].append({"name": file.name, "content": content})
+        for child, content in zip(config_files, contents[len(match_files):]):
+            payload["configFiles"].append({"name": str(child.relative_to(self._paths.config)), "content": content})
+        backup_file = backup_dir / f"espanso-backup-{_utc_stamp()}.json"
+        with backup_file.open("w", encoding="utf-8") as handle:
+            if human_readable:
+                json.dump(payload, handle, ensure_ascii=False, indent=2)
+            else:
+                json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
         return {"path": str(backup_file), "count": len(payload["matchFiles"]) + len(payload["configFiles"])}
 
     def restart_espanso(self) -> Dict[str, Any]:
-        result = self.cli.reload()
+        result = self._run_service_command(self.cli.reload)
         return {"message": result.stdout.strip() or result.stderr.strip() or "Restart issued"}
 
     def get_feature_catalog(self) -> Dict[str, Any]:
+        """Return the feature catalog, assembled once per process (its sources are static)."""
+        if self._feature_catalog_cache is None:
+            self._feature_catalog_cache = self._build_feature_catalog()
+        return self._feature_catalog_cache
+
+    def _build_feature_catalog(self) -> Dict[str, Any]:
         architecture = FeatureCatalog.describe_architecture()
         workflow = FeatureCatalog.describe_workflow()
         return {
@@ -1939,6 +2529,9 @@ def _log_gui_attempt(backend: Optional[str]) -> None:
 
 
 def _start_webview(window: Any, platform_info: PlatformInfo, script_path: Path) -> None:
+    # pywebview (and its GUI toolkit) is only loaded once a window is actually needed
+    import webview
+
     last_error: Optional[Exception] = None
     if platform_info.is_wsl:
         if _launch_windows_host_app(script_path):
@@ -2011,6 +2604,27 @@ def _wsl_to_windows_path(path: Path) -> Optional[str]:
     return None
 
 
+_REGEX_TEMPLATES: List[Dict[str, str]] = [
+    {"name": "Email Address", "pattern": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", "example": "user@example.com"},
+    {"name": "URL (HTTP/HTTPS)", "pattern": r"https?://[^\s]+", "example": "https://example.com"},
+    {"name": "Phone (US)", "pattern": r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", "example": "(555) 123-4567"},
+    {"name": "Date (YYYY-MM-DD)", "pattern": r"\d{4}-\d{2}-\d{2}", "example": "2025-11-21"},
+    {"name": "Date (MM/DD/YYYY)", "pattern": r"\d{2}/\d{2}/\d{4}", "example": "11/21/2025"},
+    {"name": "Time (24h)", "pattern": r"\d{2}:\d{2}", "example": "14:30"},
+    {"name": "IP Address (IPv4)", "pattern": r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}", "example": "192.168.1.1"},
+    {"name": "Credit Card", "pattern": r"\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}", "example": "1234-5678-9012-3456"},
+    {"name": "Hex Color", "pattern": r"#[0-9A-Fa-f]{6}", "example": "#FF5733"},
+    {"name": "Username (alphanumeric)", "pattern": r"^[a-zA-Z0-9_]{3,16}$", "example": "user_123"},
+    {"name": "UUID", "pattern": r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", "example": "550e8400-e29b-41d4-a716-446655440000"},
+    {"name": "Markdown Link", "pattern": r"\[([^\]]+)\]\(([^\)]+)\)", "example": "[text](url)"},
+]
+# Compiled once at import; validators use these instead of re-compiling the fixed set
+_COMPILED_REGEX_TEMPLATES: List[Tuple[str, "re.Pattern[str]", str]] = [
+    (template["name"], re.compile(template["pattern"]), template["example"])
+    for template in _REGEX_TEMPLATES
+]
+
+
 class ConfigHelpers:
     """Static utility methods for configuration validation and helpers."""
 
@@ -2036,20 +2650,12 @@ class ConfigHelpers:
     @staticmethod
     def get_regex_templates() -> List[Dict[str, str]]:
         """Return common regex pattern templates."""
-        return [
-            {"name": "Email Address", "pattern": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", "example": "user@example.com"},
-            {"name": "URL (HTTP/HTTPS)", "pattern": r"https?://[^\s]+", "example": "https://example.com"},
-            {"name": "Phone (US)", "pattern": r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}", "example": "(555) 123-4567"},
-            {"name": "Date (YYYY-MM-DD)", "pattern": r"\d{4}-\d{2}-\d{2}", "example": "2025-11-21"},
-            {"name": "Date (MM/DD/YYYY)", "pattern": r"\d{2}/\d{2}/\d{4}", "example": "11/21/2025"},
-            {"name": "Time (24h)", "pattern": r"\d{2}:\d{2}", "example": "14:30"},
-            {"name": "IP Address (IPv4)", "pattern": r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}", "example": "192.168.1.1"},
-            {"name": "Credit Card", "pattern": r"\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}", "example": "1234-5678-9012-3456"},
-            {"name": "Hex Color", "pattern": r"#[0-9A-Fa-f]{6}", "example": "#FF5733"},
-            {"name": "Username (alphanumeric)", "pattern": r"^[a-zA-Z0-9_]{3,16}$", "example": "user_123"},
-            {"name": "UUID", "pattern": r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", "example": "550e8400-e29b-41d4-a716-446655440000"},
-            {"name": "Markdown Link", "pattern": r"\[([^\]]+)\]\(([^\)]+)\)", "example": "[text](url)"},
-        ]
+        return _REGEX_TEMPLATES
+
+    @staticmethod
+    def get_compiled_regex_templates() -> List[Tuple[str, "re.Pattern[str]", str]]:
+        """Return (name, compiled pattern, example) for the regex templates."""
+        return _COMPILED_REGEX_TEMPLATES
 
     @staticmethod
     def suggest_import_fixes(config_dir: Path) -> List[Dict[str, str]]:
@@ -2061,9 +2667,8 @@ class ConfigHelpers:
             if not config_file.exists():
                 return []
 
-            import yaml
             with open(config_file, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f) or {}
+                config_data = yaml.load(f, Loader=_YamlLoader) or {}
 
             # Check imports
             imports = config_data.get("imports", [])
@@ -2096,6 +2701,8 @@ def main() -> None:
     - Restore from tray (click icon or menu)
     - Espanso status in tray menu
     """
+    import webview
+
     print("[DEBUG] EspansoAPI init starting", flush=True)
     api = EspansoAPI()
     print("[DEBUG] EspansoAPI init complete", flush=True)
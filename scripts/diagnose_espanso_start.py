@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import shutil
 import subprocess
 import sys
 import time
+from pathlib import Path
 from typing import Tuple
 
+# Run as `python scripts/diagnose_espanso_start.py`; make the repo's packages importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.cli_adapter import kill_tree  # noqa: E402
+
 
 def _wsl_to_windows(path: str) -> str:
     if not path.startswith("/mnt/"):
@@ -20,8 +28,13 @@ def _wsl_to_windows(path: str) -> str:
     return f"{drive}:\\{tail}"
 
 
+@functools.lru_cache(maxsize=1)
 def find_espanso_command() -> Tuple[str, ...]:
-    """Return the executable command for the Espanso CLI."""
+    """Return the executable command for the Espanso CLI.
+
+    The PATH scan is cached; call `invalidate_cli_cache()` after installing or
+    moving Espanso.
+    """
     for name in ("espanso", "espanso.exe", "espanso.cmd"):
         path = shutil.which(name)
         if path:
@@ -31,21 +44,53 @@ def find_espanso_command() -> Tuple[str, ...]:
     raise RuntimeError("Espanso CLI not found on PATH")
 
 
+def invalidate_cli_cache() -> None:
+    """Forget the cached `find_espanso_command()` result."""
+    find_espanso_command.cache_clear()
+
+
 def run_cli_command(timeout: int = 30) -> None:
     cmd = find_espanso_command()
     print(f"[DEBUG] Running: {' '.join(cmd)}")
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    # Own process group/session so a timeout can take down grandchildren too
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=(os.name != "nt"),
+        creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0,
+    )
+    started = time.perf_counter()
+    deadline = started + timeout
     try:
-        stdout, stderr = proc.communicate(timeout=timeout)
-        print(f"[INFO] Completed in {time.perf_counter():.1f}s (returncode={proc.returncode})")
+        while True:
+            # communicate() may be retried after a timeout; wake each second to report progress
+            try:
+                stdout, stderr = proc.communicate(timeout=max(0.0, min(1.0, deadline - time.perf_counter())))
+                break
+            except subprocess.TimeoutExpired:
+                if time.perf_counter() >= deadline:
+                    raise
+                print(f"[INFO] Still waiting... {time.perf_counter() - started:.0f}s", flush=True)
+        print(f"[INFO] Completed in {time.perf_counter() - started:.1f}s (returncode={proc.returncode})")
         if stdout:
             print("[STDOUT]\n" + stdout.strip())
         if stderr:
             print("[STDERR]\n" + stderr.strip())
     except subprocess.TimeoutExpired:
-        proc.kill()
-        stdout, stderr = proc.communicate()
-        print(f"[WARN] Command timed out after {timeout}s (killed).")
+        kill_tree(proc.pid)
+        try:
+            # Grandchildren holding the pipes are gone now; never wait unbounded
+            stdout, stderr = proc.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            for pipe in (proc.stdout, proc.stderr):
+                if pipe:
+                    pipe.close()
+            proc.kill()
+            proc.wait(timeout=5)
+            stdout, stderr = "", ""
+        print(f"[WARN] Command timed out after {timeout}s (process tree killed).")
         if stdout:
             print("[STDOUT]\n" + stdout.strip())
         if stderr:
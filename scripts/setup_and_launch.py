@@ -8,22 +8,123 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import urllib.error
 import urllib.request
 
 from pathlib import Path
 
 
 WEBVIEW2_URL = "https://go.microsoft.com/fwlink/p/?LinkId=2124703"
+# Resolved once; the script calls it from several setup steps
+_SYSTEM = platform.system()
+
+REQUIREMENTS_FILE = Path("requirements.txt")
+PROVISIONED_MARKER = Path(".venv-provisioned")
+
+
+def _requirements_current() -> bool:
+    """True when this interpreter was provisioned after requirements.txt last changed."""
+    try:
+        marker_mtime = PROVISIONED_MARKER.stat().st_mtime
+        provisioned_for = PROVISIONED_MARKER.read_text(encoding="utf-8").strip()
+        return provisioned_for == sys.executable and REQUIREMENTS_FILE.stat().st_mtime <= marker_mtime
+    except OSError:
+        return False
 
 
 def install_requirements() -> None:
+    if _requirements_current():
+        print("Python requirements already installed; skipping.")
+        return
     print("Installing Python requirements...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    if shutil.which("uv"):
+        subprocess.check_call(["uv", "pip", "install", "-r", str(REQUIREMENTS_FILE), "--python", sys.executable])
+    else:
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", "--upgrade", "pip", "-r", str(REQUIREMENTS_FILE)]
+        )
+    PROVISIONED_MARKER.write_text(sys.executable, encoding="utf-8")
+
+
+def _resume_validator(headers) -> str | None:
+    """Value for `If-Range`: a strong ETag, else Last-Modified (weak ETags are not allowed)."""
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def _download(url: str, dest: Path, chunk_size: int = 1 << 20) -> None:
+    """Stream `url` to `dest`, resuming a previous partial download.
+
+    Data lands in `dest.part` and is renamed into place once complete, so an
+    interrupted run never leaves a truncated installer at `dest`. The ETag or
+    Last-Modified of the first response is kept next to it and sent back as
+    `If-Range`, so a file that changed on the server is fetched from scratch
+    instead of being spliced onto stale bytes.
+    """
+    part = dest.with_name(dest.name + ".part")
+    validator_file = dest.with_name(dest.name + ".part.validator")
+    offset = part.stat().st_size if part.exists() else 0
+    try:
+        validator = validator_file.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        validator = None
+    if not validator:
+        # Can't tell whether the partial bytes still match the server's file
+        offset = 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+        request.add_header("If-Range", validator)
+
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as exc:
+        if exc.code != 416 or not offset:
+            raise
+        # Range not satisfiable: either `.part` is already complete or it is junk
+        content_range = exc.headers.get("Content-Range", "")
+        complete = content_range.startswith("bytes */") and content_range[8:].strip() == str(offset)
+        exc.close()
+        if complete:
+            validator_file.unlink(missing_ok=True)
+            os.replace(part, dest)
+            return
+        part.unlink(missing_ok=True)
+        validator_file.unlink(missing_ok=True)
+        return _download(url, dest, chunk_size)
+
+    with response:
+        if offset and response.status != 206:
+            # 200: the file changed (If-Range mismatch) or ranges are unsupported; start over
+            offset = 0
+        if not offset:
+            new_validator = _resume_validator(response.headers)
+            if new_validator:
+                validator_file.write_text(new_validator, encoding="utf-8")
+            else:
+                validator_file.unlink(missing_ok=True)
+        length = response.headers.get("Content-Length")
+        total = offset + int(length) if length else None
+        done = offset
+        with part.open("ab" if offset else "wb") as handle:
+            while True:
+                chunk = response.read(chunk_size)
+                if not chunk:
+                    break
+                handle.write(chunk)
+                done += len(chunk)
+                if total:
+                    print(f"\r  {done * 100 // total:3d}% ({done >> 20} MiB)", end="", file=sys.stderr, flush=True)
+    if total:
+        print(file=sys.stderr)
+    validator_file.unlink(missing_ok=True)
+    os.replace(part, dest)
 
 
 def ensure_webview2() -> None:
-    if platform.system() != "Windows":
+    if _SYSTEM != "Windows":
         return
 
     possible = [
@@ -35,7 +136,7 @@ def ensure_webview2() -> None:
 
     print("Downloading WebView2 runtime...")
     dest = Path(tempfile.gettempdir()) / "MicrosoftEdgeWebView2RuntimeInstaller.exe"
-    urllib.request.urlretrieve(WEBVIEW2_URL, dest)
+    _download(WEBVIEW2_URL, dest)
     print("Running WebView2 runtime installer, please approve any UAC prompts...")
     subprocess.check_call([str(dest)])
     try:
@@ -46,7 +147,7 @@ def ensure_webview2() -> None:
 
 def select_backend_env() -> dict[str, str]:
     env = os.environ.copy()
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         env.setdefault("PYWEBVIEW_GUI", "winforms")
     return env
 
@@ -1,29 +1,40 @@
 # smoke_check.py - safe smoke test for espansogui shim
+#
+# By default only parses espansogui.py (no pywebview/YAML stack is loaded).
+# Pass --full to import the module and instantiate EspansoAPI as well.
 from pathlib import Path
+import ast
 import importlib
 import sys
 import traceback
 
 p = Path('espansogui.py').resolve()
 print('espansogui path:', p)
-mod_name = 'espansogui'
-importlib.invalidate_caches()
-# ensure a clean import
-if mod_name in sys.modules:
-    del sys.modules[mod_name]
 
-try:
-    esp = importlib.import_module(mod_name)
-    print('_prepare_gui_environment exists:', hasattr(esp, '_prepare_gui_environment'))
-    print('_start_webview exists:', hasattr(esp, '_start_webview'))
+tree = ast.parse(p.read_text(encoding='utf-8'), filename=str(p))
+functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+classes = {node.name for node in tree.body if isinstance(node, ast.ClassDef)}
+print('_prepare_gui_environment exists:', '_prepare_gui_environment' in functions)
+print('_start_webview exists:', '_start_webview' in functions)
+print('EspansoAPI defined:', 'EspansoAPI' in classes)
+
+if '--full' in sys.argv[1:]:
+    mod_name = 'espansogui'
+    importlib.invalidate_caches()
+    # ensure a clean import
+    if mod_name in sys.modules:
+        del sys.modules[mod_name]
+
     try:
-        api = esp.EspansoAPI()
-        print('EspansoAPI instantiated:', type(api))
-        for a in ['list_snippets', 'search_snippets', 'platform']:
-            print(f'has {a}:', hasattr(api, a))
+        esp = importlib.import_module(mod_name)
+        try:
+            api = esp.EspansoAPI()
+            print('EspansoAPI instantiated:', type(api))
+            for a in ['list_snippets', 'search_snippets', 'platform']:
+                print(f'has {a}:', hasattr(api, a))
+        except Exception as e:
+            print('EspansoAPI instantiation FAILED:', e)
+            traceback.print_exc()
     except Exception as e:
-        print('EspansoAPI instantiation FAILED:', e)
+        print('Import failed:', e)
         traceback.print_exc()
-except Exception as e:
-    print('Import failed:', e)
-    traceback.print_exc()
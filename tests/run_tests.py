@@ -1,21 +1,28 @@
-import importlib.util
-import inspect
+import importlib
+import os
 import pathlib
 import sys
 
 ROOT = pathlib.Path(__file__).parent
 sys.path.insert(0, str(ROOT.parent))
+# Test modules are imported by name so each is loaded once and cached in sys.modules
+sys.path.insert(0, str(ROOT))
 
 failed = 0
 passed = 0
 
-for path in sorted(ROOT.glob('test_*.py')):
-    name = path.stem
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    for obj_name, obj in inspect.getmembers(module):
-        if obj_name.startswith('test_') and inspect.isfunction(obj):
+with os.scandir(ROOT) as entries:
+    names = sorted(
+        entry.name[:-3]
+        for entry in entries
+        if entry.is_file() and entry.name.startswith('test_') and entry.name.endswith('.py')
+    )
+
+for name in names:
+    module = importlib.import_module(name)
+    for obj_name, obj in list(vars(module).items()):
+        # Filter on the name first; only then touch the object
+        if obj_name.startswith('test_') and callable(obj) and getattr(obj, '__module__', None) == name:
             try:
                 obj()
                 print(f"PASS: {name}.{obj_name}")
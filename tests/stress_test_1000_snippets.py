@@ -2,11 +2,19 @@
 Stress Test: 1000+ Snippet Performance
 Tests application performance and stability under high load
 """
+import contextlib
+import os
 import tempfile
 import time
 from pathlib import Path
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:  # optional; only speeds up writing the report
+    orjson = None
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,6 +24,13 @@ from core.backup_manager import BackupManager
 from core.watcher_manager import WatcherManager
 
 
+def _dump_report(report_data):
+    """Serialize the report as indented UTF-8 JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(report_data, indent=2).encode("utf-8")
+
+
 def print_result(test_name, duration, status="PASS"):
     """Print formatted test result"""
     print(f"[{status}] {test_name}: {duration:.2f}s")
@@ -23,7 +38,7 @@ def print_result(test_name, duration, status="PASS"):
 
 def stress_test_create_1000_snippets():
     """
-    Stress Test 1: Create 1000 snippets sequentially
+    Stress Test 1: Create 1000 snippets via the bulk API (batches of 100)
     Target: < 2 minutes (120s)
     """
     print("\n" + "="*60)
@@ -42,22 +57,24 @@ def stress_test_create_1000_snippets():
         start_time = time.time()
         failed = 0
 
-        print(f"Creating 1000 snippets...")
-        for i in range(1000):
-            snippet = {
+        snippets = [
+            {
                 "trigger": f":stress{i:04d}",
                 "replace": f"Stress test snippet #{i}",
                 "label": f"Stress Test {i}"
             }
-            result = store.create_snippet(snippet)
-            if result["status"] != "success":
-                failed += 1
+            for i in range(1000)
+        ]
+
+        print(f"Creating 1000 snippets...")
+        for offset in range(0, 1000, 100):
+            results = store.create_snippets_bulk(snippets[offset:offset + 100])
+            failed += sum(1 for result in results if result["status"] != "success")
 
             # Progress indicator every 100 snippets
-            if (i + 1) % 100 == 0:
-                elapsed = time.time() - start_time
-                rate = (i + 1) / elapsed
-                print(f"  Progress: {i+1}/1000 ({rate:.1f} snippets/sec)")
+            elapsed = time.time() - start_time
+            rate = (offset + 100) / elapsed
+            print(f"  Progress: {offset+100}/1000 ({rate:.1f} snippets/sec)")
 
         duration = time.time() - start_time
 
@@ -73,6 +90,44 @@ def stress_test_create_1000_snippets():
         return {"duration": duration, "failed": failed, "passed": failed == 0}
 
 
+def stress_test_create_single_snippet_latency():
+    """
+    Stress Test 1b: Per-call latency of create_snippet (100 sequential creates)
+    Target: < 0.5s average
+    """
+    print("\n" + "="*60)
+    print("Stress Test 1b: Single Snippet Create Latency")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        match_dir = Path(tmpdir) / "match"
+        match_dir.mkdir(parents=True)
+
+        base_file = match_dir / "base.yml"
+        base_file.write_text("matches: []\n", encoding="utf-8")
+
+        store = SnippetStore(match_dir)
+
+        failed = 0
+        start_time = time.time()
+        for i in range(100):
+            result = store.create_snippet({"trigger": f":single{i:03d}", "replace": f"Single {i}"})
+            if result["status"] != "success":
+                failed += 1
+        duration = time.time() - start_time
+        avg_latency = duration / 100
+
+        print(f"\nResults:")
+        print(f"  Creates: 100")
+        print(f"  Failed: {failed}")
+        print(f"  Average latency: {avg_latency*1000:.2f}ms")
+
+        status = "PASS" if avg_latency < 0.5 and failed == 0 else "SLOW" if failed == 0 else "FAIL"
+        print_result("Single create latency", duration, status)
+
+        return {"avg_latency": avg_latency, "failed": failed, "passed": failed == 0}
+
+
 def stress_test_list_1000_snippets():
     """
     Stress Test 2: List 1000 snippets
@@ -88,10 +143,10 @@ def stress_test_list_1000_snippets():
 
         # Create 1000 snippets quickly
         base_file = match_dir / "base.yml"
-        yaml_content = "matches:\n"
-        for i in range(1000):
-            yaml_content += f"  - trigger: ':list{i:04d}'\n    replace: 'List test {i}'\n"
-        base_file.write_text(yaml_content, encoding="utf-8")
+        parts = ["matches:\n"]
+        parts.extend(f"  - trigger: ':list{i:04d}'\n    replace: 'List test {i}'\n" for i in range(1000))
+        yaml_content = "".join(parts)
+        base_file.write_bytes(yaml_content.encode("utf-8"))
 
         store = SnippetStore(match_dir)
 
@@ -146,12 +201,15 @@ def stress_test_search_1000_snippets():
 
         # Create diverse snippets
         base_file = match_dir / "base.yml"
-        yaml_content = "matches:\n"
         categories = ["email", "code", "text", "date", "url"]
+        # Title-case each category once instead of once per generated line
+        titled = [(category, category.title()) for category in categories]
+        parts = ["matches:\n"]
         for i in range(1000):
-            category = categories[i % len(categories)]
-            yaml_content += f"  - trigger: ':{category}{i:04d}'\n    replace: '{category.title()} snippet {i}'\n"
-        base_file.write_text(yaml_content, encoding="utf-8")
+            category, title = titled[i % len(titled)]
+            parts.append(f"  - trigger: ':{category}{i:04d}'\n    replace: '{title} snippet {i}'\n")
+        yaml_content = "".join(parts)
+        base_file.write_bytes(yaml_content.encode("utf-8"))
 
         store = SnippetStore(match_dir)
         snippets = store.list_snippets()
@@ -161,35 +219,35 @@ def stress_test_search_1000_snippets():
         # Test 1: Exact trigger match
         print("Test 1: Exact trigger match...")
         start_time = time.time()
-        results = [s for s in snippets if s.get("trigger") == ":email0500"]
+        results = store.search(":email0500", mode="exact")
         exact_time = time.time() - start_time
         print(f"  Found {len(results)} results in {exact_time:.4f}s")
 
         # Test 2: Prefix search
         print("\nTest 2: Prefix search (email*)...")
         start_time = time.time()
-        results = [s for s in snippets if s.get("trigger", "").startswith(":email")]
+        results = store.search(":email", mode="prefix")
         prefix_time = time.time() - start_time
         print(f"  Found {len(results)} results in {prefix_time:.4f}s")
 
         # Test 3: Contains search
         print("\nTest 3: Contains search (code)...")
         start_time = time.time()
-        results = [s for s in snippets if "code" in s.get("trigger", "").lower() or "code" in s.get("replace", "").lower()]
+        results = store.search("code")
         contains_time = time.time() - start_time
         print(f"  Found {len(results)} results in {contains_time:.4f}s")
 
         # Test 4: Multi-field search
         print("\nTest 4: Multi-field search (snippet 0100)...")
         start_time = time.time()
-        results = [s for s in snippets if "0100" in s.get("trigger", "") or "0100" in s.get("replace", "")]
+        results = store.search("0100")
         multifield_time = time.time() - start_time
         print(f"  Found {len(results)} results in {multifield_time:.4f}s")
 
         # Test 5: Regex-style search
         print("\nTest 5: Complex filter (trigger starts with :date and contains 05)...")
         start_time = time.time()
-        results = [s for s in snippets if s.get("trigger", "").startswith(":date") and "05" in s.get("trigger", "")]
+        results = [s for s in store.search(":date", mode="prefix") if "05" in s["trigger"]]
         complex_time = time.time() - start_time
         print(f"  Found {len(results)} results in {complex_time:.4f}s")
 
@@ -222,10 +280,13 @@ def stress_test_backup_1000_snippets():
 
         # Create large config
         base_file = match_dir / "base.yml"
-        yaml_content = "matches:\n"
-        for i in range(1000):
-            yaml_content += f"  - trigger: ':backup{i:04d}'\n    replace: 'Backup test snippet {i}'\n    label: 'Backup {i}'\n"
-        base_file.write_text(yaml_content, encoding="utf-8")
+        parts = ["matches:\n"]
+        parts.extend(
+            f"  - trigger: ':backup{i:04d}'\n    replace: 'Backup test snippet {i}'\n    label: 'Backup {i}'\n"
+            for i in range(1000)
+        )
+        yaml_content = "".join(parts)
+        base_file.write_bytes(yaml_content.encode("utf-8"))
 
         file_size_mb = len(yaml_content) / (1024 * 1024)
         print(f"Config file size: {file_size_mb:.2f} MB")
@@ -287,12 +348,12 @@ def stress_test_file_size_limits():
         # Create massive file
         print("Creating file with 5000 snippets...")
         base_file = match_dir / "base.yml"
-        yaml_content = "matches:\n"
-        for i in range(5000):
-            yaml_content += f"  - trigger: ':huge{i:05d}'\n    replace: 'Very large file test {i}'\n"
+        parts = ["matches:\n"]
+        parts.extend(f"  - trigger: ':huge{i:05d}'\n    replace: 'Very large file test {i}'\n" for i in range(5000))
+        yaml_content = "".join(parts)
 
         start_time = time.time()
-        base_file.write_text(yaml_content, encoding="utf-8")
+        base_file.write_bytes(yaml_content.encode("utf-8"))
         write_time = time.time() - start_time
 
         file_size_mb = len(yaml_content) / (1024 * 1024)
@@ -310,7 +371,6 @@ def stress_test_file_size_limits():
         print(f"  Rate: {len(snippets)/parse_time:.0f} snippets/sec")
 
         # Test memory efficiency (approximate)
-        import sys
         snippet_memory_kb = sys.getsizeof(snippets) / 1024
         print(f"  Memory usage: ~{snippet_memory_kb:.0f} KB")
 
@@ -333,70 +393,94 @@ def stress_test_concurrent_operations():
     print("Stress Test 6: Rapid Sequential Operations")
     print("="*60)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        match_dir = Path(tmpdir) / "match"
-        match_dir.mkdir(parents=True)
-
-        base_file = match_dir / "base.yml"
-        base_file.write_text("matches: []\n", encoding="utf-8")
-
-        store = SnippetStore(match_dir)
-
-        operations = []
-        errors = 0
-
-        print("Performing 100 rapid operations (create/update/delete)...")
-        start_time = time.time()
-
-        # Create 50 snippets
-        for i in range(50):
-            result = store.create_snippet({
-                "trigger": f":rapid{i:03d}",
-                "replace": f"Rapid test {i}"
-            })
-            operations.append(("create", result["status"]))
-            if result["status"] != "success":
-                errors += 1
-
-        # Update 25 snippets
-        for i in range(25):
-            result = store.update_snippet(f":rapid{i:03d}", {
-                "trigger": f":rapid{i:03d}",
-                "replace": f"Updated rapid test {i}"
-            })
-            operations.append(("update", result["status"]))
-            if result["status"] != "success":
-                errors += 1
-
-        # Delete 25 snippets
-        for i in range(25, 50):
-            result = store.delete_snippet(f":rapid{i:03d}")
-            operations.append(("delete", result["status"]))
-            if result["status"] != "success":
-                errors += 1
-
-        duration = time.time() - start_time
-
-        # Verify final state
-        store._match_cache = []
-        final_snippets = store.list_snippets()
-
-        print(f"\nResults:")
-        print(f"  Operations: {len(operations)}")
-        print(f"  Errors: {errors}")
-        print(f"  Time: {duration:.2f}s")
-        print(f"  Rate: {len(operations)/duration:.1f} ops/sec")
-        print(f"  Final snippet count: {len(final_snippets)}")
-        print(f"  Expected count: 25")
-
-        status = "PASS" if errors == 0 and len(final_snippets) == 25 else "FAIL"
-        print_result("Rapid operations", duration, status)
-
-        return {"duration": duration, "errors": errors, "passed": errors == 0 and len(final_snippets) == 25}
-
-
-def run_all_stress_tests():
-    """Run all stress tests and generate summary report"""
+    def run_operations(batched):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            match_dir = Path(tmpdir) / "match"
+            match_dir.mkdir(parents=True)
+
+            base_file = match_dir / "base.yml"
+            base_file.write_text("matches: []\n", encoding="utf-8")
+
+            store = SnippetStore(match_dir)
+
+            operations = []
+            errors = 0
+
+            start_time = time.time()
+
+            with store.batch() if batched else contextlib.nullcontext():
+                # Create 50 snippets
+                for i in range(50):
+                    result = store.create_snippet({
+                        "trigger": f":rapid{i:03d}",
+                        "replace": f"Rapid test {i}"
+                    })
+                    operations.append(("create", result["status"]))
+                    if result["status"] != "success":
+                        errors += 1
+
+                # Update 25 snippets
+                for i in range(25):
+                    result = store.update_snippet(f":rapid{i:03d}", {
+                        "trigger": f":rapid{i:03d}",
+                        "replace": f"Updated rapid test {i}"
+                    })
+                    operations.append(("update", result["status"]))
+                    if result["status"] != "success":
+                        errors += 1
+
+                # Delete 25 snippets
+                for i in range(25, 50):
+                    result = store.delete_snippet(f":rapid{i:03d}")
+                    operations.append(("delete", result["status"]))
+                    if result["status"] != "success":
+                        errors += 1
+
+            duration = time.time() - start_time
+
+            # Verify final state (drop the cache so the count reflects what was written)
+            store._match_cache = []
+            return len(operations), errors, duration, store.count()
+
+    print("Performing 100 rapid operations (create/update/delete), unbatched then batched...")
+    op_count, errors, duration, final_count = run_operations(batched=False)
+    _, batched_errors, batched_duration, batched_final_count = run_operations(batched=True)
+    errors += batched_errors
+
+    print(f"\nResults:")
+    print(f"  Operations: {op_count} (x2)")
+    print(f"  Errors: {errors}")
+    print(f"  Time (unbatched): {duration:.2f}s")
+    print(f"  Time (batched): {batched_duration:.2f}s")
+    print(f"  Rate (unbatched): {op_count/duration:.1f} ops/sec")
+    print(f"  Final snippet count: {final_count} unbatched, {batched_final_count} batched")
+    print(f"  Expected count: 25")
+
+    passed = errors == 0 and final_count == 25 and batched_final_count == 25
+    status = "PASS" if passed else "FAIL"
+    print_result("Rapid operations", duration, status)
+
+    return {"duration": duration, "batched_duration": batched_duration, "errors": errors, "passed": passed}
+
+
+STRESS_TESTS = {
+    "create": stress_test_create_1000_snippets,
+    "create_single": stress_test_create_single_snippet_latency,
+    "list": stress_test_list_1000_snippets,
+    "search": stress_test_search_1000_snippets,
+    "backup": stress_test_backup_1000_snippets,
+    "large_file": stress_test_file_size_limits,
+    "rapid_ops": stress_test_concurrent_operations,
+}
+
+
+def run_all_stress_tests(parallel=False):
+    """Run all stress tests and generate summary report
+
+    With `parallel=True` (``--parallel`` on the command line) the tests run in
+    separate processes: wall time drops to roughly the slowest test, but the
+    individual timings are noisier than in a sequential run.
+    """
     print("\n" + "="*70)
     print(" " * 20 + "ESPANSOGUI STRESS TEST SUITE")
     print("="*70)
@@ -408,12 +492,16 @@ def run_all_stress_tests():
     results = {}
 
     # Run all tests
-    results["create"] = stress_test_create_1000_snippets()
-    results["list"] = stress_test_list_1000_snippets()
-    results["search"] = stress_test_search_1000_snippets()
-    results["backup"] = stress_test_backup_1000_snippets()
-    results["large_file"] = stress_test_file_size_limits()
-    results["rapid_ops"] = stress_test_concurrent_operations()
+    if parallel:
+        # Each test works in its own temp dir, so they can share the machine;
+        # output interleaves and per-test timings include core contention.
+        with ProcessPoolExecutor(max_workers=min(len(STRESS_TESTS), os.cpu_count() or 1)) as pool:
+            futures = {pool.submit(fn): key for key, fn in STRESS_TESTS.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+    else:
+        for key, fn in STRESS_TESTS.items():
+            results[key] = fn()
 
     overall_duration = time.time() - overall_start
 
@@ -426,11 +514,12 @@ def run_all_stress_tests():
 
     print(f"\nTest Results:")
     print(f"  1. Create 1000 snippets:     {'PASS' if results['create']['passed'] else 'FAIL'} ({results['create']['duration']:.2f}s)")
+    print(f"  1b. Single create latency:  {'PASS' if results['create_single']['passed'] else 'FAIL'} ({results['create_single']['avg_latency']*1000:.2f}ms)")
     print(f"  2. List 1000 snippets:       {'PASS' if results['list']['passed'] else 'FAIL'} ({results['list']['first_load']:.2f}s)")
     print(f"  3. Search 1000 snippets:     {'PASS' if results['search']['passed'] else 'FAIL'} ({results['search']['avg_time']:.4f}s)")
     print(f"  4. Backup 1000 snippets:     {'PASS' if results['backup']['passed'] else 'FAIL'} ({results['backup']['backup_time'] + results['backup']['restore_time']:.2f}s)")
     print(f"  5. Large file (5000 items):  {'PASS' if results['large_file']['passed'] else 'FAIL'} ({results['large_file']['parse_time']:.2f}s)")
-    print(f"  6. Rapid operations:         {'PASS' if results['rapid_ops']['passed'] else 'FAIL'} ({results['rapid_ops']['duration']:.2f}s)")
+    print(f"  6. Rapid operations:         {'PASS' if results['rapid_ops']['passed'] else 'FAIL'} ({results['rapid_ops']['duration']:.2f}s, batched {results['rapid_ops']['batched_duration']:.2f}s)")
 
     print(f"\nOverall Status: {'ALL TESTS PASSED' if all_passed else 'SOME TESTS FAILED'}")
     print(f"Total execution time: {overall_duration:.2f}s ({overall_duration/60:.1f} minutes)")
@@ -443,12 +532,18 @@ def run_all_stress_tests():
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
         "overall_duration_seconds": overall_duration,
         "all_passed": all_passed,
+        "parallel": parallel,
         "tests": {
             "create_1000": {
                 "passed": results['create']['passed'],
                 "duration_seconds": results['create']['duration'],
                 "failed_count": results['create']['failed']
             },
+            "create_single_latency": {
+                "passed": results['create_single']['passed'],
+                "avg_latency_seconds": results['create_single']['avg_latency'],
+                "failed_count": results['create_single']['failed']
+            },
             "list_1000": {
                 "passed": results['list']['passed'],
                 "cold_cache_seconds": results['list']['first_load'],
@@ -471,12 +566,13 @@ def run_all_stress_tests():
             "rapid_operations_100": {
                 "passed": results['rapid_ops']['passed'],
                 "duration_seconds": results['rapid_ops']['duration'],
+                "batched_duration_seconds": results['rapid_ops']['batched_duration'],
                 "errors": results['rapid_ops']['errors']
             }
         }
     }
 
-    report_file.write_text(json.dumps(report_data, indent=2), encoding="utf-8")
+    report_file.write_bytes(_dump_report(report_data))
     print(f"Detailed results exported to: {report_file}")
     print("="*70 + "\n")
 
@@ -484,4 +580,4 @@ def run_all_stress_tests():
 
 
 if __name__ == "__main__":
-    sys.exit(run_all_stress_tests())
+    sys.exit(run_all_stress_tests(parallel="--parallel" in sys.argv[1:]))
@@ -1,5 +1,6 @@
 from core.backup_manager import BackupManager
 from pathlib import Path
+import os
 import tempfile
 
 
@@ -19,10 +20,89 @@ def test_backup_create_and_list_and_restore():
         assert (path / "a.txt").exists()
 
         items = bm.list_backups()
-        assert any(item["name"] == path.name for item in items)
+        assert any(item["name"] == path.name for item in items)
+        assert all(item["created"] > 0 for item in items)
 
         # restore to new target
         tgt = base / "restore"
         rt = bm.restore_backup(path.name, tgt)
         assert rt["status"] == "success"
         assert (tgt / "a.txt").exists()
+
+
+def test_backup_copies_unless_hard_link_requested():
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        src = base / "config"
+        src.mkdir()
+        (src / "a.txt").write_text("hello", encoding="utf-8")
+
+        bm = BackupManager(base / "backups")
+        copied = Path(bm.create_manual_backup(src, "copied")["path"])
+        linked = Path(bm.create_manual_backup(src, "linked", hard_link=True)["path"])
+
+        assert (copied / "a.txt").stat().st_ino != (src / "a.txt").stat().st_ino
+        assert (linked / "a.txt").stat().st_ino == (src / "a.txt").stat().st_ino
+
+        # In-place writes to the live config must not reach a default backup
+        with (src / "a.txt").open("a", encoding="utf-8") as fh:
+            fh.write(" world")
+        assert (copied / "a.txt").read_text(encoding="utf-8") == "hello"
+
+
+def test_compressed_backup_round_trip():
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        src = base / "config"
+        (src / "match").mkdir(parents=True)
+        (src / "match" / "base.yml").write_text("matches: []\n", encoding="utf-8")
+
+        bm = BackupManager(base / "backups")
+        res = bm.create_manual_backup(src, "packed", compress=True)
+        assert res["status"] == "success"
+        archive = Path(res["path"])
+        assert archive.is_file() and archive.name.startswith("packed.tar.")
+
+        assert any(item["name"] == "packed" for item in bm.list_backups())
+
+        tgt = base / "restore"
+        assert bm.restore_backup("packed", tgt)["status"] == "success"
+        assert (tgt / "match" / "base.yml").read_text(encoding="utf-8") == "matches: []\n"
+
+
+def test_backup_copies_nested_directories():
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        src = base / "config"
+        (src / "match" / "packages").mkdir(parents=True)
+        (src / "config").mkdir()
+        (src / "match" / "base.yml").write_text("matches: []\n", encoding="utf-8")
+        (src / "match" / "packages" / "pkg.yml").write_text("pkg", encoding="utf-8")
+        (src / "config" / "default.yml").write_text("cfg", encoding="utf-8")
+
+        bm = BackupManager(base / "backups")
+        backup = Path(bm.create_manual_backup(src, "nested")["path"])
+        assert (backup / "match" / "packages" / "pkg.yml").read_text(encoding="utf-8") == "pkg"
+
+        tgt = base / "restore"
+        assert bm.restore_backup("nested", tgt)["status"] == "success"
+        assert (tgt / "config" / "default.yml").read_text(encoding="utf-8") == "cfg"
+        assert (tgt / "match" / "base.yml").exists()
+
+
+def test_backup_skips_dangling_symlinks_and_keeps_dir_mtime():
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        src = base / "config"
+        (src / "match").mkdir(parents=True)
+        (src / "match" / "base.yml").write_text("matches: []\n", encoding="utf-8")
+        (src / "match" / "gone.yml").symlink_to(base / "missing.yml")
+        os.utime(src / "match", (1_000_000, 1_000_000))
+
+        bm = BackupManager(base / "backups")
+        res = bm.create_manual_backup(src, "links")
+        assert res["status"] == "success"
+        backup = Path(res["path"])
+        assert (backup / "match" / "base.yml").exists()
+        assert not os.path.lexists(backup / "match" / "gone.yml")
+        assert (backup / "match").stat().st_mtime == 1_000_000
@@ -33,3 +33,26 @@ def test_run_and_status():
     assert adapter.status()["stdout"] == "ok"
     adapter.set_config_dir("x")
     assert getattr(dummy, "_cfg") == "x"
+
+
+class FailingCLI(DummyCLI):
+    def run(self, args):
+        raise RuntimeError("wrapper unavailable")
+
+
+def test_run_timeout_kills_grandchildren():
+    import sys
+    import time
+
+    # The child spawns a grandchild that inherits stdout/stderr and outlives it
+    script = (
+        "import subprocess, sys, time; "
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+        "time.sleep(30)"
+    )
+    adapter = CLIAdapter(cli=FailingCLI())
+    started = time.monotonic()
+    res = adapter.run([sys.executable, "-c", script], timeout=1)
+    assert res.returncode == 124
+    assert "timed out" in res.stderr
+    assert time.monotonic() - started < 10
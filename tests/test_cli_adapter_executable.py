@@ -1,7 +1,7 @@
 import os
-import shutil
 
 from core.cli_adapter import CLIAdapter
+from core.path_resolver import PathResolver
 
 
 class DummyCLI:
@@ -32,7 +32,6 @@ def test_resolve_executable_prefers_env():
 
 
 def test_resolve_executable_checks_path():
-    adapter = CLIAdapter(cli=DummyCLI())
     os.environ.pop("ESPANSO_CLI", None)
 
     def fake_which(name):
@@ -40,12 +39,8 @@ def test_resolve_executable_checks_path():
             return "/path/to/espanso.exe"
         return None
 
-    original_which = shutil.which
-    shutil.which = fake_which
-    try:
-        assert adapter._resolve_executable().endswith("espanso.exe")
-    finally:
-        shutil.which = original_which
+    adapter = CLIAdapter(cli=DummyCLI(), resolver=PathResolver(which=fake_which))
+    assert adapter._resolve_executable().endswith("espanso.exe")
 
 
 def test_normalize_command_uses_resolved():
@@ -67,13 +62,91 @@ def test_normalize_command_uses_resolved():
 
 
 def test_resolve_falls_back_to_default():
-    adapter = CLIAdapter(cli=DummyCLI())
+    adapter = CLIAdapter(cli=DummyCLI(), resolver=PathResolver(which=lambda name: None))
     original_env = os.environ.pop("ESPANSO_CLI", None)
-    original_which = shutil.which
-    shutil.which = lambda name: None
     try:
         assert adapter._resolve_executable() == "espanso"
     finally:
-        shutil.which = original_which
         if original_env is not None:
             os.environ["ESPANSO_CLI"] = original_env
+
+
+def test_resolve_executable_caches_path_lookup():
+    original_env = os.environ.pop("ESPANSO_CLI", None)
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return "/path/to/espanso" if name == "espanso" else None
+
+    adapter = CLIAdapter(cli=DummyCLI(), resolver=PathResolver(which=fake_which))
+    try:
+        assert adapter._resolve_executable() == "/path/to/espanso"
+        count = len(lookups)
+        assert adapter._resolve_executable() == "/path/to/espanso"
+        assert len(lookups) == count
+        adapter.invalidate_executable_cache()
+        adapter._resolve_executable()
+        assert len(lookups) == 2 * count
+    finally:
+        if original_env is not None:
+            os.environ["ESPANSO_CLI"] = original_env
+
+
+def test_path_resolver_caches_misses_per_path():
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return None
+
+    resolver = PathResolver(which=fake_which)
+    original_path = os.environ.get("PATH", "")
+    try:
+        assert resolver.resolve("espanso") is None
+        assert resolver.resolve("espanso") is None
+        assert lookups == ["espanso"]
+        os.environ["PATH"] = original_path + os.pathsep + "/opt/espanso/bin"
+        resolver.resolve("espanso")
+        assert lookups == ["espanso", "espanso"]
+    finally:
+        os.environ["PATH"] = original_path
+
+
+def test_resolve_executable_follows_path_changes():
+    original_env = os.environ.pop("ESPANSO_CLI", None)
+    original_path = os.environ.get("PATH", "")
+
+    def fake_which(name):
+        if name == "espanso" and "/opt/espanso/bin" in os.environ.get("PATH", ""):
+            return "/opt/espanso/bin/espanso"
+        return "/usr/bin/espanso" if name == "espanso" else None
+
+    adapter = CLIAdapter(cli=DummyCLI(), resolver=PathResolver(which=fake_which))
+    try:
+        assert adapter._resolve_executable() == "/usr/bin/espanso"
+        os.environ["PATH"] = "/opt/espanso/bin" + os.pathsep + original_path
+        assert adapter._resolve_executable() == "/opt/espanso/bin/espanso"
+    finally:
+        os.environ["PATH"] = original_path
+        if original_env is not None:
+            os.environ["ESPANSO_CLI"] = original_env
+
+
+def test_path_resolver_revalidates_cached_hits():
+    lookups = []
+    installed = {"/usr/bin/espanso"}
+
+    def fake_which(name):
+        lookups.append(name)
+        return next(iter(installed), None)
+
+    resolver = PathResolver(which=fake_which, validate=lambda path: path in installed)
+    assert resolver.resolve("espanso") == "/usr/bin/espanso"
+    assert resolver.resolve("espanso") == "/usr/bin/espanso"
+    assert len(lookups) == 1
+    # Moved to another directory on the same PATH: the stale hit is dropped
+    installed.clear()
+    installed.add("/opt/espanso/bin/espanso")
+    assert resolver.resolve("espanso") == "/opt/espanso/bin/espanso"
+    assert len(lookups) == 2
@@ -1,3 +1,5 @@
+import subprocess
+
 from core.cli_adapter import CLIAdapter
 
 
@@ -20,25 +22,24 @@ def test_cli_adapter_subprocess_fallback():
 
     records = []
 
-    def fake_subprocess_run(cmd, *args, **kwargs):
-        records.append((cmd, kwargs.get("cwd")))
-
-        class _Result:
-            returncode = 0
-            stdout = "fallback"
-            stderr = ""
+    class FakePopen:
+        def __init__(self, cmd, *args, **kwargs):
+            records.append((cmd, kwargs.get("cwd")))
+            self.pid = 4321
+            self.returncode = 0
 
-        return _Result()
+        def communicate(self, timeout=None):
+            return "fallback", ""
 
-    # Patch subprocess.run directly on the module to avoid pytest fixtures
+    # Patch subprocess.Popen directly on the module to avoid pytest fixtures
     import core.cli_adapter as module  # noqa: E402
 
-    saved = module.subprocess.run
-    module.subprocess.run = fake_subprocess_run
+    saved = module.subprocess.Popen
+    module.subprocess.Popen = FakePopen
     try:
         result = adapter.run(["package", "list"])
     finally:
-        module.subprocess.run = saved
+        module.subprocess.Popen = saved
 
     assert result.stdout == "fallback"
     assert records
@@ -47,3 +48,30 @@ def test_cli_adapter_subprocess_fallback():
         assert "package" in first_cmd and "list" in first_cmd
     else:
         assert first_cmd[-2:] == ["package", "list"]
+
+
+def test_cli_adapter_stops_calling_failing_wrapper():
+    class CountingCLI(BrokenCLI):
+        calls = 0
+
+        def run(self, args, **kwargs):
+            CountingCLI.calls += 1
+            raise RuntimeError("simulated failure")
+
+    import core.cli_adapter as module  # noqa: E402
+
+    adapter = CLIAdapter(cli=CountingCLI())
+    saved = module.CLIAdapter._run_with_timeout
+    module.CLIAdapter._run_with_timeout = staticmethod(
+        lambda cmd, *args: subprocess.CompletedProcess(cmd, 0, stdout="fallback", stderr="")
+    )
+    try:
+        for _ in range(module.CLI_FAILURE_THRESHOLD + 2):
+            assert adapter.run(["status"]).stdout == "fallback"
+        assert CountingCLI.calls == module.CLI_FAILURE_THRESHOLD
+
+        adapter.reset()
+        adapter.run(["status"])
+        assert CountingCLI.calls == module.CLI_FAILURE_THRESHOLD + 1
+    finally:
+        module.CLIAdapter._run_with_timeout = saved
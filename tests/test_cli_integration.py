@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from espanso_companion.cli_integration import EspansoCLI
+
+
+def test_spawn_collects_output_and_returncode():
+    if not hasattr(os, "posix_spawn"):
+        return
+    cli = EspansoCLI(timeout=10)
+    script = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+    result = cli._spawn([sys.executable, "-c", script], dict(os.environ))
+    assert result.returncode == 3
+    assert result.stdout == "out\n"
+    assert result.stderr == "err\n"
+
+
+def test_spawn_timeout_kills_process_group():
+    if not hasattr(os, "posix_spawn"):
+        return
+    cli = EspansoCLI(timeout=1)
+    with tempfile.TemporaryDirectory() as td:
+        pid_file = os.path.join(td, "grandchild.pid")
+        # The grandchild inherits the pipes; killing only the direct child would hang the read
+        script = (
+            "import subprocess, sys, time; "
+            "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+            f"open({pid_file!r}, 'w').write(str(p.pid)); time.sleep(30)"
+        )
+        started = time.monotonic()
+        try:
+            cli._spawn([sys.executable, "-c", script], dict(os.environ))
+        except subprocess.TimeoutExpired:
+            pass
+        else:
+            raise AssertionError("expected TimeoutExpired")
+        assert time.monotonic() - started < 10
+        grandchild = int(open(pid_file).read())
+    for _ in range(50):
+        try:
+            with open(f"/proc/{grandchild}/stat") as handle:
+                if handle.read().split()[2] == "Z":
+                    break
+        except FileNotFoundError:
+            break
+        time.sleep(0.1)
+    else:
+        raise AssertionError("grandchild survived the timeout")
+
+
+def test_custom_runner_bypasses_spawn():
+    calls = []
+
+    def fake_runner(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="ok", stderr="")
+
+    cli = EspansoCLI(runner=fake_runner)
+    cli._espanso_exe = "/usr/bin/espanso"
+    result = cli.run(["status"])
+    assert result.stdout == "ok"
+    assert calls == [["/usr/bin/espanso", "status"]]
@@ -15,3 +15,7 @@ def test_import_espansoapi_alias():
 
     snippets = api.list_snippets()
     assert isinstance(snippets, list)
+
+    # Search helpers must not leak onto the dicts handed to the UI
+    api.search_snippets("a")
+    assert not any(key.startswith("_") for snippet in api.list_snippets() for key in snippet)
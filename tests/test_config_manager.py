@@ -24,3 +24,31 @@ def test_preferences_read_write():
         match_dir = Path(td) / "match"
         cm.ensure_base_yaml(match_dir)
         assert (match_dir / "base.yml").exists()
+        # Write the pending change before the temp dir goes away
+        cm.flush()
+
+
+def test_preference_writes_are_coalesced():
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td) / "profile"
+        cm = ConfigManager(base_dir=base, flush_delay=60)
+        cm.set_preference("a", 1)
+        cm.set_preference("b", 2)
+        assert not (base / "preferences.json").exists()
+
+        cm.flush()
+        assert ConfigManager(base_dir=base).get_preferences() == {"a": 1, "b": 2}
+
+
+def test_failed_flush_stays_dirty_until_a_write_succeeds():
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td) / "profile"
+        cm = ConfigManager(base_dir=base, flush_delay=60)
+        cm.set_preference("a", 1)
+        # A directory where the file should be makes os.replace fail
+        (base / "preferences.json").mkdir()
+        cm.flush()
+
+        (base / "preferences.json").rmdir()
+        cm.flush()
+        assert ConfigManager(base_dir=base).get_preferences() == {"a": 1}
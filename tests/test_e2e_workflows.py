@@ -238,6 +238,7 @@ def test_e2e_config_validation_and_preferences_workflow():
         mgr.set_preference("theme", "dark")
         mgr.set_preference("snippetsense_enabled", True)
         mgr.set_preference("custom_setting", "test_value")
+        mgr.flush()  # writes are debounced; persist before checking the file
 
         # Step 3: Verify file exists
         assert config_file.exists(), "Preferences file not created"
@@ -291,10 +292,11 @@ def test_e2e_high_volume_snippet_performance():
         # Step 3: Search snippets
         start_time = time.time()
         # Search for snippets with "50" in them
-        search_results = [s for s in snippets if "50" in s.get("trigger", "") or "50" in s.get("replace", "")]
+        search_results = store.search_snippets("50")["results"]
         search_time = time.time() - start_time
 
         assert len(search_results) >= 1, "Search failed to find matching snippets"
+        assert any(s["trigger"] == ":test050" for s in search_results), "Search missed :test050"
 
         # Step 4: Performance assertions
         # These are reasonable thresholds for 100 snippets
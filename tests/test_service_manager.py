@@ -42,9 +42,12 @@ def test_service_manager_start_once_when_requested():
     assert first_status[0] == "success"
     assert fake_cli.start_requests == 1
 
+    checks_after_start = fake_cli.status_checks
     second_status = manager.report_service_status(start_if_missing=True)
     assert second_status[0] == "success"
     assert fake_cli.start_requests == 1
+    # The running status seen while waiting for the start is reused
+    assert fake_cli.status_checks == checks_after_start
 
 
 def test_service_manager_returns_warning_without_start():
@@ -56,6 +59,19 @@ def test_service_manager_returns_warning_without_start():
     assert fake_cli.start_requests == 0
 
 
+def test_service_manager_reuses_recent_status():
+    fake_cli = FakeEspansoCli()
+    manager = ServiceManager(fake_cli, status_delay=0.0)
+
+    manager.report_service_status()
+    manager.report_service_status()
+    assert fake_cli.status_checks == 1
+
+    manager.refresh()
+    manager.report_service_status()
+    assert fake_cli.status_checks == 2
+
+
 """
 CHANGELOG
 2025-11-21 Codex
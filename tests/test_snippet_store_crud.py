@@ -30,3 +30,103 @@ def test_create_update_delete_snippet():
         dl = store.delete_snippet(":greet")
         assert dl["status"] == "success"
         assert store.get_snippet(":greet") is None
+
+
+def test_create_snippets_bulk_writes_once():
+    with tempfile.TemporaryDirectory() as td:
+        match_dir = Path(td) / "match"
+        match_dir.mkdir(parents=True, exist_ok=True)
+        (match_dir / "base.yml").write_text("matches: []\n", encoding="utf-8")
+
+        store = SnippetStore(match_dir=match_dir)
+        results = store.create_snippets_bulk(
+            [{"trigger": f":bulk{i}", "replace": f"Bulk {i}"} for i in range(3)]
+        )
+        assert [r["status"] for r in results] == ["success"] * 3
+        assert [s["trigger"] for s in store.list_snippets()] == [":bulk0", ":bulk1", ":bulk2"]
+        assert not (match_dir / "base.yml.tmp").exists()
+
+
+def test_batch_defers_writes_until_exit():
+    with tempfile.TemporaryDirectory() as td:
+        match_dir = Path(td) / "match"
+        match_dir.mkdir(parents=True, exist_ok=True)
+        base_file = match_dir / "base.yml"
+
+        store = SnippetStore(match_dir=match_dir)
+        with store.batch():
+            assert store.create_snippet({"trigger": ":a", "replace": "A"})["status"] == "success"
+            assert store.create_snippet({"trigger": ":b", "replace": "B"})["status"] == "success"
+            assert store.delete_snippet(":a")["status"] == "success"
+            assert not base_file.exists()
+            assert [s["trigger"] for s in store.list_snippets()] == [":b"]
+        assert ":b" in base_file.read_text(encoding="utf-8")
+        assert ":a" not in base_file.read_text(encoding="utf-8")
+
+
+def test_external_edit_invalidates_parsed_cache():
+    with tempfile.TemporaryDirectory() as td:
+        match_dir = Path(td) / "match"
+        match_dir.mkdir(parents=True, exist_ok=True)
+        base_file = match_dir / "base.yml"
+
+        store = SnippetStore(match_dir=match_dir)
+        assert store.create_snippet({"trigger": ":a", "replace": "A"})["status"] == "success"
+        assert store.count() == 1
+
+        base_file.write_text("matches:\n  - trigger: ':edited'\n    replace: 'changed on disk'\n", encoding="utf-8")
+        store._match_cache = []
+        assert [s["trigger"] for s in store.list_snippets()] == [":edited"]
+
+
+def test_listing_after_write_reuses_untouched_files():
+    with tempfile.TemporaryDirectory() as td:
+        match_dir = Path(td) / "match"
+        match_dir.mkdir(parents=True, exist_ok=True)
+        (match_dir / "base.yml").write_text("matches: []\n", encoding="utf-8")
+        (match_dir / "extras.yml").write_text(
+            "matches:\n  - trigger: ':extra'\n    replace: 'Extra'\n", encoding="utf-8"
+        )
+
+        store = SnippetStore(match_dir=match_dir)
+        extra_before = store.get_snippet(":extra")
+        assert store.create_snippet({"trigger": ":new", "replace": "New"})["status"] == "success"
+
+        assert store.get_snippet(":new") is not None
+        # extras.yml was not touched, so its entry is the same object, not a reparse
+        assert store.get_snippet(":extra") is extra_before
+
+
+def test_flush_writes_batch_early():
+    with tempfile.TemporaryDirectory() as td:
+        match_dir = Path(td) / "match"
+        match_dir.mkdir(parents=True, exist_ok=True)
+        base_file = match_dir / "base.yml"
+
+        store = SnippetStore(match_dir=match_dir)
+        with store.batch():
+            store.create_snippet({"trigger": ":a", "replace": "A"})
+            store.flush()
+            assert ":a" in base_file.read_text(encoding="utf-8")
+            store.create_snippet({"trigger": ":b", "replace": "B"})
+            assert ":b" not in base_file.read_text(encoding="utf-8")
+        assert ":b" in base_file.read_text(encoding="utf-8")
+
+
+def test_update_and_delete_target_the_indexed_file():
+    with tempfile.TemporaryDirectory() as td:
+        match_dir = Path(td) / "match"
+        match_dir.mkdir(parents=True, exist_ok=True)
+        base_file = match_dir / "base.yml"
+        base_file.write_text("matches:\n  - trigger: ':base'\n    replace: 'Base'\n", encoding="utf-8")
+        (match_dir / "extras.yml").write_text(
+            "matches:\n  - trigger: ':extra'\n    replace: 'Extra'\n", encoding="utf-8"
+        )
+        base_before = base_file.read_text(encoding="utf-8")
+
+        store = SnippetStore(match_dir=match_dir)
+        assert store.update_snippet(":extra", {"replace": "Changed"})["status"] == "success"
+        assert store.get_snippet(":extra")["replace"] == "Changed"
+        assert store.delete_snippet(":extra")["status"] == "success"
+        assert store.get_snippet(":extra") is None
+        assert base_file.read_text(encoding="utf-8") == base_before
@@ -30,6 +30,7 @@ def test_snippet_listing_and_search():
         store = SnippetStore(match_dir=match_dir)
         snippets = store.list_snippets()
         assert len(snippets) == 3
+        assert store.count() == 3
 
         found = store.get_snippet(":hello")
         assert found is not None
@@ -38,3 +39,37 @@ def test_snippet_listing_and_search():
         search_result = store.search_snippets("hello")
         assert search_result["count"] == 1
         assert search_result["results"][0]["trigger"] == ":hello"
+
+        assert [s["trigger"] for s in store.search(":bye", mode="exact")] == [":bye"]
+        assert store.search(":b", mode="exact") == []
+        assert [s["trigger"] for s in store.search(":e", mode="prefix")] == [":email"]
+        assert [s["trigger"] for s in store.search("goodbye")] == [":bye"]
+
+
+def test_snippet_store_uses_libyaml_when_available():
+    import yaml
+
+    from core import snippet_store
+
+    if getattr(yaml, "__with_libyaml__", False):
+        assert snippet_store._SafeLoader is yaml.CSafeLoader
+        assert snippet_store._SafeDumper is yaml.CSafeDumper
+
+
+def test_large_match_file_parses_through_mmap():
+    from core import snippet_store
+
+    with tempfile.TemporaryDirectory() as td:
+        match_dir = Path(td)
+        lines = ["matches:"]
+        for i in range(600):
+            lines.append(f"  - trigger: ':big{i:04d}'")
+            lines.append(f"    replace: 'Expansion text for snippet number {i}'")
+        big = match_dir / "big.yml"
+        big.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        (match_dir / "empty.yml").write_text("", encoding="utf-8")
+        assert big.stat().st_size >= snippet_store._MMAP_MIN_SIZE
+
+        snippets = SnippetStore(match_dir).list_snippets()
+        assert len(snippets) == 600
+        assert snippets[-1]["trigger"] == ":big0599"
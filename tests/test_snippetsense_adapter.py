@@ -3,11 +3,11 @@ from core.snippetsense_adapter import SnippetSenseAdapter
 
 class FakeEngine:
     def __init__(self):
-        self._cb = None
+        self._cbs = ()
         self.started = False
 
     def start(self, callback, settings):
-        self._cb = callback
+        self._cbs = (callback,)
         self.started = True
 
     def stop(self):
@@ -18,8 +18,8 @@ class FakeEngine:
 
     # helper to simulate suggestion
     def simulate(self, payload):
-        if self._cb:
-            self._cb(payload)
+        for cb in self._cbs:
+            cb(payload)
 
 
 def test_pending_and_decision_flow():
@@ -68,3 +68,58 @@ def test_pending_and_decision_flow():
     sid3 = s3[0]["id"]
     res3 = adapter.handle_decision(sid3, "reject")
     assert res3["status"] == "success"
+
+
+def test_pending_ids_are_unique_and_decisions_target_one_entry():
+    engine = FakeEngine()
+    adapter = SnippetSenseAdapter(engine=engine)
+    adapter.start({})
+
+    for i in range(5):
+        engine.simulate({"hash": f"h{i}", "phrase": f"phrase {i}", "count": 1})
+    engine.simulate({"hash": "h0", "phrase": "phrase 0", "count": 2})
+
+    pending = adapter.list_pending()
+    assert [item["hash"] for item in pending] == ["h0", "h1", "h2", "h3", "h4"]
+    assert len({item["id"] for item in pending}) == 5
+
+    assert adapter.handle_decision(pending[2]["id"], "reject")["status"] == "success"
+    assert [item["hash"] for item in adapter.list_pending()] == ["h0", "h1", "h3", "h4"]
+    assert adapter.handle_decision(pending[2]["id"], "reject")["status"] == "error"
+
+
+def test_list_pending_reuses_snapshot_until_change():
+    engine = FakeEngine()
+    adapter = SnippetSenseAdapter(engine=engine)
+    adapter.start({})
+    engine.simulate({"hash": "h1", "phrase": "one", "count": 1})
+
+    first = adapter.list_pending()
+    assert adapter.list_pending() is first
+
+    engine.simulate({"hash": "h2", "phrase": "two", "count": 1})
+    second = adapter.list_pending()
+    assert second is not first and len(second) == 2
+
+    adapter.handle_decision("h1", "reject")
+    assert [item["hash"] for item in adapter.list_pending()] == ["h2"]
+
+
+def test_pending_overflow_is_archived_and_restorable():
+    engine = FakeEngine()
+    adapter = SnippetSenseAdapter(engine=engine, max_pending=2, max_archived=2)
+    adapter.start({})
+    for i in range(4):
+        engine.simulate({"hash": f"h{i}", "phrase": f"phrase {i}", "count": 1})
+
+    assert [item["hash"] for item in adapter.list_pending()] == ["h2", "h3"]
+    assert [item["hash"] for item in adapter.list_archived()] == ["h0", "h1"]
+
+    assert adapter.restore("h0")["status"] == "success"
+    assert [item["hash"] for item in adapter.list_pending()] == ["h3", "h0"]
+    assert [item["hash"] for item in adapter.list_archived()] == ["h1", "h2"]
+
+    assert adapter.archive("h3")["status"] == "success"
+    # Archive cap drops the oldest archived entry
+    assert [item["hash"] for item in adapter.list_archived()] == ["h2", "h3"]
+    assert adapter.restore("h1")["status"] == "error"
@@ -1,3 +1,5 @@
+from collections import deque
+
 from core.watcher_manager import WatcherManager
 from espanso_companion.file_watcher import WatchEvent
 from pathlib import Path
@@ -6,7 +8,7 @@ from pathlib import Path
 class FakeWatcher:
     def __init__(self):
         self._callbacks = []
-        self._events = []
+        self._events = deque()
 
     def start(self):
         pass
@@ -18,9 +20,8 @@ class FakeWatcher:
         self._callbacks.append(cb)
 
     def poll(self):
-        evs = list(self._events)
-        self._events = []
-        return evs
+        evs, self._events = self._events, deque()
+        return list(evs)
 
     # test seam
     def simulate_event(self, event: WatchEvent):
@@ -54,3 +55,113 @@ def test_watcher_manager_registration_and_poll():
         # callback was called
         assert len(called) == 1
         wm.stop()
+
+
+def test_watcher_manager_debounces_bursts_per_path():
+    now = [100.0]
+    fw = FakeWatcher()
+    wm = WatcherManager(paths=[], watcher=fw, debounce=0.05, clock=lambda: now[0], threaded=False)
+    called = []
+    wm.register_callback(called.append)
+
+    base = Path("/tmp/base.yml")
+    for kind in ("created", "modified", "modified"):
+        fw.simulate_event(WatchEvent(src_path=base, event_type=kind, is_directory=False))
+    fw.simulate_event(WatchEvent(src_path=Path("/tmp/other.yml"), event_type="modified", is_directory=False))
+    # Leading events fire at once, one per path
+    assert [(ev.src_path.name, ev.event_type) for ev in called] == [("base.yml", "created"), ("other.yml", "modified")]
+
+    # Windows stay open until the clock passes their deadline
+    now[0] += 0.04
+    wm._tick()
+    assert len(called) == 2
+
+    now[0] += 0.02
+    wm._tick()
+    # The rest of the base.yml burst collapses into one trailing call
+    assert [(ev.src_path.name, ev.event_type) for ev in called[2:]] == [("base.yml", "modified")]
+    assert len(wm.poll_events()) == 4
+
+
+class FailingWatcher(FakeWatcher):
+    def start(self):
+        raise OSError("inotify watch limit reached")
+
+
+def test_watcher_manager_falls_back_to_polling():
+    with tempfile.TemporaryDirectory() as td:
+        wm = WatcherManager(paths=[Path(td)], watcher=FailingWatcher(), debounce=0, threaded=False)
+        seen = []
+        wm.register_callback(seen.append)
+        wm.start()
+        try:
+            assert wm.is_running()
+            wm._tick()
+            assert seen == []
+            target = Path(td) / "base.yml"
+            target.write_text("matches: []\n", encoding="utf-8")
+            wm._tick()
+            assert [(ev.src_path, ev.event_type) for ev in seen] == [(target, "created")]
+        finally:
+            wm.stop()
+
+
+def test_watcher_manager_timer_closes_window_when_threaded():
+    import threading
+
+    fw = FakeWatcher()
+    wm = WatcherManager(paths=[], watcher=fw, debounce=0.01)
+    trailing = threading.Event()
+    called = []
+
+    def cb(ev):
+        called.append(ev)
+        if len(called) == 2:
+            trailing.set()
+
+    wm.register_callback(cb)
+    base = Path("/tmp/base.yml")
+    fw.simulate_event(WatchEvent(src_path=base, event_type="created", is_directory=False))
+    fw.simulate_event(WatchEvent(src_path=base, event_type="modified", is_directory=False))
+    assert trailing.wait(2)
+    assert [ev.event_type for ev in called] == ["created", "modified"]
+
+
+def test_file_watcher_drops_open_and_close_events():
+    from watchdog.events import FileClosedNoWriteEvent, FileModifiedEvent, FileOpenedEvent
+
+    from espanso_companion.file_watcher import _EventHandler
+
+    queue, seen = deque(), []
+    handler = _EventHandler(queue, [seen.append])
+    handler.on_any_event(FileOpenedEvent("/tmp/base.yml"))
+    handler.on_any_event(FileClosedNoWriteEvent("/tmp/base.yml"))
+    handler.on_any_event(FileModifiedEvent("/tmp/base.yml"))
+    assert [ev.event_type for ev in queue] == ["modified"]
+    assert [ev.event_type for ev in seen] == ["modified"]
+
+
+def test_watch_event_type_is_interned():
+    import sys
+
+    kind = "".join(["modi", "fied"])
+    ev = WatchEvent(src_path=Path("/tmp/x"), event_type=kind, is_directory=False)
+    assert ev.event_type is sys.intern("modified")
+
+
+def test_watcher_manager_batches_events_per_flush():
+    fw = FakeWatcher()
+    wm = WatcherManager(paths=[], watcher=fw, debounce=0.05, threaded=False)
+    batches, single = [], []
+    wm.register_batch_callback(batches.append)
+    wm.register_callback(single.append)
+
+    for name in ("a.yml", "b.yml", "a.yml"):
+        fw.simulate_event(WatchEvent(src_path=Path("/tmp") / name, event_type="modified", is_directory=False))
+    assert batches == []
+    assert len(single) == 2  # leading event per path; per-event API unchanged
+
+    wm._tick()
+    assert [[ev.src_path.name for ev in batch] for batch in batches] == [["a.yml", "b.yml", "a.yml"]]
+    wm.flush()
+    assert len(batches) == 1
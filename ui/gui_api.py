@@ -1,20 +1,50 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import threading
+from typing import TYPE_CHECKING, Any
 
-from espansogui import EspansoAPI as LegacyEspansoAPI
+__all__ = ["GUIApi"]
 
+if TYPE_CHECKING:
+    # Static view of the lazily built class below, so checkers don't see `Any`
+    from espansogui import EspansoAPI
 
-class GUIApi(LegacyEspansoAPI):
-    """Facade that exposes `EspansoAPI` through a dedicated API module.
+    class GUIApi(EspansoAPI):
+        ...
 
-    This exists so GUI-facing code and tests can import a clean `GUIApi`
-    implementation while the monolithic `EspansoAPI` remains the source of truth.
-    """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+_BUILD_LOCK = threading.Lock()
 
-    # Additional GUI-only helpers or adapters can be added here when the refactor
-    # matures and the core modules are gradually adopted.
 
+def _build_gui_api() -> type:
+    # Importing espansogui pulls in the whole backend (watchers, CLI, YAML); defer it
+    # until GUIApi is actually requested
+    from espansogui import EspansoAPI as LegacyEspansoAPI
+
+    class GUIApi(LegacyEspansoAPI):
+        """Facade that exposes `EspansoAPI` through a dedicated API module.
+
+        This exists so GUI-facing code and tests can import a clean `GUIApi`
+        implementation while the monolithic `EspansoAPI` remains the source of truth.
+        """
+
+        # Additional GUI-only helpers or adapters can be added here when the refactor
+        # matures and the core modules are gradually adopted.
+
+    # Look like a plain module-level class in reprs and pickles
+    GUIApi.__module__ = __name__
+    GUIApi.__qualname__ = "GUIApi"
+    return GUIApi
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562 hook: build `GUIApi` on first access and cache it as a module global."""
+    if name == "GUIApi":
+        # Concurrent first accesses must all get the same class object
+        with _BUILD_LOCK:
+            cls = globals().get("GUIApi")
+            if cls is None:
+                cls = _build_gui_api()
+                globals()["GUIApi"] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")